@@ -3,10 +3,11 @@
 Hexagonal Architecture + Async + Dependency Injection
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, List
 import logging
 import os
@@ -21,6 +22,13 @@ from src.adapters.repositories.hdf_real_repository import RealHDFRepository
 from src.adapters.repositories.region_repository import InMemoryRegionRepository
 from src.adapters.repositories.hdf_geospatial import HDFGeospatialConverter
 from src.adapters.repositories.firms_api_repository import FirmsAPIRepository
+from src.adapters.repositories.fire_schema import day_to_date, date_to_day
+from src.adapters.repositories.fire_serializers import pack_points, iter_ndjson, BINARY_MEDIA_TYPE
+from src.adapters.repositories.fire_tiles import valid_tile
+from src.adapters.repositories.neighbour_index import KM_PER_DEGREE
+from src.adapters.cache.response_cache import ResponseCache, CachedResponse
+from src.adapters.jobs.refresh_scheduler import RefreshScheduler, RefreshJob
+from src.adapters.jobs.blocking_executor import BlockingExecutor
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -30,10 +38,10 @@ logger = logging.getLogger(__name__)
 class Container:
     """DI Container"""
     
-    def __init__(self, data_dir: str = "./data/raw"):
+    def __init__(self, data_dir: str = "./data/raw", array_cache_bytes: int = 256 * 1024 * 1024):
         # Repositories (Adapters)
         self.region_repo = InMemoryRegionRepository()
-        self.hdf_repo = RealHDFRepository(data_dir=data_dir)
+        self.hdf_repo = RealHDFRepository(data_dir=data_dir, array_cache_bytes=array_cache_bytes)
         
         # Services (Domain)
         self.analysis_service = EnvironmentalAnalysisService(self.hdf_repo)
@@ -41,7 +49,10 @@ class Container:
 
 # Initialize container with data directory
 DATA_DIR = os.getenv("HDF_DATA_DIR", "./data/raw")
-container = Container(data_dir=DATA_DIR)
+PROCESSED_DIR = os.getenv("PROCESSED_DATA_DIR", "./data/processed")
+CACHE_DIR = os.getenv("CACHE_DATA_DIR", "./data/cache")
+HDF_ARRAY_CACHE_MB = int(os.getenv("HDF_ARRAY_CACHE_MB", "256"))  # decoded HDF layers kept in memory
+container = Container(data_dir=DATA_DIR, array_cache_bytes=HDF_ARRAY_CACHE_MB * 1024 * 1024)
 
 # Initialize geospatial converter
 geo_converter = HDFGeospatialConverter()
@@ -49,37 +60,63 @@ geo_converter = HDFGeospatialConverter()
 # Initialize FIRMS API repository
 firms_api_repo = None  # Will be initialized in lifespan
 
-# Simple in-memory cache
-cache = {}
+# Background FIRMS refresh (periodic when FIRMS_REFRESH_INTERVAL > 0 seconds)
+REFRESH_INTERVAL = float(os.getenv("FIRMS_REFRESH_INTERVAL", "0"))
+refresh_scheduler = None  # Will be initialized in lifespan
+
+# In-memory cache of encoded responses (body bytes + gzip copy)
 CACHE_TTL = 300  # 5 minutes
+response_cache = ResponseCache(ttl_seconds=CACHE_TTL)
+tile_cache = ResponseCache(ttl_seconds=CACHE_TTL)
+
+# Blocking repository work runs on a thread pool; each lane admits a bounded
+# number of concurrent calls so heavy endpoints cannot starve the others
+EXECUTOR_WORKERS = int(os.getenv("EXECUTOR_WORKERS", "8"))
+executor = BlockingExecutor(
+    max_workers=EXECUTOR_WORKERS,
+    limits={
+        "hdf": 2,
+        "map": 2,
+        "insights": 1,
+        "csv-export": 2,
+        "csv-analytics": 2,
+        "tiles": 4,
+        "fire-details": 4
+    }
+)
 
 def get_cache_key(*args, **kwargs):
     """Generate cache key from arguments"""
     key_data = f"{args}{kwargs}"
     return hashlib.md5(key_data.encode()).hexdigest()
 
-def get_cached(key):
-    """Get cached value if not expired"""
-    if key in cache:
-        data, timestamp = cache[key]
-        if datetime.now() - timestamp < timedelta(seconds=CACHE_TTL):
-            logger.info(f"✅ Cache HIT: {key[:8]}...")
-            return data
-        else:
-            logger.info(f"⏰ Cache EXPIRED: {key[:8]}...")
-            del cache[key]
-    return None
+def cached_response(entry: CachedResponse, request: Request) -> Response:
+    """Send a cached body as-is (gzip copy if the client accepts it)"""
+    headers = {"Vary": "Accept-Encoding"}
+    if entry.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry.gzip_body, media_type=entry.media_type, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
 
-def set_cache(key, value):
-    """Set cache value with timestamp"""
-    cache[key] = (value, datetime.now())
-    logger.info(f"💾 Cache SET: {key[:8]}...")
+def parse_date_param(value: Optional[str], name: str) -> Optional[str]:
+    """Validate a YYYY-MM-DD query param, returning it zero-padded (400 if invalid)"""
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be a date in YYYY-MM-DD format")
+
+def clear_response_caches(job: Optional[RefreshJob] = None):
+    """Drop cached responses once a refreshed dataset is swapped in"""
+    response_cache.clear()
+    tile_cache.clear()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
-    global firms_api_repo
+    global firms_api_repo, refresh_scheduler
     
     logger.info("🚀 Starting NASA HDF API (Hexagonal Architecture)...")
     logger.info(f"   📂 Data directory: {DATA_DIR}")
@@ -88,10 +125,19 @@ async def lifespan(app: FastAPI):
     
     # Initialize FIRMS API repository (lazy loading - data loaded on first request)
     logger.info("🛰️ Initializing NASA FIRMS API repository...")
-    firms_api_repo = FirmsAPIRepository(cache_data=True, data_dir=DATA_DIR)
+    firms_api_repo = FirmsAPIRepository(cache_data=True, data_dir=DATA_DIR, processed_dir=PROCESSED_DIR, cache_dir=CACHE_DIR)
     logger.info("✅ FIRMS API repository ready (data will be loaded on first request)")
     
+    refresh_scheduler = RefreshScheduler(
+        refresh=firms_api_repo.refresh_data,
+        on_complete=clear_response_caches,
+        interval_seconds=REFRESH_INTERVAL or None
+    )
+    refresh_scheduler.start()
+    
     yield
+    refresh_scheduler.stop()
+    executor.shutdown(wait=False)
     logger.info("🛑 Shutting down NASA HDF API...")
 
 
@@ -132,9 +178,7 @@ async def root():
 @app.get("/cache/clear", tags=["health"])
 async def clear_cache():
     """Clear all cache"""
-    global cache
-    old_size = len(cache)
-    cache = {}
+    old_size = response_cache.clear() + tile_cache.clear() + container.hdf_repo.arrays.clear()
     logger.info(f"🗑️ Cache cleared: {old_size} entries removed")
     return {
         "message": "Cache cleared",
@@ -144,23 +188,11 @@ async def clear_cache():
 @app.get("/cache/stats", tags=["health"])
 async def cache_stats():
     """Get cache statistics"""
-    total_entries = len(cache)
-    expired = 0
-    valid = 0
-    
-    now = datetime.now()
-    for key, (data, timestamp) in cache.items():
-        if now - timestamp >= timedelta(seconds=CACHE_TTL):
-            expired += 1
-        else:
-            valid += 1
-    
-    return {
-        "total_entries": total_entries,
-        "valid_entries": valid,
-        "expired_entries": expired,
-        "ttl_seconds": CACHE_TTL
-    }
+    stats = response_cache.stats()
+    stats["tiles"] = tile_cache.stats()
+    stats["hdf_handles"] = container.hdf_repo.handles.stats()
+    stats["hdf_arrays"] = container.hdf_repo.arrays.stats()
+    return stats
 
 @app.get("/health", tags=["health"])
 async def health_check():
@@ -168,7 +200,8 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "cache_size": len(cache)
+        "cache_size": len(response_cache),
+        "executor": executor.stats()
     }
 
 
@@ -192,6 +225,7 @@ async def list_regions():
 
 
 @app.get("/hdf/fire/{region_code}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def get_fire_data(region_code: str):
     """Read raw fire detection data from HDF file"""
     
@@ -210,6 +244,7 @@ async def get_fire_data(region_code: str):
 
 
 @app.get("/hdf/vegetation/{region_code}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def get_vegetation_data(region_code: str):
     """Read raw NDVI data from HDF file"""
     
@@ -230,6 +265,7 @@ async def get_vegetation_data(region_code: str):
 
 
 @app.get("/hdf/air-quality/{region_code}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def get_air_quality_data(region_code: str):
     """Read raw aerosol data from HDF file"""
     
@@ -248,6 +284,7 @@ async def get_air_quality_data(region_code: str):
 
 
 @app.get("/hdf/temperature/{region_code}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def get_temperature_data(region_code: str):
     """Read raw temperature data from HDF file"""
     
@@ -268,6 +305,7 @@ async def get_temperature_data(region_code: str):
 
 
 @app.get("/hdf/all/{region_code}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def get_all_hdf_data(region_code: str):
     """Read all HDF data for a region"""
     
@@ -310,6 +348,7 @@ async def get_all_hdf_data(region_code: str):
 
 
 @app.get("/hdf/datasets", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def list_datasets(filename: Optional[str] = None):
     """
     List all datasets/columns in HDF file
@@ -322,6 +361,7 @@ async def list_datasets(filename: Optional[str] = None):
 
 
 @app.get("/hdf/dataset/{dataset_name}", tags=["hdf-raw"])
+@executor.offload("hdf")
 async def read_dataset(dataset_name: str, filename: Optional[str] = None):
     """
     Read raw data from a specific dataset/column
@@ -337,6 +377,7 @@ async def read_dataset(dataset_name: str, filename: Optional[str] = None):
 
 
 @app.get("/map/fire-points", tags=["mapping"])
+@executor.offload("map")
 async def get_fire_points(
     filename: Optional[str] = None,
     format: str = "geojson",
@@ -349,21 +390,30 @@ async def get_fire_points(
     
     Query params:
         - filename: Specific HDF file (optional, uses first fire file)
-        - format: 'geojson' or 'points' (default: geojson)
-        - max_points: Maximum points to return (default: 5000)
-        - aggregate: Aggregate to grid cells for performance (default: false)
+        - format: 'geojson', 'ndjson', 'binary' or 'points' (default: geojson)
+        - max_points: Maximum points to return (default: 5000, 0 = no limit)
+        - aggregate: Aggregate to grid cells for performance (default: false,
+          not available with format=binary, whose records have no cell count)
         - grid_size: Grid cell size in degrees if aggregate=true (default: 0.1)
     
     Returns:
-        GeoJSON FeatureCollection or array of points with lat/lon
+        GeoJSON FeatureCollection (streamed), NDJSON features, packed binary
+        points (see README) or array of points with lat/lon
     """
+    if format not in ("geojson", "ndjson", "binary", "points"):
+        raise HTTPException(status_code=400, detail="format must be 'geojson', 'ndjson', 'binary' or 'points'")
+    if format == "binary" and aggregate:
+        raise HTTPException(status_code=400, detail="aggregate=true is not supported with format=binary")
     
     try:
         # Read fire mask array directly (bypass JSON conversion)
         fire_mask = await container.hdf_repo.read_raw_dataset("FireMask", filename, return_array=True)
         
-        # Get metadata
-        file_info = await container.hdf_repo.read_raw_dataset("FireMask", filename)
+        if isinstance(fire_mask, dict) and "error" in fire_mask:
+            raise HTTPException(status_code=404, detail=fire_mask["error"])
+        
+        # Get metadata (from the file catalog, no second read)
+        file_info = container.hdf_repo.get_file_info(filename)
         if "error" in file_info:
             raise HTTPException(status_code=404, detail=file_info["error"])
         
@@ -384,8 +434,8 @@ async def get_fire_points(
         confidence = confidence if isinstance(confidence, np.ndarray) else None
         frp = frp if isinstance(frp, np.ndarray) else None
         
-        # Extract fire points with coordinates
-        points = geo_converter.extract_fire_points(
+        # Extract fire point columns with coordinates
+        columns = geo_converter.extract_fire_point_arrays(
             fire_mask=fire_mask,
             h=h,
             v=v,
@@ -394,19 +444,50 @@ async def get_fire_points(
             max_points=max_points
         )
         
-        if not points:
+        # Packed binary points (day offsets relative to the file date)
+        if format == "binary":
+            file_date = geo_converter.extract_date_from_filename(file_info["filename"])
+            body = pack_points(
+                columns["lon"], columns["lat"],
+                frp=columns.get("frp"),
+                confidence=columns.get("confidence"),
+                base_day=date_to_day(file_date) if file_date else 0
+            )
+            return Response(content=body, media_type=BINARY_MEDIA_TYPE)
+        
+        if len(columns["lat"]) == 0 and format == "points":
             return {
                 "message": "No fire points found",
                 "count": 0,
                 "points": []
             }
         
+        # Stream features straight from the columns
+        if not aggregate and format in ("geojson", "ndjson"):
+            properties = {
+                "source": file_info["filename"],
+                "tile": f"h{h:02d}v{v:02d}",
+                "count": len(columns["lat"])
+            }
+            return StreamingResponse(
+                geo_converter.iter_point_geojson(columns, "fire", properties, ndjson=(format == "ndjson")),
+                media_type="application/x-ndjson" if format == "ndjson" else "application/json"
+            )
+        
         # Aggregate if requested
         if aggregate:
-            points = geo_converter.aggregate_to_grid(points, grid_size)
+            points = geo_converter.aggregate_columns_to_grid(columns, grid_size)
+        else:
+            points = geo_converter.point_records(columns, "fire")
         
         # Return in requested format
-        if format == "geojson":
+        if format == "ndjson":
+            features = geo_converter.create_geojson(points)["features"]
+            return StreamingResponse(
+                iter_ndjson([[json.dumps(feature, separators=(",", ":")) for feature in features]]),
+                media_type="application/x-ndjson"
+            )
+        elif format == "geojson":
             return geo_converter.create_geojson(
                 points,
                 properties={
@@ -429,6 +510,7 @@ async def get_fire_points(
 
 
 @app.get("/map/burned-area", tags=["mapping"])
+@executor.offload("map")
 async def get_burned_area(
     filename: Optional[str] = None,
     format: str = "geojson",
@@ -447,8 +529,11 @@ async def get_burned_area(
         # Read burn date array directly (bypass JSON conversion)
         burn_date = await container.hdf_repo.read_raw_dataset("Burn Date", filename, return_array=True)
         
-        # Get metadata
-        file_info = await container.hdf_repo.read_raw_dataset("Burn Date", filename)
+        if isinstance(burn_date, dict) and "error" in burn_date:
+            raise HTTPException(status_code=404, detail=burn_date["error"])
+        
+        # Get metadata (from the file catalog, no second read)
+        file_info = container.hdf_repo.get_file_info(filename)
         if "error" in file_info:
             raise HTTPException(status_code=404, detail=file_info["error"])
         
@@ -501,47 +586,83 @@ async def get_burned_area(
 
 @app.get("/csv/fire-points", tags=["csv-fire"])
 async def get_csv_fire_points(
+    request: Request,
     max_points: int = 5000,
     min_confidence: int = 50,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    format: str = "geojson"
 ):
     """
     Get fire points from CSV for React Globe mapping (CACHED)
     
     Query params:
-        - max_points: Maximum points to return (default: 5000)
+        - max_points: Maximum points to return (default: 5000, 0 = no limit)
         - min_confidence: Minimum confidence 0-100 (default: 50)
         - start_date: Filter by start date YYYY-MM-DD (optional)
         - end_date: Filter by end date YYYY-MM-DD (optional)
+        - format: 'geojson', 'ndjson' or 'binary' (default: geojson)
     
     Returns:
-        GeoJSON FeatureCollection with fire detections
+        GeoJSON FeatureCollection with fire detections, one GeoJSON Feature
+        per line for ndjson, or packed lon/lat/frp/confidence/day records for
+        binary (see README). Unbounded (max_points=0) GeoJSON and ndjson
+        exports are streamed in chunks and not cached.
     """
+    if format not in ("geojson", "ndjson", "binary"):
+        raise HTTPException(status_code=400, detail="format must be 'geojson', 'ndjson' or 'binary'")
+    start_date = parse_date_param(start_date, "start_date")
+    end_date = parse_date_param(end_date, "end_date")
+    
+    if format == "ndjson" or (format == "geojson" and not max_points):
+        # Selection runs up front on the pool; chunks are encoded as Starlette
+        # iterates the generator on its own thread pool
+        chunks = await executor.run(
+            "csv-export",
+            firms_api_repo.stream_fire_points,
+            format=format,
+            max_points=max_points,
+            min_confidence=min_confidence,
+            start_date=start_date,
+            end_date=end_date
+        )
+        return StreamingResponse(
+            chunks,
+            media_type="application/x-ndjson" if format == "ndjson" else "application/json"
+        )
+    
     # Generate cache key
-    cache_key = get_cache_key('fire_points', max_points, min_confidence, start_date, end_date)
-    
-    # Check cache
-    cached_data = get_cached(cache_key)
-    if cached_data:
-        return cached_data
-    
-    # Fetch data
-    geojson = firms_api_repo.get_fire_points_geojson(
-        max_points=max_points,
-        min_confidence=min_confidence,
-        start_date=start_date,
-        end_date=end_date
-    )
+    cache_key = get_cache_key('fire_points', max_points, min_confidence, start_date, end_date, format)
     
-    # Store in cache
-    set_cache(cache_key, geojson)
+    # Check cache (hits are served as stored bytes)
+    entry = response_cache.get(cache_key)
+    if entry is None and format == "binary":
+        body = await executor.run(
+            "csv-export",
+            firms_api_repo.get_fire_points_binary,
+            max_points=max_points,
+            min_confidence=min_confidence,
+            start_date=start_date,
+            end_date=end_date
+        )
+        entry = await executor.run("csv-export", response_cache.set, cache_key, body, BINARY_MEDIA_TYPE)
+    elif entry is None:
+        body = await executor.run(
+            "csv-export",
+            firms_api_repo.get_fire_points_geojson_bytes,
+            max_points=max_points,
+            min_confidence=min_confidence,
+            start_date=start_date,
+            end_date=end_date
+        )
+        # Encoding the gzip copy of a large body is blocking work too
+        entry = await executor.run("csv-export", response_cache.set, cache_key, body)
     
-    return geojson
+    return cached_response(entry, request)
 
 
 @app.get("/csv/statistics", tags=["csv-fire"])
-async def get_csv_statistics():
+async def get_csv_statistics(request: Request):
     """
     Get overall statistics from CSV fire data (CACHED)
     
@@ -549,18 +670,15 @@ async def get_csv_statistics():
     """
     cache_key = get_cache_key('statistics')
     
-    cached_data = get_cached(cache_key)
-    if cached_data:
-        return cached_data
-    
-    stats = firms_api_repo.get_statistics()
-    set_cache(cache_key, stats)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        entry = response_cache.set_json(cache_key, await executor.run("csv-analytics", firms_api_repo.get_statistics))
     
-    return stats
+    return cached_response(entry, request)
 
 
 @app.get("/csv/temporal-analysis", tags=["csv-fire"])
-async def get_temporal_analysis():
+async def get_temporal_analysis(request: Request):
     """
     Get temporal analysis of fire detections (CACHED)
     
@@ -568,18 +686,15 @@ async def get_temporal_analysis():
     """
     cache_key = get_cache_key('temporal')
     
-    cached_data = get_cached(cache_key)
-    if cached_data:
-        return cached_data
-    
-    analysis = firms_api_repo.get_temporal_analysis()
-    set_cache(cache_key, analysis)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        entry = response_cache.set_json(cache_key, await executor.run("csv-analytics", firms_api_repo.get_temporal_analysis))
     
-    return analysis
+    return cached_response(entry, request)
 
 
 @app.get("/csv/hotspots", tags=["csv-fire"])
-async def get_hotspots(grid_size: float = 0.5):
+async def get_hotspots(request: Request, grid_size: float = 0.5):
     """
     Get fire hotspot clusters (CACHED)
     
@@ -591,39 +706,109 @@ async def get_hotspots(grid_size: float = 0.5):
     """
     cache_key = get_cache_key('hotspots', grid_size)
     
-    cached_data = get_cached(cache_key)
-    if cached_data:
-        return cached_data
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        hotspots = await executor.run("csv-analytics", firms_api_repo.get_hotspot_clusters, grid_size=grid_size)
+        entry = response_cache.set_json(cache_key, {
+            "hotspots": hotspots,
+            "count": len(hotspots)
+        })
     
-    hotspots = firms_api_repo.get_hotspot_clusters(grid_size=grid_size)
-    result = {
-        "hotspots": hotspots,
-        "count": len(hotspots)
-    }
+    return cached_response(entry, request)
+
+
+@app.get("/tiles/fires/{z}/{x}/{y}", tags=["csv-fire"])
+async def get_fire_tile(
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    min_confidence: int = 50,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+):
+    """
+    Get fire detections of one Web-Mercator map tile (CACHED)
     
-    set_cache(cache_key, result)
-    return result
+    Path params:
+        - z/x/y: Slippy-map tile coordinates (z 0-22)
+    
+    Query params:
+        - min_confidence: Minimum confidence 0-100 (default: 50)
+        - start_date: Filter by start date YYYY-MM-DD (optional)
+        - end_date: Filter by end date YYYY-MM-DD (optional)
+    
+    Returns:
+        GeoJSON FeatureCollection of the tile's detections; below zoom 6 or
+        over 5000 detections, features are per-cell aggregates (count, FRP,
+        confidence) on a 64x64 grid over the tile
+    """
+    if not valid_tile(z, x, y):
+        raise HTTPException(status_code=400, detail=f"Invalid tile {z}/{x}/{y}")
+    start_date = parse_date_param(start_date, "start_date")
+    end_date = parse_date_param(end_date, "end_date")
+    
+    cache_key = get_cache_key('tile', z, x, y, min_confidence, start_date, end_date)
+    
+    entry = tile_cache.get(cache_key)
+    if entry is None:
+        body = await executor.run(
+            "tiles",
+            firms_api_repo.get_fire_tile,
+            z, x, y,
+            min_confidence=min_confidence,
+            start_date=start_date,
+            end_date=end_date
+        )
+        entry = await executor.run("tiles", tile_cache.set, cache_key, body)
+    
+    response = cached_response(entry, request)
+    response.headers["Cache-Control"] = f"public, max-age={CACHE_TTL}"
+    return response
 
 
 @app.get("/csv/fire-details", tags=["csv-fire"])
-async def get_fire_details(lat: float, lon: float, radius: float = 0.1):
+async def get_fire_details(
+    lat: float,
+    lon: float,
+    radius: Optional[float] = None,
+    radius_km: Optional[float] = None,
+    k: Optional[int] = None
+):
     """
     Get detailed fire information near a point (for click events)
     
     Query params:
         - lat: Latitude of click
         - lon: Longitude of click  
-        - radius: Search radius in degrees (default: 0.1)
+        - radius: Search radius in degrees of great circle (default: 0.1 if no k/radius_km)
+        - radius_km: Search radius in km (overrides radius)
+        - k: Maximum number of fires, closest first (default: 100)
     
     Returns:
-        List of nearby fire detections with full details
+        List of nearby fire detections with full details, ordered by distance
     """
-    fires = firms_api_repo.get_fire_details(lat, lon, radius)
+    if k is not None and k < 1:
+        raise HTTPException(status_code=400, detail="k must be at least 1")
+    
+    # Only k given -> unbounded k-nearest-neighbour search
+    if radius is None and radius_km is None and k is None:
+        radius = 0.1
+    if radius_km is None and radius is not None:
+        radius_km = radius * KM_PER_DEGREE
+    
+    fires = await executor.run(
+        "fire-details",
+        firms_api_repo.get_fire_details,
+        lat, lon, radius=None, k=k or 100, radius_km=radius_km
+    )
     return {
         "fires": fires,
         "count": len(fires),
         "center": {"lat": lat, "lon": lon},
-        "radius": radius
+        "radius": radius,
+        "radius_km": radius_km,
+        "k": k or 100
     }
 
 
@@ -634,7 +819,9 @@ async def get_data_status():
     
     Returns information about the current dataset
     """
-    if firms_api_repo is None or firms_api_repo.df is None or firms_api_repo.df.empty:
+    df = firms_api_repo.df if firms_api_repo is not None else None
+    
+    if df is None or df.empty:
         return {
             "status": "no_data",
             "message": "No fire data loaded"
@@ -642,53 +829,66 @@ async def get_data_status():
     
     return {
         "status": "ready",
-        "total_detections": len(firms_api_repo.df),
+        "total_detections": len(df),
         "date_range": {
-            "start": str(firms_api_repo.df['acq_date'].min()) if 'acq_date' in firms_api_repo.df.columns else None,
-            "end": str(firms_api_repo.df['acq_date'].max()) if 'acq_date' in firms_api_repo.df.columns else None
+            "start": day_to_date(df['acq_date'].min()) if 'acq_date' in df.columns else None,
+            "end": day_to_date(df['acq_date'].max()) if 'acq_date' in df.columns else None
         },
         "last_fetch": firms_api_repo._last_fetch.isoformat() if firms_api_repo._last_fetch else None,
         "data_source": "NASA FIRMS API",
-        "satellites": list(firms_api_repo.df['satellite'].unique()) if 'satellite' in firms_api_repo.df.columns else []
+        "satellites": [str(s) for s in df['satellite'].unique()] if 'satellite' in df.columns else []
     }
 
 
-@app.post("/csv/refresh", tags=["csv-fire"])
+@app.post("/csv/refresh", tags=["csv-fire"], status_code=202)
 async def refresh_fire_data(days: int = 1):
     """
-    Refresh fire data with recent detections from NASA FIRMS
+    Queue a refresh of fire data with recent detections from NASA FIRMS
+    
+    The refresh runs in the background: the merged dataset and its indexes
+    are built off the request path and swapped in atomically, then the
+    response caches are cleared. Requests keep using the current dataset
+    until then.
     
     Query params:
         - days: Number of recent days to fetch (1-10, default: 1)
     
     Returns:
-        Status of the refresh operation
+        The queued refresh job (poll /csv/refresh/{job_id} for its status)
     """
-    if firms_api_repo is None:
+    if firms_api_repo is None or refresh_scheduler is None:
         raise HTTPException(status_code=500, detail="FIRMS API repository not initialized")
     
     if days < 1 or days > 10:
         raise HTTPException(status_code=400, detail="Days must be between 1 and 10")
     
-    try:
-        firms_api_repo.refresh_data(days=days)
-        
-        # Clear cache after refresh
-        global cache
-        cache = {}
-        
-        return {
-            "status": "success",
-            "message": f"Data refreshed with last {days} days",
-            "total_detections": len(firms_api_repo.df) if firms_api_repo.df is not None else 0,
-            "cache_cleared": True
-        }
-    except Exception as e:
-        logger.error(f"Error refreshing data: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to refresh data: {str(e)}")
+    job = refresh_scheduler.enqueue(days)
+    
+    return {
+        "status": job.status,
+        "message": f"Refresh with last {job.days} days queued",
+        "job": job.to_dict()
+    }
+
+
+@app.get("/csv/refresh/{job_id}", tags=["csv-fire"])
+async def get_refresh_job(job_id: str):
+    """
+    Get the status of a refresh job
+    
+    Returns:
+        Job with status queued, running, succeeded or failed
+    """
+    job = refresh_scheduler.get(job_id) if refresh_scheduler is not None else None
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Refresh job {job_id} not found")
+    
+    return job.to_dict()
 
 
 @app.get("/insights/burned-area", tags=["insights"])
+@executor.offload("insights")
 async def get_burned_area_insights(filename: Optional[str] = None):
     """
     Get detailed insights from MCD64A1 Burned Area dataset
@@ -704,8 +904,11 @@ async def get_burned_area_insights(filename: Optional[str] = None):
         last_day_arr = await container.hdf_repo.read_raw_dataset("Last Day", filename, return_array=True)
         qa_arr = await container.hdf_repo.read_raw_dataset("QA", filename, return_array=True)
         
-        # Get filename for metadata
-        file_info = await container.hdf_repo.read_raw_dataset("Burn Date", filename)
+        if isinstance(burn_date_arr, dict) and "error" in burn_date_arr:
+            raise HTTPException(status_code=404, detail=burn_date_arr["error"])
+        
+        # Get filename for metadata (from the file catalog, no second read)
+        file_info = container.hdf_repo.get_file_info(filename)
         if "error" in file_info:
             raise HTTPException(status_code=404, detail=file_info["error"])
         
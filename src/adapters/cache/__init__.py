@@ -0,0 +1 @@
+"""Cache Adapters - Response Caching"""
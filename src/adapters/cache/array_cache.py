@@ -0,0 +1,109 @@
+"""
+🧠 Array Cache Adapter
+Byte-budgeted LRU cache of decoded NumPy arrays (e.g. HDF dataset layers)
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+import logging
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ArrayCache:
+    """
+    LRU cache of arrays bounded by total `nbytes`
+
+    Cached arrays are marked read-only, since every caller shares the
+    same buffer. Arrays larger than the whole budget are returned without
+    being cached. Keys should include whatever invalidates the data (e.g.
+    file path, dataset name and mtime).
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            max_bytes: Byte budget for cached arrays (default: 256 MB, 0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by cached arrays"""
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Cached array, or None on a miss"""
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return array
+
+    def put(self, key: Hashable, array: np.ndarray) -> np.ndarray:
+        """
+        Store an array, evicting least recently used arrays over budget
+
+        Returns:
+            The (now read-only) array
+        """
+        if not isinstance(array, np.ndarray) or array.nbytes > self.max_bytes:
+            return array
+
+        array.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = array
+            self._bytes += array.nbytes
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+        return array
+
+    def get_or_load(self, key: Hashable, load: Callable[[], np.ndarray]) -> np.ndarray:
+        """Cached array, loading and storing it on a miss"""
+        array = self.get(key)
+        if array is None:
+            array = self.put(key, load())
+        return array
+
+    def clear(self) -> int:
+        """Remove all arrays, returning how many were removed"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries = OrderedDict()
+            self._bytes = 0
+        return removed
+
+    def stats(self) -> Dict:
+        """Entry count, bytes held and hit/miss counters"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,129 @@
+"""
+💾 Response Cache Adapter
+In-memory cache of encoded response bodies (JSON bytes + gzip)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+import gzip
+import json
+import logging
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any):
+    """Fallback encoder for NumPy scalars/arrays and dates"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a response payload as compact JSON bytes"""
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass
+class CachedResponse:
+    """Encoded response body ready to be sent"""
+    body: bytes
+    media_type: str
+    created_at: datetime
+    gzip_body: Optional[bytes] = None
+
+
+class ResponseCache:
+    """
+    TTL cache of encoded responses
+
+    Entries hold the final body bytes (and a gzip copy for larger bodies),
+    so a hit is served without re-encoding anything.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, compress_min_bytes: int = 1024):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds (default: 300)
+            compress_min_bytes: Bodies at least this large also get a gzip copy
+                (default: 1024, None to disable compression)
+        """
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.compress_min_bytes = compress_min_bytes
+        self._entries: Dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get cached response if not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if datetime.now() - entry.created_at < self.ttl:
+                logger.info(f"✅ Cache HIT: {key[:8]}...")
+                return entry
+            logger.info(f"⏰ Cache EXPIRED: {key[:8]}...")
+            del self._entries[key]
+        return None
+
+    def set(self, key: str, body: bytes, media_type: str = "application/json") -> CachedResponse:
+        """
+        Store an encoded response body
+
+        Args:
+            key: Cache key
+            body: Final response bytes
+            media_type: Content type of the body
+
+        Returns:
+            The cached entry
+        """
+        gzip_body = None
+        if self.compress_min_bytes is not None and len(body) >= self.compress_min_bytes:
+            gzip_body = gzip.compress(body, compresslevel=6)
+
+        entry = CachedResponse(body=body, media_type=media_type, created_at=datetime.now(), gzip_body=gzip_body)
+        with self._lock:
+            self._entries[key] = entry
+        logger.info(f"💾 Cache SET: {key[:8]}... ({len(body)} bytes)")
+        return entry
+
+    def set_json(self, key: str, value: Any) -> CachedResponse:
+        """Encode a payload as JSON and store it"""
+        return self.set(key, encode_json(value), "application/json")
+
+    def clear(self) -> int:
+        """Remove all entries, returning how many were removed"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries = {}
+        return removed
+
+    def stats(self) -> Dict:
+        """Entry counts and memory held by cached bodies"""
+        now = datetime.now()
+        with self._lock:
+            entries = list(self._entries.values())
+
+        valid = sum(1 for e in entries if now - e.created_at < self.ttl)
+        return {
+            "total_entries": len(entries),
+            "valid_entries": valid,
+            "expired_entries": len(entries) - valid,
+            "ttl_seconds": int(self.ttl.total_seconds()),
+            "body_bytes": sum(len(e.body) for e in entries),
+            "gzip_bytes": sum(len(e.gzip_body) for e in entries if e.gzip_body is not None)
+        }
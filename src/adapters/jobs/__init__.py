@@ -0,0 +1 @@
+"""Job Adapters - Background Work"""
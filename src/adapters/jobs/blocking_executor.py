@@ -0,0 +1,137 @@
+"""
+🧵 Blocking Executor
+Runs blocking repository work on a thread pool, with per-lane concurrency limits
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LaneStats:
+    """Counters of one lane"""
+    limit: Optional[int]
+    active: int = 0
+    waiting: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class BlockingExecutor:
+    """
+    Thread pool for blocking pandas / NumPy / HDF work called from async handlers
+
+    Calls are grouped in named lanes (one per endpoint or endpoint family).
+    A lane with a limit admits at most that many calls at once; the rest wait
+    on the event loop without holding a pool thread, so one slow endpoint
+    cannot occupy every worker and the loop stays free for cheap requests
+    (health checks, cache hits). Coroutine functions are run to completion
+    on a worker thread with their own event loop, so async repository
+    methods that block internally are offloaded the same way.
+    Threads rather than processes: the repositories keep their datasets in
+    memory, and NumPy / pandas / HDF reads release the GIL for the heavy
+    parts.
+    """
+
+    def __init__(self, max_workers: int = 8, limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize executor (the pool starts on first use)
+
+        Args:
+            max_workers: Pool threads
+            limits: Maximum concurrent calls per lane (lanes not listed are unlimited)
+        """
+        self.max_workers = max_workers
+        self.limits = dict(limits or {})
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, LaneStats] = {}
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="blocking")
+            return self._pool
+
+    def _lane(self, lane: str) -> LaneStats:
+        if lane not in self._stats:
+            limit = self.limits.get(lane)
+            self._stats[lane] = LaneStats(limit=limit)
+            if limit is not None:
+                self._semaphores[lane] = asyncio.Semaphore(limit)
+        return self._stats[lane]
+
+    async def run(self, lane: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking call on the pool
+
+        Args:
+            lane: Lane name (see limits)
+            fn: Function or coroutine function
+            *args, **kwargs: Call arguments
+
+        Returns:
+            The call's result (exceptions propagate to the caller)
+        """
+        stats = self._lane(lane)
+        semaphore = self._semaphores.get(lane)
+
+        if inspect.iscoroutinefunction(fn):
+            call = lambda: asyncio.run(fn(*args, **kwargs))
+        else:
+            call = functools.partial(fn, *args, **kwargs)
+
+        stats.waiting += 1
+        if semaphore is not None:
+            await semaphore.acquire()
+        stats.waiting -= 1
+        stats.active += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor(), call)
+            stats.completed += 1
+            return result
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            stats.active -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def offload(self, lane: str) -> Callable:
+        """
+        Decorator running a whole async handler on the pool (see run)
+
+        The wrapper keeps the handler's signature, so FastAPI still sees its
+        parameters.
+        """
+        def decorate(handler: Callable) -> Callable:
+            @functools.wraps(handler)
+            async def wrapper(*args, **kwargs):
+                return await self.run(lane, handler, *args, **kwargs)
+            return wrapper
+        return decorate
+
+    def stats(self) -> Dict:
+        """Pool size and per-lane counters"""
+        return {
+            "max_workers": self.max_workers,
+            "lanes": {lane: asdict(stats) for lane, stats in self._stats.items()}
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the pool (it restarts on next use)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+            logger.info("🧵 Blocking executor stopped")
@@ -0,0 +1,159 @@
+"""
+⏱️ Refresh Scheduler
+Background worker that runs FIRMS data refreshes off the request path
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import logging
+import queue
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefreshJob:
+    """One queued refresh"""
+    job_id: str
+    days: int
+    status: str = "queued"  # queued -> running -> succeeded | failed
+    enqueued_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    total_detections: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        for key in ("enqueued_at", "started_at", "finished_at"):
+            data[key] = data[key].isoformat() if data[key] else None
+        return data
+
+
+class RefreshScheduler:
+    """
+    Single-worker refresh queue
+
+    `enqueue` returns immediately with a job; a daemon thread runs jobs one
+    at a time through `refresh(days)`, which builds the new dataset and its
+    indexes and swaps it in as one reference assignment. A refresh that is
+    still queued absorbs later requests instead of queueing a duplicate.
+    Optionally a refresh is also scheduled every `interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[int], int],
+        on_complete: Optional[Callable[[RefreshJob], None]] = None,
+        interval_seconds: Optional[float] = None,
+        interval_days: int = 1,
+        history: int = 20
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            refresh: Runs a refresh for N days and returns the new detection count
+            on_complete: Called after each successful job (e.g. to clear caches)
+            interval_seconds: Periodic refresh interval (None = on demand only)
+            interval_days: Days fetched by periodic refreshes
+            history: Number of finished jobs kept for status lookups
+        """
+        self.refresh = refresh
+        self.on_complete = on_complete
+        self.interval_seconds = interval_seconds
+        self.interval_days = interval_days
+        self.history = history
+
+        self._queue: "queue.Queue[Optional[RefreshJob]]" = queue.Queue()
+        self._jobs: "OrderedDict[str, RefreshJob]" = OrderedDict()
+        self._pending: Optional[RefreshJob] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the worker thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="firms-refresh", daemon=True)
+        self._thread.start()
+        logger.info("⏱️ Refresh scheduler started")
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Stop the worker after the current job"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("⏱️ Refresh scheduler stopped")
+
+    def enqueue(self, days: int = 1) -> RefreshJob:
+        """
+        Queue a refresh
+
+        Args:
+            days: Number of recent days to fetch
+
+        Returns:
+            The queued job (an already queued job when one is waiting)
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.days = max(self._pending.days, days)
+                return self._pending
+
+            job = RefreshJob(job_id=uuid.uuid4().hex[:12], days=days, enqueued_at=datetime.now())
+            self._pending = job
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.history:
+                self._jobs.popitem(last=False)
+
+        self._queue.put(job)
+        logger.info(f"⏱️ Refresh job {job.job_id} queued ({days} days)")
+        return job
+
+    def get(self, job_id: str) -> Optional[RefreshJob]:
+        """Look up a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[RefreshJob]:
+        """Recent jobs, newest first"""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def _run(self):
+        while True:
+            try:
+                job = self._queue.get(timeout=self.interval_seconds)
+            except queue.Empty:
+                self.enqueue(self.interval_days)
+                continue
+
+            if job is None:
+                return
+
+            with self._lock:
+                if self._pending is job:
+                    self._pending = None
+                job.status = "running"
+                job.started_at = datetime.now()
+
+            try:
+                total = self.refresh(job.days)
+                job.total_detections = total
+                job.status = "succeeded"
+                if self.on_complete is not None:
+                    self.on_complete(job)
+                logger.info(f"✅ Refresh job {job.job_id} done: {total} detections")
+            except Exception as e:
+                job.error = str(e)
+                job.status = "failed"
+                logger.error(f"❌ Refresh job {job.job_id} failed: {str(e)}")
+            finally:
+                job.finished_at = datetime.now()
@@ -5,22 +5,46 @@ Processes MODIS/VIIRS fire detection CSV files
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator
 from datetime import datetime
 import os
+import io
+import json
 import logging
 
+from src.adapters.repositories.fire_snapshot import FireArchiveSnapshot
+from src.adapters.repositories.fire_store import FireDetectionStore
+from src.adapters.repositories.neighbour_index import KM_PER_DEGREE
+from src.adapters.repositories.fire_tiles import tile_bounds, fire_tile_geojson
+from src.adapters.repositories.fire_serializers import (
+    fire_point_features, fire_detail_records, hotspot_records, write_feature_collection,
+    iter_fire_point_feature_json, iter_feature_collection, iter_ndjson, fire_points_binary
+)
+from src.adapters.repositories.fire_schema import (
+    apply_detection_schema, date_to_day, day_to_date, days_to_dates
+)
+
 logger = logging.getLogger(__name__)
 
 
 class CSVFireRepository:
     """Repository for CSV fire archive data"""
     
-    def __init__(self, data_dir: str = "./data/raw"):
+    def __init__(self, data_dir: str = "./data/raw", processed_dir: str = "./data/processed"):
         self.data_dir = data_dir
+        self.snapshot = FireArchiveSnapshot(processed_dir)
         self.df = None
         self._load_csv_files()
     
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Detections DataFrame (date-sorted, see FireDetectionStore)"""
+        return self.store.df if self.store is not None else None
+    
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]):
+        self.store = FireDetectionStore(value) if value is not None else None
+    
     def _load_csv_files(self):
         """Load all CSV files from data directory"""
         if not os.path.exists(self.data_dir):
@@ -38,16 +62,66 @@ class CSVFireRepository:
         for csv_file in csv_files:
             filepath = os.path.join(self.data_dir, csv_file)
             try:
-                df = pd.read_csv(filepath)
+                df = self.snapshot.load_csv(filepath)
                 dfs.append(df)
                 logger.info(f"📊 Loaded {len(df)} fire detections from {csv_file}")
             except Exception as e:
                 logger.error(f"Error loading {csv_file}: {str(e)}")
         
         if dfs:
-            self.df = pd.concat(dfs, ignore_index=True)
+            # Categories differ per file, so re-apply the schema after concat
+            self.df = apply_detection_schema(pd.concat(dfs, ignore_index=True))
             logger.info(f"✅ Total fire detections loaded: {len(self.df)}")
     
+    def select_fire_points(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Select fire detections for mapping
+        
+        Args:
+            max_points: Maximum points to return (None/0 = no limit)
+            min_confidence: Minimum confidence (0-100)
+            start_date: Start date filter (YYYY-MM-DD)
+            end_date: End date filter (YYYY-MM-DD)
+            bbox: Bounding box (min_lat, min_lon, max_lat, max_lon)
+            
+        Returns:
+            (selected detections, number of matches before sampling)
+        """
+        if self.df is None or len(self.df) == 0:
+            return pd.DataFrame(), 0
+        
+        # Date window: contiguous slice of the date-sorted store (no copy)
+        rows = self.store.date_slice(
+            date_to_day(start_date) if start_date else None,
+            date_to_day(end_date) if end_date else None
+        )
+        
+        # Bounding box filter (grid spatial index, restricted to the date window)
+        if bbox:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            rows = self.store.query_bbox(min_lat, min_lon, max_lat, max_lon, rows=rows)
+        
+        filtered = self.df.iloc[rows]
+        
+        # Confidence filter
+        if 'confidence' in filtered.columns:
+            filtered = filtered[filtered['confidence'] >= min_confidence]
+        
+        # Sample if too many points
+        filtered_count = len(filtered)
+        if max_points and filtered_count > max_points:
+            filtered = filtered.sample(n=max_points, random_state=42)
+            logger.info(f"Sampled {max_points} from {filtered_count} points")
+        
+        return filtered, filtered_count
+    
     def get_fire_points_geojson(
         self,
         max_points: Optional[int] = 5000,
@@ -69,6 +143,8 @@ class CSVFireRepository:
         Returns:
             GeoJSON FeatureCollection
         """
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        
         if self.df is None or len(self.df) == 0:
             return {
                 "type": "FeatureCollection",
@@ -76,57 +152,8 @@ class CSVFireRepository:
                 "properties": {"count": 0, "message": "No data available"}
             }
         
-        # Filter data
-        filtered = self.df.copy()
-        
-        # Confidence filter
-        if 'confidence' in filtered.columns:
-            filtered = filtered[filtered['confidence'] >= min_confidence]
-        
-        # Date filters
-        if start_date and 'acq_date' in filtered.columns:
-            filtered = filtered[filtered['acq_date'] >= start_date]
-        
-        if end_date and 'acq_date' in filtered.columns:
-            filtered = filtered[filtered['acq_date'] <= end_date]
-        
-        # Bounding box filter
-        if bbox:
-            min_lat, min_lon, max_lat, max_lon = bbox
-            filtered = filtered[
-                (filtered['latitude'] >= min_lat) &
-                (filtered['latitude'] <= max_lat) &
-                (filtered['longitude'] >= min_lon) &
-                (filtered['longitude'] <= max_lon)
-            ]
-        
-        # Sample if too many points
-        if max_points and len(filtered) > max_points:
-            filtered = filtered.sample(n=max_points, random_state=42)
-            logger.info(f"Sampled {max_points} from {len(self.df)} points")
-        
-        # Convert to GeoJSON
-        features = []
-        for _, row in filtered.iterrows():
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [float(row['longitude']), float(row['latitude'])]
-                },
-                "properties": {
-                    "brightness": float(row.get('brightness', 0)),
-                    "confidence": int(row.get('confidence', 0)),
-                    "frp": float(row.get('frp', 0)),
-                    "acq_date": str(row.get('acq_date', '')),
-                    "acq_time": str(row.get('acq_time', '')),
-                    "satellite": str(row.get('satellite', '')),
-                    "instrument": str(row.get('instrument', '')),
-                    "daynight": str(row.get('daynight', '')),
-                    "type": int(row.get('type', 0))
-                }
-            }
-            features.append(feature)
+        # Convert to GeoJSON (column-wise)
+        features = fire_point_features(points)
         
         return {
             "type": "FeatureCollection",
@@ -134,10 +161,116 @@ class CSVFireRepository:
             "properties": {
                 "count": len(features),
                 "total_available": len(self.df),
-                "filtered_count": len(filtered)
+                "filtered_count": filtered_count
             }
         }
     
+    def get_fire_points_geojson_bytes(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> bytes:
+        """
+        Get fire points as encoded GeoJSON (same content as get_fire_points_geojson)
+        
+        Returns:
+            UTF-8 JSON bytes of the FeatureCollection
+        """
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        
+        if self.df is None or len(self.df) == 0:
+            return json.dumps({
+                "type": "FeatureCollection",
+                "features": [],
+                "properties": {"count": 0, "message": "No data available"}
+            }, separators=(",", ":")).encode()
+        
+        buffer = io.BytesIO()
+        write_feature_collection(buffer, points, properties={
+            "count": len(points),
+            "total_available": len(self.df),
+            "filtered_count": filtered_count
+        })
+        return buffer.getvalue()
+    
+    def get_fire_points_binary(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> bytes:
+        """
+        Get fire points in the packed binary layout (see fire_serializers)
+        
+        Returns:
+            Header + 15-byte lon/lat/frp/confidence/day records
+        """
+        points, _ = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        return fire_points_binary(points)
+    
+    def get_fire_tile(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> bytes:
+        """
+        Get the fire detections of one Web-Mercator tile
+        
+        Args:
+            z, x, y: Slippy-map tile coordinates
+            min_confidence: Minimum confidence (0-100)
+            start_date: Start date filter (YYYY-MM-DD)
+            end_date: End date filter (YYYY-MM-DD)
+            
+        Returns:
+            GeoJSON FeatureCollection bytes (aggregated at low zoom, see fire_tiles)
+        """
+        points, _ = self.select_fire_points(None, min_confidence, start_date, end_date, bbox=tile_bounds(z, x, y))
+        return fire_tile_geojson(points, z, x, y)
+    
+    def stream_fire_points(
+        self,
+        format: str = "geojson",
+        max_points: Optional[int] = None,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> Iterator[bytes]:
+        """
+        Encode fire points incrementally for large exports
+        
+        Detections are selected up front; features are then encoded and
+        yielded chunk by chunk, so the full feature list is never held in memory.
+        
+        Args:
+            format: 'geojson' (FeatureCollection) or 'ndjson' (one Feature per line)
+            max_points: Maximum points to return (None/0 = no limit)
+            
+        Returns:
+            Iterator of UTF-8 byte chunks
+        """
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        chunks = iter_fire_point_feature_json(points)
+        
+        if format == "ndjson":
+            return iter_ndjson(chunks)
+        
+        return iter_feature_collection(chunks, properties={
+            "count": len(points),
+            "total_available": len(self.df) if self.df is not None else 0,
+            "filtered_count": filtered_count
+        })
+    
     def get_statistics(self) -> Dict:
         """Get overall statistics from fire data"""
         if self.df is None or len(self.df) == 0:
@@ -146,23 +279,23 @@ class CSVFireRepository:
         stats = {
             "total_detections": len(self.df),
             "date_range": {
-                "start": str(self.df['acq_date'].min()) if 'acq_date' in self.df.columns else None,
-                "end": str(self.df['acq_date'].max()) if 'acq_date' in self.df.columns else None
+                "start": day_to_date(self.df['acq_date'].min()) if 'acq_date' in self.df.columns else None,
+                "end": day_to_date(self.df['acq_date'].max()) if 'acq_date' in self.df.columns else None
             },
             "geographic_extent": {
-                "min_lat": float(self.df['latitude'].min()),
-                "max_lat": float(self.df['latitude'].max()),
-                "min_lon": float(self.df['longitude'].min()),
-                "max_lon": float(self.df['longitude'].max())
+                "min_lat": round(float(self.df['latitude'].min()), 4),
+                "max_lat": round(float(self.df['latitude'].max()), 4),
+                "min_lon": round(float(self.df['longitude'].min()), 4),
+                "max_lon": round(float(self.df['longitude'].max()), 4)
             },
             "brightness": {
-                "mean": float(self.df['brightness'].mean()) if 'brightness' in self.df.columns else None,
-                "max": float(self.df['brightness'].max()) if 'brightness' in self.df.columns else None
+                "mean": round(float(self.df['brightness'].mean()), 2) if 'brightness' in self.df.columns else None,
+                "max": round(float(self.df['brightness'].max()), 2) if 'brightness' in self.df.columns else None
             },
             "frp": {
-                "mean": float(self.df['frp'].mean()) if 'frp' in self.df.columns else None,
-                "max": float(self.df['frp'].max()) if 'frp' in self.df.columns else None,
-                "total": float(self.df['frp'].sum()) if 'frp' in self.df.columns else None
+                "mean": round(float(self.df['frp'].mean()), 2) if 'frp' in self.df.columns else None,
+                "max": round(float(self.df['frp'].max()), 2) if 'frp' in self.df.columns else None,
+                "total": round(float(self.df['frp'].sum()), 2) if 'frp' in self.df.columns else None
             },
             "confidence": {
                 "mean": float(self.df['confidence'].mean()) if 'confidence' in self.df.columns else None,
@@ -170,12 +303,19 @@ class CSVFireRepository:
                 "medium_confidence": int(((self.df['confidence'] >= 50) & (self.df['confidence'] < 80)).sum()) if 'confidence' in self.df.columns else None,
                 "low_confidence": int((self.df['confidence'] < 50).sum()) if 'confidence' in self.df.columns else None
             },
-            "satellites": self.df['satellite'].value_counts().to_dict() if 'satellite' in self.df.columns else {},
-            "day_night": self.df['daynight'].value_counts().to_dict() if 'daynight' in self.df.columns else {}
+            "satellites": self._value_counts('satellite'),
+            "day_night": self._value_counts('daynight')
         }
         
         return stats
     
+    def _value_counts(self, column: str) -> Dict:
+        """Value counts of a categorical column, without unused categories"""
+        if column not in self.df.columns:
+            return {}
+        counts = self.df[column].value_counts()
+        return {str(k): int(v) for k, v in counts[counts > 0].items()}
+    
     def get_temporal_analysis(self) -> Dict:
         """Analyze fire detections over time"""
         if self.df is None or len(self.df) == 0 or 'acq_date' not in self.df.columns:
@@ -185,6 +325,12 @@ class CSVFireRepository:
         daily_counts = self.df.groupby('acq_date').size().reset_index(name='count')
         daily_frp = self.df.groupby('acq_date')['frp'].sum().reset_index(name='total_frp') if 'frp' in self.df.columns else None
         
+        # Day numbers back to YYYY-MM-DD
+        daily_counts['acq_date'] = days_to_dates(daily_counts['acq_date'])
+        if daily_frp is not None:
+            daily_frp['acq_date'] = days_to_dates(daily_frp['acq_date'])
+            daily_frp['total_frp'] = daily_frp['total_frp'].astype(float).round(2)
+        
         # Find peak days
         peak_day = daily_counts.loc[daily_counts['count'].idxmax()]
         
@@ -212,76 +358,45 @@ class CSVFireRepository:
         if self.df is None or len(self.df) == 0:
             return []
         
-        # Create grid cells
-        self.df['lat_cell'] = (self.df['latitude'] / grid_size).round() * grid_size
-        self.df['lon_cell'] = (self.df['longitude'] / grid_size).round() * grid_size
-        
-        # Group by grid cell
-        clusters = self.df.groupby(['lat_cell', 'lon_cell']).agg({
-            'latitude': 'mean',
-            'longitude': 'mean',
-            'frp': ['sum', 'mean', 'count'],
-            'confidence': 'mean'
-        }).reset_index()
-        
-        # Flatten column names
-        clusters.columns = ['lat_cell', 'lon_cell', 'lat', 'lon', 'total_frp', 'avg_frp', 'count', 'avg_confidence']
-        
-        # Sort by count
-        clusters = clusters.sort_values('count', ascending=False)
-        
-        # Convert to list of dicts
-        hotspots = []
-        for _, row in clusters.head(50).iterrows():  # Top 50 hotspots
-            hotspots.append({
-                "lat": float(row['lat']),
-                "lon": float(row['lon']),
-                "fire_count": int(row['count']),
-                "total_frp": float(row['total_frp']),
-                "avg_frp": float(row['avg_frp']),
-                "avg_confidence": float(row['avg_confidence']),
-                "intensity": "high" if row['count'] > 100 else "medium" if row['count'] > 50 else "low"
-            })
-        
-        return hotspots
+        if self.store.hotspots is None:
+            return []
+        
+        # Precomputed pyramid level (aggregated on demand for other sizes)
+        top = self.store.hotspot_level(grid_size).top(50)
+        return hotspot_records(
+            top.lat, top.lon, top.count,
+            top.total_frp, top.avg_frp, top.avg_confidence
+        )
     
-    def get_fire_details(self, lat: float, lon: float, radius: float = 0.1) -> List[Dict]:
+    def get_fire_details(
+        self,
+        lat: float,
+        lon: float,
+        radius: Optional[float] = 0.1,
+        k: Optional[int] = 100,
+        radius_km: Optional[float] = None
+    ) -> List[Dict]:
         """
-        Get detailed fire information near a point
+        Get detailed fire information near a point, closest first
         
         Args:
             lat: Latitude
             lon: Longitude
-            radius: Search radius in degrees
+            radius: Search radius in great-circle degrees (ignored if radius_km is set)
+            k: Maximum number of detections (None = all within radius)
+            radius_km: Search radius in km (None and radius None = unbounded k-NN)
             
         Returns:
-            List of nearby fire detections
+            List of nearby fire detections with distance_km
         """
         if self.df is None or len(self.df) == 0:
             return []
         
-        # Filter by distance
-        nearby = self.df[
-            (self.df['latitude'] >= lat - radius) &
-            (self.df['latitude'] <= lat + radius) &
-            (self.df['longitude'] >= lon - radius) &
-            (self.df['longitude'] <= lon + radius)
-        ]
-        
-        # Convert to list
-        fires = []
-        for _, row in nearby.head(100).iterrows():  # Limit to 100
-            fires.append({
-                "lat": float(row['latitude']),
-                "lon": float(row['longitude']),
-                "brightness": float(row.get('brightness', 0)),
-                "confidence": int(row.get('confidence', 0)),
-                "frp": float(row.get('frp', 0)),
-                "date": str(row.get('acq_date', '')),
-                "time": str(row.get('acq_time', '')),
-                "satellite": str(row.get('satellite', '')),
-                "instrument": str(row.get('instrument', '')),
-                "day_night": str(row.get('daynight', ''))
-            })
-        
-        return fires
+        if radius_km is None and radius is not None:
+            radius_km = radius * KM_PER_DEGREE
+        
+        # Great-circle search, ordered by distance
+        rows, distances = self.store.nearest(lat, lon, k=k, radius_km=radius_km)
+        nearby = self.df.iloc[rows]
+        
+        return fire_detail_records(nearby, distances)
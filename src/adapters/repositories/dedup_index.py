@@ -0,0 +1,108 @@
+"""
+🧷 Detection Dedup Index
+Hash index over detection keys for incremental de-duplication
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Optional
+
+# A detection is identified by position, acquisition time and source
+DEDUP_COLUMNS = ("latitude", "longitude", "acq_date", "acq_time", "source")
+
+
+def detection_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit hash of each detection's dedup key
+
+    Missing key columns hash as empty values (e.g. local archives have
+    no `source`), so frames with and without them stay comparable.
+
+    Returns:
+        uint64 array, one hash per row
+    """
+    n = len(df)
+    key = {}
+    for name in DEDUP_COLUMNS:
+        if name not in df.columns:
+            key[name] = np.full(n, "", dtype=object) if name == 'source' else np.zeros(n, dtype=np.int8)
+        elif name == 'source':
+            source = df[name].astype(object)
+            key[name] = source.where(source.notna(), "").astype(str).to_numpy()
+        else:
+            key[name] = df[name].to_numpy()
+    return pd.util.hash_pandas_object(pd.DataFrame(key), index=False).to_numpy()
+
+
+class DedupIndex:
+    """
+    Set of detection key hashes
+
+    Hashes live in a large sorted `main` array plus a small sorted `delta`
+    array. New batches are checked with binary searches and appended to
+    `delta`; `delta` is merged into `main` only once it outgrows
+    `merge_ratio` of it, so filtering a batch costs O(batch log n) plus
+    amortized merges, independent of how often refreshes run.
+    """
+
+    def __init__(self, merge_ratio: float = 0.1):
+        """
+        Initialize empty index
+
+        Args:
+            merge_ratio: Merge delta into main once len(delta) > merge_ratio * len(main)
+        """
+        self.merge_ratio = merge_ratio
+        self._main = np.empty(0, dtype=np.uint64)
+        self._delta = np.empty(0, dtype=np.uint64)
+
+    @classmethod
+    def from_frame(cls, df: Optional[pd.DataFrame], merge_ratio: float = 0.1) -> "DedupIndex":
+        """Index every detection of a DataFrame"""
+        index = cls(merge_ratio)
+        if df is not None and len(df) > 0:
+            index._main = np.unique(detection_hashes(df))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._main) + len(self._delta)
+
+    @staticmethod
+    def _isin_sorted(sorted_hashes: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+        if len(sorted_hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        positions = np.minimum(np.searchsorted(sorted_hashes, hashes), len(sorted_hashes) - 1)
+        return sorted_hashes[positions] == hashes
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Membership mask for hashes"""
+        return self._isin_sorted(self._main, hashes) | self._isin_sorted(self._delta, hashes)
+
+    def add(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Index a batch, returning which of its rows are new
+
+        A row is new if its key is not indexed yet and it is the first row
+        with that key in the batch; new keys are added to the index.
+
+        Args:
+            df: Batch of typed detections
+
+        Returns:
+            Boolean mask over the batch rows to keep
+        """
+        keep = np.zeros(len(df), dtype=bool)
+        if len(df) == 0:
+            return keep
+
+        unique, first = np.unique(detection_hashes(df), return_index=True)
+        new = ~self.contains(unique)
+        keep[first[new]] = True
+
+        # Both sorted: merge the batch into delta, and delta into main when large
+        self._delta = np.union1d(self._delta, unique[new])
+        if len(self._delta) > self.merge_ratio * len(self._main):
+            self._main = np.union1d(self._main, self._delta)
+            self._delta = np.empty(0, dtype=np.uint64)
+
+        return keep
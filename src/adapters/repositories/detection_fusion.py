@@ -0,0 +1,191 @@
+"""
+🔗 Detection Fusion
+Links detections of the same fire seen by different sensors (MODIS / VIIRS)
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Tuple, Optional, Sequence
+import itertools
+
+from src.adapters.repositories.fire_schema import apply_detection_schema
+from src.adapters.repositories.neighbour_index import KM_PER_DEGREE, haversine_km
+
+# Defaults: about one MODIS pixel, and the Aqua / S-NPP / NOAA-20 afternoon overpasses
+FUSION_DISTANCE_KM = 1.0
+FUSION_WINDOW_MINUTES = 60
+
+
+def _candidate_pairs(keys: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row pairs in the same cell (a < b) or in cells `offset` apart (offsets > 0)"""
+    order = np.argsort(keys, kind='stable')
+    cells, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    rows_a, rows_b = [], []
+    for offset in offsets:
+        target = cells + offset
+        position = np.minimum(np.searchsorted(cells, target), len(cells) - 1)
+        cell_a = np.nonzero(cells[position] == target)[0]
+        cell_b = position[cell_a]
+
+        # Expand each pair of cells into all row combinations
+        count_b = counts[cell_b]
+        sizes = counts[cell_a] * count_b
+        pair_cell = np.repeat(np.arange(len(cell_a)), sizes)
+        within = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        a = order[starts[cell_a][pair_cell] + within // count_b[pair_cell]]
+        b = order[starts[cell_b][pair_cell] + within % count_b[pair_cell]]
+
+        if offset == 0:
+            # Same cell: every unordered pair once
+            forward = a < b
+            a, b = a[forward], b[forward]
+        rows_a.append(a)
+        rows_b.append(b)
+
+    return np.concatenate(rows_a), np.concatenate(rows_b)
+
+
+def _roots(n: int, child: np.ndarray, parent: np.ndarray, distance: np.ndarray) -> np.ndarray:
+    """Root row of each row, attaching each child to its nearest parent"""
+    order = np.lexsort((distance, child))
+    child, parent = child[order], parent[order]
+    nearest = np.concatenate(([True], child[1:] != child[:-1])) if len(child) else np.zeros(0, dtype=bool)
+
+    roots = np.arange(n)
+    roots[child[nearest]] = parent[nearest]
+    # Parents always have a higher priority, so chains end within len(sources) steps
+    while True:
+        updated = roots[roots]
+        if np.array_equal(updated, roots):
+            return roots
+        roots = updated
+
+
+def link_detections(
+    df: pd.DataFrame,
+    distance_km: float = FUSION_DISTANCE_KM,
+    window_minutes: int = FUSION_WINDOW_MINUTES,
+    priority: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """
+    Group detections of the same fire seen by different sources
+
+    Two detections match when they come from different sources, lie within
+    `distance_km` of each other and were acquired at most `window_minutes`
+    apart. Each detection joins the group of its nearest match from a
+    higher-priority source, if any; detections of the same source are never
+    merged with each other directly, so adjacent pixels of one fire front
+    cannot chain into a single group. Candidates come from a spatial hash
+    grid over (time bucket, lat cell, lon cell) sized to the thresholds, so
+    only detections in neighbouring buckets are compared and the cost stays
+    near-linear.
+
+    Args:
+        df: Typed detections with a `source` column
+        distance_km: Maximum great-circle distance between matched detections
+        window_minutes: Maximum acquisition time difference
+        priority: Sources from highest to lowest priority (default:
+            alphabetical; unlisted sources rank last)
+
+    Returns:
+        Group label (root row) per row; unmatched rows are their own group
+    """
+    n = len(df)
+    if n == 0 or 'source' not in df.columns:
+        return np.arange(n)
+
+    lat = df['latitude'].to_numpy(dtype=np.float64)
+    lon = df['longitude'].to_numpy(dtype=np.float64)
+    minutes = df['acq_date'].to_numpy(dtype=np.int64) * 1440 + df['acq_time'].to_numpy(dtype=np.int64)
+    source = df['source'].astype('category')
+    ranks = {name: rank for rank, name in enumerate(priority or sorted(source.cat.categories.astype(str)))}
+    rank = np.array([ranks.get(name, len(ranks)) for name in source.cat.categories.astype(str)] + [len(ranks)])
+    source = rank[source.cat.codes.to_numpy()]
+
+    # Cells at least `distance_km` wide everywhere in the data, so linked
+    # detections are always in the same or an adjacent cell
+    lat_cell = distance_km / KM_PER_DEGREE
+    lon_cell = lat_cell / max(np.cos(np.radians(min(np.abs(lat).max(), 89.0))), 1e-3)
+
+    bucket = (minutes - minutes.min()) // max(window_minutes, 1)
+    lat_idx = np.floor((lat + 90) / lat_cell).astype(np.int64)
+    lon_idx = np.floor((lon + 180) / lon_cell).astype(np.int64)
+
+    lat_span = int(lat_idx.max()) + 3
+    lon_span = int(lon_idx.max()) + 3
+    keys = (bucket * lat_span + lat_idx + 1) * lon_span + lon_idx + 1
+    # Half of the 3x3x3 neighbourhood: each pair of adjacent cells is visited once
+    offsets = np.array([
+        (dt * lat_span + dy) * lon_span + dx
+        for dt, dy, dx in itertools.product((-1, 0, 1), repeat=3)
+    ], dtype=np.int64)
+    offsets = offsets[offsets >= 0]
+
+    a, b = _candidate_pairs(keys, offsets)
+    distance = haversine_km(lat[a], lon[a], lat[b], lon[b])
+    matched = (
+        (source[a] != source[b])
+        & (np.abs(minutes[a] - minutes[b]) <= window_minutes)
+        & (distance <= distance_km)
+    )
+    a, b, distance = a[matched], b[matched], distance[matched]
+
+    # Lower-priority detection of each match is the child
+    a_child = source[a] > source[b]
+    return _roots(n, np.where(a_child, a, b), np.where(a_child, b, a), distance)
+
+
+def fuse_detections(
+    df: pd.DataFrame,
+    distance_km: float = FUSION_DISTANCE_KM,
+    window_minutes: int = FUSION_WINDOW_MINUTES,
+    priority: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Collapse multi-sensor detections of the same fire (see link_detections)
+
+    Each group keeps one canonical detection: the highest confidence, then
+    the highest FRP, then the earliest row. Provenance is recorded in
+    `sources` ("+"-joined sorted source names of the group) and
+    `fused_count` (detections merged into the row).
+
+    Args:
+        df: Typed detections with a `source` column
+        distance_km: Maximum distance between linked detections
+        window_minutes: Maximum acquisition time difference
+        priority: Sources from highest to lowest priority
+
+    Returns:
+        Typed DataFrame with one row per group, in original row order
+    """
+    labels = link_detections(df, distance_km, window_minutes, priority)
+    n = len(df)
+    if n == 0 or 'source' not in df.columns:
+        return df
+
+    groups, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+
+    # Canonical row: sort by group, then best first, and take each group's first
+    confidence = df['confidence'].to_numpy(dtype=np.int64) if 'confidence' in df.columns else np.zeros(n, dtype=np.int64)
+    frp = np.nan_to_num(df['frp'].to_numpy(dtype=np.float64)) if 'frp' in df.columns else np.zeros(n)
+    order = np.lexsort((np.arange(n), -frp, -confidence, inverse))
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    canonical = np.sort(order[first])
+
+    # Provenance: bitmask of the sources in each group, named once per distinct mask
+    source = df['source'].astype('category')
+    names = np.asarray(source.cat.categories.astype(str), dtype=object)
+    bits = np.left_shift(np.uint64(1), source.cat.codes.to_numpy().astype(np.uint64))
+    masks = np.bitwise_or.reduceat(bits[order], first)
+    distinct, mask_inverse = np.unique(masks, return_inverse=True)
+    mask_names = np.array([
+        "+".join(sorted(names[[(int(mask) >> code) & 1 == 1 for code in range(len(names))]]))
+        for mask in distinct
+    ], dtype=object)
+    provenance = mask_names[mask_inverse]
+
+    fused = df.iloc[canonical].reset_index(drop=True)
+    fused['sources'] = provenance[inverse[canonical]]
+    fused['fused_count'] = counts[inverse[canonical]]
+    return apply_detection_schema(fused)
@@ -0,0 +1,79 @@
+"""
+🌊 Streaming FIRMS CSV Parser
+Incremental parse of FIRMS CSV bodies into typed column batches
+"""
+
+import pandas as pd
+from typing import List, Optional
+import io
+
+from src.adapters.repositories.fire_schema import apply_detection_schema
+
+# Raw bytes buffered before a batch is parsed
+PARSE_BATCH_BYTES = 4 * 1024 * 1024
+
+
+class DetectionCSVParser:
+    """
+    Incremental FIRMS CSV parser
+
+    Bytes are fed as they arrive; whenever `batch_bytes` of complete lines
+    are buffered they are parsed and converted to the detection schema, and
+    the raw text is dropped. Peak memory is one raw batch plus the compact
+    typed columns, instead of the full body as bytes, str and parser input.
+    """
+
+    def __init__(self, batch_bytes: int = PARSE_BATCH_BYTES):
+        """
+        Initialize parser
+
+        Args:
+            batch_bytes: Raw bytes buffered per parsed batch (default: 4 MB)
+        """
+        self.batch_bytes = batch_bytes
+        self.header: Optional[List[str]] = None
+        self.rows = 0
+        self._pending = bytearray()
+        self._batches: List[pd.DataFrame] = []
+
+    def feed(self, data: bytes):
+        """Append body bytes, parsing complete lines once a batch is buffered"""
+        self._pending += data
+        if len(self._pending) >= self.batch_bytes:
+            self._parse(final=False)
+
+    def _parse(self, final: bool):
+        end = len(self._pending) if final else self._pending.rfind(b"\n") + 1
+        if end <= 0:
+            return
+
+        block = bytes(self._pending[:end])
+        del self._pending[:end]
+
+        if self.header is None:
+            newline = block.find(b"\n")
+            header_line, block = (block, b"") if newline < 0 else (block[:newline], block[newline + 1:])
+            self.header = [name.strip() for name in header_line.decode("utf-8").split(",")]
+
+        if block.strip():
+            batch = apply_detection_schema(pd.read_csv(io.BytesIO(block), header=None, names=self.header))
+            self.rows += len(batch)
+            self._batches.append(batch)
+
+    def finish(self) -> pd.DataFrame:
+        """
+        Parse the remaining bytes and combine the batches
+
+        Returns:
+            Typed DataFrame (no rows, but the header's columns, if the
+            body had no rows)
+        """
+        self._parse(final=True)
+        batches, self._batches = self._batches, []
+
+        if not batches:
+            return apply_detection_schema(pd.DataFrame(columns=self.header or []))
+        if len(batches) == 1:
+            return batches[0]
+        return apply_detection_schema(pd.concat(batches, ignore_index=True))
+
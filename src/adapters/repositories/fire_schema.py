@@ -0,0 +1,159 @@
+"""
+🧬 Fire Detection Schema
+Compact typed columns for FIRMS fire detections
+"""
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
+from typing import Union
+
+# Column dtypes applied at load time
+# acq_date -> days since 1970-01-01, acq_time -> minutes since midnight (UTC)
+DETECTION_SCHEMA = {
+    "latitude": np.float32,
+    "longitude": np.float32,
+    "brightness": np.float32,
+    "bright_t31": np.float32,
+    "bright_ti4": np.float32,
+    "bright_ti5": np.float32,
+    "scan": np.float32,
+    "track": np.float32,
+    "frp": np.float32,
+    "confidence": np.uint8,
+    "type": np.uint8,
+    "acq_date": np.int32,
+    "acq_time": np.uint16,
+    "satellite": "category",
+    "instrument": "category",
+    "daynight": "category",
+    "version": "category",
+    "source": "category",  # FIRMS source (MODIS_SP, VIIRS_SNPP_SP, ...) of API chunks
+    "sources": "category",  # fused detections: "+"-joined sources of the group
+    "fused_count": np.uint16
+}
+
+# VIIRS reports confidence as low/nominal/high instead of 0-100
+VIIRS_CONFIDENCE = {"l": 30, "n": 60, "h": 90, "low": 30, "nominal": 60, "high": 90}
+
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def date_to_day(date: str) -> int:
+    """Convert YYYY-MM-DD to day number (days since 1970-01-01)"""
+    return int((np.datetime64(date, "D") - EPOCH).astype(np.int64))
+
+
+def day_to_date(day: int) -> str:
+    """Convert day number to YYYY-MM-DD"""
+    return str(EPOCH + np.timedelta64(int(day), "D"))
+
+
+def days_to_dates(days: Union[np.ndarray, pd.Series]) -> np.ndarray:
+    """Vectorized day number -> YYYY-MM-DD strings"""
+    days = np.asarray(days, dtype=np.int64)
+    return (EPOCH + days.astype("timedelta64[D]")).astype(str)
+
+
+def minutes_to_hhmm(minutes: Union[np.ndarray, pd.Series]) -> np.ndarray:
+    """Vectorized minutes since midnight -> HHMM strings (FIRMS acq_time format)"""
+    minutes = np.asarray(minutes, dtype=np.int64)
+    if minutes.size == 0:
+        return np.empty(minutes.shape, dtype="<U4")
+    return np.char.zfill((minutes // 60 * 100 + minutes % 60).astype(str), 4)
+
+
+def _parse_acq_date(values: pd.Series) -> np.ndarray:
+    # Few distinct dates per archive: parse the uniques only
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Index(uniques), format="%Y-%m-%d", errors="coerce")
+    days = (parsed.values.astype("datetime64[D]") - EPOCH).astype(np.int64)
+    days[parsed.isna()] = 0
+    result = days[codes]
+    result[codes < 0] = 0
+    return result.astype(np.int32)
+
+
+def _parse_acq_time(values: pd.Series) -> np.ndarray:
+    hhmm = pd.to_numeric(values, errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+    return (hhmm // 100 * 60 + hhmm % 100).astype(np.uint16)
+
+
+def _parse_confidence(values: pd.Series) -> np.ndarray:
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        mapped = values.astype(str).str.strip().str.lower().map(VIIRS_CONFIDENCE)
+        values = pd.to_numeric(values, errors="coerce").fillna(mapped)
+    return values.fillna(0).clip(0, 100).to_numpy(dtype=np.uint8)
+
+
+def apply_detection_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the detection schema to a FIRMS DataFrame
+
+    Columns already in their target dtype are left untouched, so the
+    function is safe to call again after concatenating typed frames.
+    Columns outside the schema are kept as they are.
+
+    Args:
+        df: DataFrame parsed from a FIRMS CSV
+
+    Returns:
+        New DataFrame with compact dtypes
+    """
+    columns = {}
+
+    for name in df.columns:
+        series = df[name]
+        target = DETECTION_SCHEMA.get(name)
+
+        if target is None:
+            columns[name] = series.array
+        elif target == "category":
+            columns[name] = series.array if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category").array
+        elif series.dtype == target:
+            columns[name] = series.to_numpy()
+        elif name == "acq_date":
+            columns[name] = _parse_acq_date(series)
+        elif name == "acq_time":
+            columns[name] = _parse_acq_time(series)
+        elif name == "confidence":
+            columns[name] = _parse_confidence(series)
+        elif np.issubdtype(target, np.integer):
+            columns[name] = pd.to_numeric(series, errors="coerce").fillna(0).to_numpy(dtype=target)
+        else:
+            columns[name] = pd.to_numeric(series, errors="coerce").to_numpy(dtype=target)
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(df)))
+
+
+def append_detections(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Typed DataFrame with `rows` appended to `df`
+
+    Only `rows` is parsed; `df` must already be typed. Categorical columns
+    are unioned instead of falling back to object, and a column missing on
+    one side is filled as apply_detection_schema fills missing values.
+
+    Args:
+        df: Typed detections
+        rows: Detections to append (raw or typed)
+
+    Returns:
+        New DataFrame with the rows of `df` followed by `rows`
+    """
+    rows = apply_detection_schema(rows)
+    columns = {}
+
+    for name in dict.fromkeys([*df.columns, *rows.columns]):
+        head = df[name] if name in df.columns else pd.Series(np.nan, index=df.index)
+        tail = rows[name] if name in rows.columns else pd.Series(np.nan, index=rows.index)
+
+        if isinstance(head.dtype, pd.CategoricalDtype) and isinstance(tail.dtype, pd.CategoricalDtype):
+            columns[name] = union_categoricals([head.array, tail.array])
+        elif head.dtype == tail.dtype:
+            columns[name] = np.concatenate([head.to_numpy(), tail.to_numpy()])
+        else:
+            combined = pd.concat([head, tail], ignore_index=True).to_frame(name)
+            columns[name] = apply_detection_schema(combined)[name].array
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(df) + len(rows)))
@@ -0,0 +1,347 @@
+"""
+🧾 Fire Serializers
+Column-wise GeoJSON / JSON builders for fire detections
+"""
+
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Optional, BinaryIO, Iterable, Iterator
+import json
+
+from src.adapters.repositories.fire_schema import days_to_dates, minutes_to_hhmm
+
+# Output precision (FIRMS publishes 4 decimals for coordinates)
+COORD_DECIMALS = 4
+VALUE_DECIMALS = 2
+
+# Rows encoded per chunk when streaming
+STREAM_CHUNK_ROWS = 10000
+
+
+def _floats(df: pd.DataFrame, name: str, decimals: int) -> list:
+    if name not in df.columns:
+        return [0.0] * len(df)
+    values = np.nan_to_num(df[name].to_numpy(dtype=np.float64))
+    return np.round(values, decimals).tolist()
+
+
+def _ints(df: pd.DataFrame, name: str) -> list:
+    if name not in df.columns:
+        return [0] * len(df)
+    return df[name].to_numpy(dtype=np.int64).tolist()
+
+
+def _texts(df: pd.DataFrame, name: str) -> list:
+    if name not in df.columns:
+        return [''] * len(df)
+    series = df[name]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Convert each category once, then gather by code
+        labels = np.append(np.asarray(series.cat.categories.astype(str), dtype=object), '')
+        return labels[series.cat.codes.to_numpy()].tolist()
+    return series.astype(str).tolist()
+
+
+def detection_columns(df: pd.DataFrame) -> Dict[str, list]:
+    """
+    Output-ready columns for a set of detections
+
+    Converts each column in bulk (rounding, day numbers -> YYYY-MM-DD,
+    minutes -> HHMM, categories -> str) into plain Python lists.
+
+    Args:
+        df: Typed detections (see fire_schema)
+
+    Returns:
+        Dict of column name -> list of JSON-ready values
+    """
+    n = len(df)
+    return {
+        "longitude": _floats(df, 'longitude', COORD_DECIMALS),
+        "latitude": _floats(df, 'latitude', COORD_DECIMALS),
+        "brightness": _floats(df, 'brightness', VALUE_DECIMALS),
+        "confidence": _ints(df, 'confidence'),
+        "frp": _floats(df, 'frp', VALUE_DECIMALS),
+        "acq_date": days_to_dates(df['acq_date'].to_numpy()).tolist() if 'acq_date' in df.columns else [''] * n,
+        "acq_time": minutes_to_hhmm(df['acq_time'].to_numpy()).tolist() if 'acq_time' in df.columns else [''] * n,
+        "satellite": _texts(df, 'satellite'),
+        "instrument": _texts(df, 'instrument'),
+        "daynight": _texts(df, 'daynight'),
+        "type": _ints(df, 'type')
+    }
+
+
+def fire_point_features(df: pd.DataFrame) -> List[Dict]:
+    """
+    GeoJSON Point features for detections
+
+    Args:
+        df: Typed detections
+
+    Returns:
+        List of GeoJSON Feature dicts
+    """
+    c = detection_columns(df)
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": {
+                "brightness": brightness,
+                "confidence": confidence,
+                "frp": frp,
+                "acq_date": acq_date,
+                "acq_time": acq_time,
+                "satellite": satellite,
+                "instrument": instrument,
+                "daynight": daynight,
+                "type": fire_type
+            }
+        }
+        for lon, lat, brightness, confidence, frp, acq_date, acq_time, satellite, instrument, daynight, fire_type in zip(
+            c["longitude"], c["latitude"], c["brightness"], c["confidence"], c["frp"],
+            c["acq_date"], c["acq_time"], c["satellite"], c["instrument"], c["daynight"], c["type"]
+        )
+    ]
+
+
+def fire_detail_records(df: pd.DataFrame, distances: Optional[np.ndarray] = None) -> List[Dict]:
+    """
+    Detail records for clicked detections
+
+    Args:
+        df: Typed detections
+        distances: Optional distance of each detection in km
+
+    Returns:
+        List of fire detail dicts
+    """
+    c = detection_columns(df)
+    records = [
+        {
+            "lat": lat,
+            "lon": lon,
+            "brightness": brightness,
+            "confidence": confidence,
+            "frp": frp,
+            "date": acq_date,
+            "time": acq_time,
+            "satellite": satellite,
+            "instrument": instrument,
+            "day_night": daynight
+        }
+        for lat, lon, brightness, confidence, frp, acq_date, acq_time, satellite, instrument, daynight in zip(
+            c["latitude"], c["longitude"], c["brightness"], c["confidence"], c["frp"],
+            c["acq_date"], c["acq_time"], c["satellite"], c["instrument"], c["daynight"]
+        )
+    ]
+
+    if distances is not None:
+        records = [
+            {"distance_km": distance, **record}
+            for distance, record in zip(np.round(np.asarray(distances, dtype=np.float64), 3).tolist(), records)
+        ]
+
+    return records
+
+
+def hotspot_records(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    count: np.ndarray,
+    total_frp: np.ndarray,
+    avg_frp: np.ndarray,
+    avg_confidence: np.ndarray
+) -> List[Dict]:
+    """
+    Hotspot cluster records from per-cell aggregate columns
+
+    Returns:
+        List of hotspot dicts with intensity classification
+    """
+    count = np.asarray(count, dtype=np.int64)
+    intensity = np.where(count > 100, "high", np.where(count > 50, "medium", "low")).tolist()
+
+    return [
+        {
+            "lat": la,
+            "lon": lo,
+            "fire_count": n,
+            "total_frp": total,
+            "avg_frp": avg,
+            "avg_confidence": conf,
+            "intensity": level
+        }
+        for la, lo, n, total, avg, conf, level in zip(
+            np.round(np.asarray(lat, dtype=np.float64), COORD_DECIMALS).tolist(),
+            np.round(np.asarray(lon, dtype=np.float64), COORD_DECIMALS).tolist(),
+            count.tolist(),
+            np.round(np.asarray(total_frp, dtype=np.float64), VALUE_DECIMALS).tolist(),
+            np.round(np.asarray(avg_frp, dtype=np.float64), VALUE_DECIMALS).tolist(),
+            np.round(np.asarray(avg_confidence, dtype=np.float64), VALUE_DECIMALS).tolist(),
+            intensity
+        )
+    ]
+
+
+def _encoded_texts(df: pd.DataFrame, name: str) -> list:
+    # JSON-encode each distinct value once
+    values = _texts(df, name)
+    encoded = {v: json.dumps(v, ensure_ascii=False) for v in set(values)}
+    return [encoded[v] for v in values]
+
+
+def fire_point_feature_json(df: pd.DataFrame) -> List[str]:
+    """
+    Encode detections as GeoJSON Feature JSON, one string per feature
+
+    Produces the same compact JSON as json.dumps(feature, separators=(",", ":"))
+    for each item of fire_point_features(df), without building the dicts.
+    """
+    c = detection_columns(df)
+    template = (
+        '{"type":"Feature","geometry":{"type":"Point","coordinates":[%r,%r]},'
+        '"properties":{"brightness":%r,"confidence":%d,"frp":%r,"acq_date":"%s","acq_time":"%s",'
+        '"satellite":%s,"instrument":%s,"daynight":%s,"type":%d}}'
+    )
+    rows = zip(
+        c["longitude"], c["latitude"], c["brightness"], c["confidence"], c["frp"],
+        c["acq_date"], c["acq_time"],
+        _encoded_texts(df, 'satellite'), _encoded_texts(df, 'instrument'), _encoded_texts(df, 'daynight'),
+        c["type"]
+    )
+    return [template % row for row in rows]
+
+
+def iter_fire_point_feature_json(df: pd.DataFrame, chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[List[str]]:
+    """
+    Encode detections chunk by chunk (see fire_point_feature_json)
+
+    Only one chunk of encoded features is alive at a time, so memory stays
+    flat however many rows are exported.
+    """
+    for start in range(0, len(df), chunk_rows):
+        yield fire_point_feature_json(df.iloc[start:start + chunk_rows])
+
+
+def iter_feature_collection(feature_chunks: Iterable[List[str]], properties: Optional[Dict] = None) -> Iterator[bytes]:
+    """
+    Frame chunks of encoded features as one GeoJSON FeatureCollection
+
+    Args:
+        feature_chunks: Iterable of lists of Feature JSON strings
+        properties: Optional collection-level properties (written last)
+
+    Yields:
+        UTF-8 byte chunks of the FeatureCollection
+    """
+    yield b'{"type":"FeatureCollection","features":['
+    separator = ''
+    for features in feature_chunks:
+        if features:
+            yield (separator + ','.join(features)).encode("utf-8")
+            separator = ','
+
+    tail = b']'
+    if properties is not None:
+        tail += b',"properties":' + json.dumps(properties, separators=(",", ":")).encode()
+    yield tail + b'}'
+
+
+def iter_ndjson(feature_chunks: Iterable[List[str]]) -> Iterator[bytes]:
+    """
+    Frame chunks of encoded features as newline-delimited JSON
+
+    Yields:
+        UTF-8 byte chunks, one Feature per line
+    """
+    for features in feature_chunks:
+        if features:
+            yield ('\n'.join(features) + '\n').encode("utf-8")
+
+
+def write_feature_collection(stream: BinaryIO, df: pd.DataFrame, properties: Optional[Dict] = None) -> int:
+    """
+    Write detections as a GeoJSON FeatureCollection to a binary stream
+
+    Args:
+        stream: Writable binary file-like (e.g. io.BytesIO)
+        df: Typed detections
+        properties: Optional collection-level properties
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in iter_feature_collection([fire_point_feature_json(df)], properties):
+        written += stream.write(chunk)
+    return written
+
+
+# Packed binary point layout (all little-endian, no padding)
+#   header (16 bytes): magic b"FIRE", uint16 version, uint16 record size,
+#                      uint32 record count, int32 base day (days since 1970-01-01)
+#   record (15 bytes): float32 lon, float32 lat, float32 frp,
+#                      uint8 confidence, uint16 day offset from base day
+BINARY_MAGIC = b"FIRE"
+BINARY_VERSION = 1
+BINARY_HEADER = np.dtype([
+    ("magic", "S4"), ("version", "<u2"), ("record_size", "<u2"), ("count", "<u4"), ("base_day", "<i4")
+])
+BINARY_RECORD = np.dtype([
+    ("lon", "<f4"), ("lat", "<f4"), ("frp", "<f4"), ("confidence", "u1"), ("day", "<u2")
+])
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+
+def pack_points(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    frp: Optional[np.ndarray] = None,
+    confidence: Optional[np.ndarray] = None,
+    days: Optional[np.ndarray] = None,
+    base_day: Optional[int] = None
+) -> bytes:
+    """
+    Encode points in the packed binary layout (see BINARY_HEADER / BINARY_RECORD)
+
+    Args:
+        lon, lat: Coordinates in degrees
+        frp: Optional Fire Radiative Power (0 when missing)
+        confidence: Optional confidence 0-255 (0 when missing)
+        days: Optional day numbers; stored as offsets from base_day
+        base_day: Header base day (default: earliest of days, else 0)
+
+    Returns:
+        Header followed by one record per point
+    """
+    n = len(lon)
+    records = np.zeros(n, dtype=BINARY_RECORD)
+    records["lon"] = lon
+    records["lat"] = lat
+    if frp is not None:
+        records["frp"] = np.nan_to_num(np.asarray(frp, dtype=np.float32))
+    if confidence is not None:
+        records["confidence"] = np.clip(np.asarray(confidence, dtype=np.int64), 0, 255)
+
+    if base_day is None:
+        base_day = int(np.min(days)) if days is not None and n > 0 else 0
+    if days is not None:
+        records["day"] = np.clip(np.asarray(days, dtype=np.int64) - base_day, 0, np.iinfo(np.uint16).max)
+
+    header = np.array([(BINARY_MAGIC, BINARY_VERSION, BINARY_RECORD.itemsize, n, base_day)], dtype=BINARY_HEADER)
+    return header.tobytes() + records.tobytes()
+
+
+def fire_points_binary(df: pd.DataFrame) -> bytes:
+    """Encode typed detections in the packed binary layout"""
+    def column(name):
+        return df[name].to_numpy() if name in df.columns else None
+
+    if len(df) == 0 or 'longitude' not in df.columns:
+        return pack_points(np.empty(0), np.empty(0))
+
+    return pack_points(
+        column('longitude'), column('latitude'),
+        frp=column('frp'), confidence=column('confidence'), days=column('acq_date')
+    )
@@ -0,0 +1,265 @@
+"""
+💾 Fire Archive Snapshot
+Typed columnar snapshots of FIRMS CSV archives for fast startup
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Optional, Dict, List, Tuple
+import json
+import logging
+import os
+import shutil
+
+from src.adapters.repositories.fire_schema import apply_detection_schema
+
+logger = logging.getLogger(__name__)
+
+
+def encode_columns(df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], List[Dict]]:
+    """
+    Encode a typed DataFrame as plain NumPy arrays (no pickled objects)
+
+    Categorical and text columns become integer codes plus a `.values`
+    array of unique values; numeric columns are stored as-is.
+
+    Returns:
+        (arrays keyed by file stem, column specs for decode_columns)
+    """
+    arrays = {}
+    columns = []
+    for i, name in enumerate(df.columns):
+        file_stem = f"{i:02d}"
+        series = df[name]
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            if pd.api.types.is_numeric_dtype(categories.dtype):
+                categories = categories.to_numpy()
+            else:
+                categories = np.asarray(categories, dtype=str)
+            arrays[file_stem] = series.cat.codes.to_numpy()
+            arrays[f"{file_stem}.values"] = categories
+            kind = "category"
+        elif not pd.api.types.is_numeric_dtype(series.dtype):
+            codes, uniques = pd.factorize(series)
+            arrays[file_stem] = codes.astype(np.int32)
+            arrays[f"{file_stem}.values"] = np.asarray(uniques, dtype=str)
+            kind = "text"
+        else:
+            arrays[file_stem] = series.to_numpy()
+            kind = "numeric"
+
+        columns.append({"name": str(name), "file": file_stem, "kind": kind, "dtype": str(series.dtype)})
+
+    return arrays, columns
+
+
+def decode_columns(load, columns: List[Dict]) -> pd.DataFrame:
+    """
+    Rebuild a DataFrame from encode_columns output
+
+    Args:
+        load: Callable returning the array stored under a file stem
+        columns: Column specs from encode_columns
+    """
+    decoded_columns = {}
+    for column in columns:
+        values = load(column["file"])
+
+        if column["kind"] == "category":
+            values = pd.Categorical.from_codes(values, categories=load(f"{column['file']}.values"))
+        elif column["kind"] == "text":
+            uniques = load(f"{column['file']}.values")
+            decoded = np.full(len(values), np.nan, dtype=object)
+            valid = values >= 0
+            decoded[valid] = uniques.astype(object)[values[valid]]
+            values = decoded
+
+        decoded_columns[column["name"]] = values
+
+    return pd.DataFrame(decoded_columns)
+
+
+class FireArchiveSnapshot:
+    """
+    Columnar on-disk snapshot of FIRMS CSV archives
+
+    Each CSV gets a directory in the processed folder with one `.npy` file
+    per column plus a `manifest.json`. The manifest records the source
+    file size and mtime, so a snapshot is only used while the CSV is unchanged.
+    Columns are stored in the detection schema dtypes; categorical and text
+    columns are stored as integer codes + unique values.
+    """
+
+    VERSION = 2
+    MANIFEST = "manifest.json"
+
+    def __init__(self, processed_dir: str = "./data/processed"):
+        """
+        Initialize snapshot store
+
+        Args:
+            processed_dir: Directory where snapshots are written (default: ./data/processed)
+        """
+        self.processed_dir = processed_dir
+
+    def snapshot_path(self, csv_path: str) -> str:
+        """Snapshot directory for a CSV file"""
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        return os.path.join(self.processed_dir, name)
+
+    def _source_key(self, csv_path: str) -> Dict:
+        """Fingerprint of the source file (size + mtime)"""
+        stat = os.stat(csv_path)
+        return {
+            "filename": os.path.basename(csv_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
+
+    def _read_manifest(self, csv_path: str) -> Optional[Dict]:
+        manifest_path = os.path.join(self.snapshot_path(csv_path), self.MANIFEST)
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, csv_path: str) -> bool:
+        """Check if a snapshot exists and matches the current source file"""
+        manifest = self._read_manifest(csv_path)
+        if manifest is None or manifest.get("version") != self.VERSION:
+            return False
+        return manifest.get("source") == self._source_key(csv_path)
+
+    def load(self, csv_path: str) -> Optional[pd.DataFrame]:
+        """
+        Load snapshot for a CSV file
+
+        Args:
+            csv_path: Path of the source CSV
+
+        Returns:
+            DataFrame, or None if the snapshot is missing or stale
+        """
+        if not self.is_fresh(csv_path):
+            return None
+
+        manifest = self._read_manifest(csv_path)
+        snapshot_dir = self.snapshot_path(csv_path)
+
+        try:
+            return decode_columns(
+                lambda stem: np.load(os.path.join(snapshot_dir, f"{stem}.npy"), allow_pickle=False),
+                manifest["columns"]
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read snapshot {snapshot_dir}: {str(e)}")
+            return None
+
+    def write(self, csv_path: str, df: pd.DataFrame):
+        """
+        Write snapshot for a CSV file
+
+        Columns are written to a temporary directory which then replaces
+        the previous snapshot, so readers never see a partial snapshot.
+
+        Args:
+            csv_path: Path of the source CSV
+            df: Parsed contents of the CSV
+        """
+        snapshot_dir = self.snapshot_path(csv_path)
+        tmp_dir = f"{snapshot_dir}.tmp-{os.getpid()}"
+
+        try:
+            os.makedirs(self.processed_dir, exist_ok=True)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            os.makedirs(tmp_dir)
+
+            arrays, columns = encode_columns(df)
+            for file_stem, values in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{file_stem}.npy"), values)
+
+            manifest = {
+                "version": self.VERSION,
+                "source": self._source_key(csv_path),
+                "rows": len(df),
+                "columns": columns
+            }
+            with open(os.path.join(tmp_dir, self.MANIFEST), "w") as f:
+                json.dump(manifest, f, indent=2)
+
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            os.rename(tmp_dir, snapshot_dir)
+            logger.info(f"💾 Snapshot written: {snapshot_dir} ({len(df)} rows)")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write snapshot for {csv_path}: {str(e)}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def load_csv(self, csv_path: str) -> pd.DataFrame:
+        """
+        Load a FIRMS CSV, preferring a fresh snapshot
+
+        Parses the CSV, applies the detection schema and writes a new
+        snapshot when none is available.
+
+        Args:
+            csv_path: Path of the source CSV
+
+        Returns:
+            DataFrame with fire detections
+        """
+        df = self.load(csv_path)
+        if df is not None:
+            logger.info(f"⚡ Loaded {len(df)} fire detections from snapshot: {os.path.basename(csv_path)}")
+            return df
+
+        df = apply_detection_schema(pd.read_csv(csv_path))
+        self.write(csv_path, df)
+        return df
+
+
+def ingest_directory(data_dir: str = "./data/raw", processed_dir: str = "./data/processed") -> int:
+    """
+    Build snapshots for every CSV in a directory
+
+    Args:
+        data_dir: Directory containing FIRMS CSV archives
+        processed_dir: Directory where snapshots are written
+
+    Returns:
+        Number of snapshots (re)built
+    """
+    snapshot = FireArchiveSnapshot(processed_dir)
+    built = 0
+
+    if not os.path.exists(data_dir):
+        logger.warning(f"Data directory not found: {data_dir}")
+        return built
+
+    for csv_file in sorted(os.listdir(data_dir)):
+        if not csv_file.endswith('.csv'):
+            continue
+
+        csv_path = os.path.join(data_dir, csv_file)
+        if snapshot.is_fresh(csv_path):
+            logger.info(f"✅ Snapshot up to date: {csv_file}")
+            continue
+
+        logger.info(f"📥 Ingesting {csv_file}")
+        snapshot.write(csv_path, apply_detection_schema(pd.read_csv(csv_path)))
+        built += 1
+
+    return built
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    ingest_directory(
+        data_dir=os.getenv("HDF_DATA_DIR", "./data/raw"),
+        processed_dir=os.getenv("PROCESSED_DATA_DIR", "./data/processed")
+    )
@@ -0,0 +1,235 @@
+"""
+🗂️ Fire Detection Store
+Date-sorted in-memory detections with per-day offsets
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Optional, Tuple
+import logging
+
+from src.adapters.repositories.spatial_index import GridSpatialIndex
+from src.adapters.repositories.neighbour_index import NearestNeighbourIndex
+from src.adapters.repositories.hotspot_pyramid import HotspotPyramid, HotspotLevel
+from src.adapters.repositories.fire_schema import apply_detection_schema, append_detections
+
+logger = logging.getLogger(__name__)
+
+
+class FireDetectionStore:
+    """
+    Detections sorted by acquisition date
+
+    Rows of each day are contiguous, and `day_offsets[i]` holds the first
+    row of day `first_day + i` (the last entry is the row count). A date
+    window therefore maps to a single slice of the DataFrame without
+    scanning or copying the whole archive. A grid spatial index over the
+    same rows serves bounding-box lookups, a nearest-neighbour index
+    (built on first use) serves great-circle radius and k-NN lookups, and
+    a hotspot pyramid holds per-cell aggregates at a ladder of grid sizes.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build store from a typed detection DataFrame
+
+        Args:
+            df: DataFrame with `acq_date` as day numbers (see fire_schema)
+        """
+        if 'acq_date' in df.columns and len(df) > 0:
+            days = df['acq_date'].to_numpy()
+            if np.any(days[1:] < days[:-1]):
+                order = np.argsort(days, kind='stable')
+                df = df.iloc[order]
+            df = df.reset_index(drop=True)
+
+            days = df['acq_date'].to_numpy()
+            self.first_day = int(days[0])
+            self.last_day = int(days[-1])
+            self.day_offsets = np.searchsorted(
+                days, np.arange(self.first_day, self.last_day + 2), side='left'
+            )
+        else:
+            df = df.reset_index(drop=True)
+            self.first_day = None
+            self.last_day = None
+            self.day_offsets = None
+
+        self.df = df
+
+        if 'latitude' in df.columns and 'longitude' in df.columns:
+            self.spatial_index = GridSpatialIndex(df['latitude'].to_numpy(), df['longitude'].to_numpy())
+            self.hotspots = HotspotPyramid(
+                df['latitude'].to_numpy(),
+                df['longitude'].to_numpy(),
+                frp=df['frp'].to_numpy() if 'frp' in df.columns else None,
+                confidence=df['confidence'].to_numpy() if 'confidence' in df.columns else None
+            )
+        else:
+            self.spatial_index = None
+            self.hotspots = None
+
+        self._neighbour_index = None
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def append(self, rows: pd.DataFrame) -> "FireDetectionStore":
+        """
+        New store with detections added (this one is left untouched)
+
+        Only the new rows are parsed, sorted, bucketed and aggregated: day
+        offsets grow by the new rows' per-day counts, the rows join the
+        existing spatial grid buckets and their cell sums are merged into
+        the hotspot pyramid. Rows dated on or after the last stored day go
+        to the end; earlier ones are spliced in at their day. Stored rows
+        are never re-sorted, re-parsed or regrouped; what still scales with
+        the archive is copying its column arrays into the new DataFrame
+        (and, for spliced rows, one gather). The nearest-neighbour index is
+        rebuilt on first use, as for a fresh store.
+
+        Args:
+            rows: Detections to add (raw or typed)
+
+        Returns:
+            Store holding the stored and the new detections
+        """
+        if len(rows) == 0:
+            return self
+        if self.day_offsets is None or self.spatial_index is None or 'acq_date' not in rows.columns:
+            return FireDetectionStore(append_detections(self.df, rows))
+
+        rows = apply_detection_schema(rows)
+        days = rows['acq_date'].to_numpy()
+        if np.any(days[1:] < days[:-1]):
+            order = np.argsort(days, kind='stable')
+            rows = rows.iloc[order].reset_index(drop=True)
+            days = days[order]
+
+        n_old, n_new = len(self.df), len(rows)
+        df = append_detections(self.df, rows)
+
+        # Where each new row lands in day order
+        insert_at = np.searchsorted(self.df['acq_date'].to_numpy(), days, side='right')
+        if insert_at[0] == n_old:
+            new_rows, old_rows = np.arange(n_old, n_old + n_new), None
+        else:
+            new_rows = insert_at + np.arange(n_new)
+            old_rows = np.arange(n_old) + np.searchsorted(insert_at, np.arange(n_old), side='right')
+            placement = np.empty(n_old + n_new, dtype=np.int64)
+            placement[old_rows] = np.arange(n_old)
+            placement[new_rows] = np.arange(n_old, n_old + n_new)
+            df = df.take(placement).reset_index(drop=True)
+
+        first_day = min(self.first_day, int(days[0]))
+        last_day = max(self.last_day, int(days[-1]))
+        day_counts = np.bincount(days - first_day, minlength=last_day - first_day + 1)
+        day_counts[self.first_day - first_day:self.last_day - first_day + 1] += np.diff(self.day_offsets)
+
+        store = object.__new__(FireDetectionStore)
+        store.df = df
+        store.first_day = first_day
+        store.last_day = last_day
+        store.day_offsets = np.concatenate(([0], np.cumsum(day_counts)))
+        store.spatial_index = self.spatial_index.inserted(
+            df['latitude'].to_numpy(), df['longitude'].to_numpy(), new_rows, old_rows
+        )
+        store.hotspots = self.hotspots.appended(
+            rows['latitude'].to_numpy(),
+            rows['longitude'].to_numpy(),
+            frp=rows['frp'].to_numpy() if 'frp' in rows.columns else None,
+            confidence=rows['confidence'].to_numpy() if 'confidence' in rows.columns else None
+        )
+        store._neighbour_index = None
+        return store
+
+    def hotspot_level(self, cell_size: float) -> HotspotLevel:
+        """Hotspot aggregates for a grid size (see HotspotPyramid.level)"""
+        df = self.df
+        return self.hotspots.level(
+            cell_size,
+            df['latitude'].to_numpy(),
+            df['longitude'].to_numpy(),
+            frp=df['frp'].to_numpy() if 'frp' in df.columns else None,
+            confidence=df['confidence'].to_numpy() if 'confidence' in df.columns else None
+        )
+
+    def date_slice(self, start_day: Optional[int] = None, end_day: Optional[int] = None) -> slice:
+        """
+        Row slice covering a date window
+
+        Args:
+            start_day: First day number (inclusive), None for open start
+            end_day: Last day number (inclusive), None for open end
+
+        Returns:
+            Slice of rows acquired within the window
+        """
+        if self.day_offsets is None:
+            return slice(0, len(self.df))
+
+        n_days = len(self.day_offsets) - 1
+        start_idx = 0 if start_day is None else min(max(start_day - self.first_day, 0), n_days)
+        end_idx = n_days if end_day is None else min(max(end_day - self.first_day + 1, 0), n_days)
+
+        if end_idx <= start_idx:
+            return slice(0, 0)
+
+        return slice(int(self.day_offsets[start_idx]), int(self.day_offsets[end_idx]))
+
+    def date_window(self, start_day: Optional[int] = None, end_day: Optional[int] = None) -> pd.DataFrame:
+        """Detections acquired within a date window (view, no copy)"""
+        return self.df.iloc[self.date_slice(start_day, end_day)]
+
+    def query_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        rows: Optional[slice] = None
+    ) -> np.ndarray:
+        """
+        Row offsets inside a bounding box
+
+        Args:
+            min_lat, min_lon, max_lat, max_lon: Bounding box in degrees
+            rows: Optional row range (e.g. a date slice) to restrict to
+
+        Returns:
+            Sorted array of row offsets
+        """
+        if self.spatial_index is None:
+            return np.empty(0, dtype=np.int32)
+        return self.spatial_index.query_bbox(min_lat, min_lon, max_lat, max_lon, rows)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: Optional[int] = 100,
+        radius_km: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Closest detections to a point
+
+        Args:
+            lat: Latitude of the query point
+            lon: Longitude of the query point
+            k: Maximum number of detections (None = all within radius_km)
+            radius_km: Great-circle search radius in km (None = unbounded k-NN)
+
+        Returns:
+            (row offsets, distances in km), closest first
+        """
+        if self.spatial_index is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        if self._neighbour_index is None:
+            self._neighbour_index = NearestNeighbourIndex(
+                self.df['latitude'].to_numpy(),
+                self.df['longitude'].to_numpy(),
+                grid=self.spatial_index
+            )
+
+        return self._neighbour_index.query(lat, lon, k=k, radius_km=radius_km)
@@ -0,0 +1,124 @@
+"""
+🗺️ Fire Tiles
+Web-Mercator (slippy map) tiles of fire detections
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Tuple, List, Dict
+import json
+
+from src.adapters.repositories.fire_serializers import (
+    COORD_DECIMALS, VALUE_DECIMALS, fire_point_feature_json, iter_feature_collection
+)
+from src.adapters.repositories.grid_aggregation import CellAggregation
+
+MAX_ZOOM = 22
+MAX_LATITUDE = 85.0511287798  # Web-Mercator latitude limit
+
+# Below this zoom (or above TILE_MAX_POINTS detections) tiles carry aggregates
+TILE_DETAIL_ZOOM = 6
+TILE_MAX_POINTS = 5000
+TILE_GRID_CELLS = 64  # aggregate cells per tile side
+
+
+def valid_tile(z: int, x: int, y: int) -> bool:
+    """Check tile coordinates are inside the zoom level"""
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """
+    Geographic bounds of a tile
+
+    Returns:
+        (min_lat, min_lon, max_lat, max_lon) in degrees
+    """
+    n = 2 ** z
+    min_lon = x / n * 360.0 - 180.0
+    max_lon = (x + 1) / n * 360.0 - 180.0
+    max_lat = float(np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y / n)))))
+    min_lat = float(np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + 1) / n)))))
+    return (min_lat, min_lon, max_lat, max_lon)
+
+
+def tile_pixels(lat: np.ndarray, lon: np.ndarray, z: int, x: int, y: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Web-Mercator pixel position of points within a tile
+
+    Args:
+        size: Pixels per tile side
+
+    Returns:
+        (column, row) integer arrays clipped to 0..size-1
+    """
+    n = 2 ** z
+    lat = np.radians(np.clip(np.asarray(lat, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE))
+    lon = np.asarray(lon, dtype=np.float64)
+    px = ((lon + 180.0) / 360.0 * n - x) * size
+    py = ((1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / np.pi) / 2 * n - y) * size
+    col = np.clip(np.floor(px), 0, size - 1).astype(np.int64)
+    row = np.clip(np.floor(py), 0, size - 1).astype(np.int64)
+    return col, row
+
+
+def tile_aggregate_features(df: pd.DataFrame, z: int, x: int, y: int, cells: int = TILE_GRID_CELLS) -> List[str]:
+    """
+    Aggregate detections to a cells x cells grid over the tile
+
+    Each non-empty cell becomes one Point feature at the mean position of
+    its detections with count, FRP and confidence summaries.
+
+    Returns:
+        List of Feature JSON strings
+    """
+    if len(df) == 0:
+        return []
+
+    lat = df['latitude'].to_numpy(dtype=np.float64)
+    lon = df['longitude'].to_numpy(dtype=np.float64)
+    col, row = tile_pixels(lat, lon, z, x, y, cells)
+    groups = CellAggregation(row * cells + col)
+
+    count = groups.count
+    mean_lat = groups.mean(lat)
+    mean_lon = groups.mean(lon)
+    frp = df['frp'].to_numpy(dtype=np.float64) if 'frp' in df.columns else np.zeros(len(df))
+    total_frp = groups.sum(np.nan_to_num(frp))
+    confidence = df['confidence'].to_numpy(dtype=np.float64) if 'confidence' in df.columns else np.zeros(len(df))
+    avg_confidence = groups.mean(confidence)
+
+    return [
+        json.dumps({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lo, la]},
+            "properties": {"count": n, "total_frp": total, "avg_frp": avg, "avg_confidence": conf}
+        }, separators=(",", ":"))
+        for la, lo, n, total, avg, conf in zip(
+            np.round(mean_lat, COORD_DECIMALS).tolist(),
+            np.round(mean_lon, COORD_DECIMALS).tolist(),
+            count.tolist(),
+            np.round(total_frp, VALUE_DECIMALS).tolist(),
+            np.round(total_frp / count, VALUE_DECIMALS).tolist(),
+            np.round(avg_confidence, VALUE_DECIMALS).tolist()
+        )
+    ]
+
+
+def fire_tile_geojson(df: pd.DataFrame, z: int, x: int, y: int) -> bytes:
+    """
+    Encode the detections of one tile as a GeoJSON FeatureCollection
+
+    Low zoom levels and crowded tiles are aggregated (see TILE_DETAIL_ZOOM,
+    TILE_MAX_POINTS); otherwise each detection is a feature.
+
+    Args:
+        df: Typed detections already restricted to the tile bounds
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    aggregated = z < TILE_DETAIL_ZOOM or len(df) > TILE_MAX_POINTS
+    features = tile_aggregate_features(df, z, x, y) if aggregated else fire_point_feature_json(df)
+    properties: Dict = {"z": z, "x": x, "y": y, "count": len(df), "aggregated": aggregated}
+    return b"".join(iter_feature_collection([features], properties))
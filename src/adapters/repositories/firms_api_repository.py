@@ -4,15 +4,30 @@ Fetches fire detection data from NASA FIRMS (Fire Information for Resource Manag
 API Documentation: https://firms.modaps.eosdis.nasa.gov/api/
 """
 
-import requests
 import pandas as pd
-import numpy as np
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple, Iterator
+from datetime import datetime
 import logging
 import io
-import time
+import json
 import os
+import threading
+
+from src.adapters.repositories.fire_snapshot import FireArchiveSnapshot
+from src.adapters.repositories.fire_store import FireDetectionStore
+from src.adapters.repositories.firms_fetcher import FirmsFetcher, ChunkRequest, date_range_chunks, FIRMS_BASE_URL
+from src.adapters.repositories.firms_chunk_cache import FirmsChunkCache, is_detection_frame
+from src.adapters.repositories.dedup_index import DedupIndex
+from src.adapters.repositories.detection_fusion import fuse_detections, FUSION_DISTANCE_KM, FUSION_WINDOW_MINUTES
+from src.adapters.repositories.neighbour_index import KM_PER_DEGREE
+from src.adapters.repositories.fire_tiles import tile_bounds, fire_tile_geojson
+from src.adapters.repositories.fire_serializers import (
+    fire_point_features, fire_detail_records, hotspot_records, write_feature_collection,
+    iter_fire_point_feature_json, iter_feature_collection, iter_ndjson, fire_points_binary
+)
+from src.adapters.repositories.fire_schema import (
+    apply_detection_schema, date_to_day, day_to_date, days_to_dates
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +36,7 @@ class FirmsAPIRepository:
     """Repository for NASA FIRMS API fire data"""
     
     # API Configuration
-    BASE_URL = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
+    BASE_URL = FIRMS_BASE_URL
     API_KEY = "f88006d36b850babbc1dbd32ed0c394a"
     
     # Data sources
@@ -31,20 +46,133 @@ class FirmsAPIRepository:
         "VIIRS_NOAA20_SP": "VIIRS NOAA-20 - South America"
     }
     
-    def __init__(self, cache_data: bool = True, data_dir: str = "./data/raw"):
+    # Source of the local archive (MODIS Collection 6.1 standard product)
+    LOCAL_CSV_SOURCE = "MODIS_SP"
+    
+    def __init__(
+        self,
+        cache_data: bool = True,
+        data_dir: str = "./data/raw",
+        processed_dir: str = "./data/processed",
+        cache_dir: Optional[str] = "./data/cache",
+        base_url: Optional[str] = None,
+        fetcher: Optional[FirmsFetcher] = None,
+        fusion_distance_km: Optional[float] = FUSION_DISTANCE_KM,
+        fusion_window_minutes: int = FUSION_WINDOW_MINUTES
+    ):
         """
         Initialize FIRMS API repository
         
         Args:
             cache_data: Whether to cache data in memory (default: True)
             data_dir: Directory containing local CSV files (default: ./data/raw)
+            processed_dir: Directory for columnar CSV snapshots (default: ./data/processed)
+            cache_dir: Directory for cached API chunks (default: ./data/cache, None to disable)
+            base_url: FIRMS area CSV endpoint (default: BASE_URL, e.g. a local stub for tests)
+            fetcher: Fetch engine (default: FirmsFetcher with FIRMS quota limits)
+            fusion_distance_km: Distance within which detections of different
+                sources are fused into one (default: 1 km, None to disable)
+            fusion_window_minutes: Acquisition time window for fusion (default: 60)
         """
         self.cache_data = cache_data
         self.data_dir = data_dir
+        self.snapshot = FireArchiveSnapshot(processed_dir)
+        self.chunk_cache = FirmsChunkCache(cache_dir) if cache_dir else None
+        self.fetcher = fetcher or FirmsFetcher(self.API_KEY, base_url=base_url or self.BASE_URL)
+        self.fusion_distance_km = fusion_distance_km
+        self.fusion_window_minutes = fusion_window_minutes
+        # Sources of the last fused load, highest priority first (see refresh_data)
+        self._fusion_sources = None
+        self._write_lock = threading.RLock()
+        # Dedup index of the detections in `_dedup_store` (see _dedup_index)
+        self._dedup = None
+        self._dedup_store = None
         self.df = None
         self._last_fetch = None
         logger.info("🛰️ NASA FIRMS API Repository initialized")
     
+    # `store` is immutable and replaced as a whole (one reference assignment),
+    # so a reader that takes `store = self.store` once sees a consistent
+    # dataset even while a refresh builds the next one.
+    
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """Detections DataFrame (date-sorted, see FireDetectionStore)"""
+        store = self.store
+        return store.df if store is not None else None
+    
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]):
+        self.store = FireDetectionStore(value) if value is not None else None
+    
+    def _dedup_index(self, store: Optional[FireDetectionStore]) -> DedupIndex:
+        """
+        Dedup index over the detections of `store`
+        
+        Kept across refreshes, so only new batches are hashed; rebuilt from
+        the store only when the dataset was replaced some other way.
+        Callers hold the write lock.
+        """
+        if self._dedup is None or self._dedup_store is not store:
+            self._dedup = DedupIndex.from_frame(store.df if store is not None else None)
+            self._dedup_store = store
+        return self._dedup
+    
+    def fetch_chunks(self, chunks: List[ChunkRequest]) -> List[pd.DataFrame]:
+        """
+        Fetch FIRMS chunk requests concurrently (see FirmsFetcher)
+        
+        Settled chunks are served from the on-disk chunk cache when present;
+        the rest are downloaded and, once settled, written to it. Responses
+        that are not detection tables (error bodies) are skipped and never
+        cached.
+        
+        Args:
+            chunks: Chunk requests, possibly spanning several sources
+            
+        Returns:
+            Typed DataFrame per chunk that returned data, in request order
+        """
+        results = {}
+        missing = []
+        for request in chunks:
+            cached = self.chunk_cache.get(request) if self.chunk_cache is not None else None
+            if cached is not None:
+                results[request] = cached
+            else:
+                missing.append(request)
+        
+        if len(missing) < len(chunks):
+            logger.info(f"🗄️ {len(chunks) - len(missing)} of {len(chunks)} chunks served from disk cache")
+        
+        for request, df in (self.fetcher.fetch_all(missing) if missing else []):
+            if df is None:
+                # Failed after retries; continue with the other chunks
+                continue
+            if not is_detection_frame(df):
+                # HTTP 200 with an error body (quota exceeded, invalid MAP_KEY): not cached
+                logger.warning(f"⚠️ Unexpected response for {request.source} {request.start_date or 'latest'}, skipping chunk")
+                continue
+            if df.empty:
+                logger.warning(f"⚠️ No data returned for {request.source} {request.start_date or 'latest'}")
+            if self.chunk_cache is not None:
+                self.chunk_cache.put(request, df)
+            results[request] = df
+        
+        # Tag rows with their source, part of the dedup key
+        return [
+            results[request].assign(source=pd.Categorical([request.source] * len(results[request])))
+            for request in chunks
+            if request in results and not results[request].empty
+        ]
+    
+    def _within_dates(self, df: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+        """Rows acquired between two dates (inclusive)"""
+        if 'acq_date' not in df.columns:
+            return df
+        days = df['acq_date'].to_numpy()
+        return df[(days >= date_to_day(start_date)) & (days <= date_to_day(end_date))].reset_index(drop=True)
+    
     def fetch_date_range(
         self,
         start_date: str,
@@ -64,52 +192,16 @@ class FirmsAPIRepository:
         Returns:
             DataFrame with fire detections
         """
-        # Parse dates
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        # FIRMS API limits to 10 days per request: fetch the chunks concurrently
+        # (aligned blocks, so overlapping ranges share cached chunks)
+        chunks = date_range_chunks(start_date, end_date, source=source, area=area, aligned=True)
+        logger.info(f"📡 Fetching {source} data from {start_date} to {end_date} ({len(chunks)} chunks)")
         
-        # FIRMS API limits to 10 days per request
-        # We need to split into chunks
-        all_data = []
-        current = start
-        
-        while current <= end:
-            # Calculate chunk end (max 10 days)
-            chunk_end = min(current + timedelta(days=9), end)
-            
-            # Calculate days difference
-            days = (chunk_end - current).days + 1
-            
-            # Build API URL
-            url = f"{self.BASE_URL}/{self.API_KEY}/{source}/{area}/{days}/{current.strftime('%Y-%m-%d')}"
-            
-            logger.info(f"📡 Fetching {source} data from {current.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}")
-            
-            try:
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse CSV response
-                if response.text.strip():
-                    df_chunk = pd.read_csv(io.StringIO(response.text))
-                    all_data.append(df_chunk)
-                    logger.info(f"✅ Fetched {len(df_chunk)} fire detections")
-                else:
-                    logger.warning(f"⚠️ No data returned for {current.strftime('%Y-%m-%d')}")
-                
-                # Rate limiting - be nice to NASA's servers
-                time.sleep(1)
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"❌ Error fetching data: {str(e)}")
-                # Continue with next chunk even if one fails
-            
-            # Move to next chunk
-            current = chunk_end + timedelta(days=1)
+        all_data = self.fetch_chunks(chunks)
         
         # Combine all chunks
         if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
+            combined_df = self._within_dates(apply_detection_schema(pd.concat(all_data, ignore_index=True)), start_date, end_date)
             logger.info(f"🎉 Total fire detections fetched: {len(combined_df)}")
             return combined_df
         else:
@@ -130,24 +222,15 @@ class FirmsAPIRepository:
         if days < 1 or days > 10:
             raise ValueError("Days must be between 1 and 10")
         
-        url = f"{self.BASE_URL}/{self.API_KEY}/{source}/world/{days}"
-        
         logger.info(f"📡 Fetching last {days} days of {source} data")
         
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            if response.text.strip():
-                df = pd.read_csv(io.StringIO(response.text))
-                logger.info(f"✅ Fetched {len(df)} fire detections")
-                return df
-            else:
-                logger.warning("⚠️ No data returned")
-                return pd.DataFrame()
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Error fetching data: {str(e)}")
+        frames = self.fetch_chunks([ChunkRequest(source, "world", days)])
+        
+        if frames:
+            logger.info(f"✅ Fetched {len(frames[0])} fire detections")
+            return frames[0]
+        else:
+            logger.warning("⚠️ No data returned")
             return pd.DataFrame()
     
     def _load_from_local_csv(self, csv_filename: str = "fire_archive_M-C61_669832.csv") -> pd.DataFrame:
@@ -168,7 +251,7 @@ class FirmsAPIRepository:
         
         try:
             logger.info(f"📂 Loading data from local CSV: {csv_filename}")
-            df = pd.read_csv(csv_path)
+            df = self.snapshot.load_csv(csv_path)
             logger.info(f"✅ Loaded {len(df)} fire detections from local file")
             return df
         except Exception as e:
@@ -188,7 +271,7 @@ class FirmsAPIRepository:
         Args:
             start_date: Start date (default: 2004-07-22)
             end_date: End date (default: 2004-12-04)
-            sources: List of sources to fetch (default: MODIS_SP only)
+            sources: List of sources to fetch, highest fusion priority first (default: MODIS_SP only)
             use_local_csv: Force use of local CSV (auto-detect if None)
         """
         if sources is None:
@@ -208,52 +291,118 @@ class FirmsAPIRepository:
             if not df.empty:
                 # Filter by date range
                 if 'acq_date' in df.columns:
-                    df = df[(df['acq_date'] >= start_date) & (df['acq_date'] <= end_date)]
+                    df = df[(df['acq_date'] >= date_to_day(start_date)) & (df['acq_date'] <= date_to_day(end_date))]
                     logger.info(f"🔍 Filtered to date range: {len(df)} detections")
                 
-                self.df = df
+                # Same source tag as API chunks, so refreshed rows dedup against it
+                self.df = df.assign(source=pd.Categorical([self.LOCAL_CSV_SOURCE] * len(df)))
                 self._last_fetch = datetime.now()
                 logger.info(f"✅ Historical data loaded from CSV: {len(self.df)} fire detections")
             else:
                 logger.error("❌ Failed to load data from CSV")
                 self.df = pd.DataFrame()
         else:
-            # Fetch from NASA FIRMS API
-            all_dfs = []
-            for source in sources:
-                logger.info(f"📡 Fetching {source} data from NASA FIRMS API...")
-                df = self.fetch_date_range(start_date, end_date, source=source)
-                if not df.empty:
-                    all_dfs.append(df)
+            # Fetch from NASA FIRMS API (all sources' chunks in one concurrent batch)
+            chunks = [
+                chunk
+                for source in sources
+                for chunk in date_range_chunks(start_date, end_date, source=source, aligned=True)
+            ]
+            logger.info(f"📡 Fetching {', '.join(sources)} data from NASA FIRMS API ({len(chunks)} chunks)...")
+            all_dfs = self.fetch_chunks(chunks)
             
             if all_dfs:
-                self.df = pd.concat(all_dfs, ignore_index=True)
+                df = self._within_dates(apply_detection_schema(pd.concat(all_dfs, ignore_index=True)), start_date, end_date)
+                
+                # Remove duplicates (same location, date, time, source), keeping the
+                # index so later refreshes only hash their own rows
+                index = DedupIndex()
+                initial_count = len(df)
+                df = df[index.add(df)].reset_index(drop=True)
+                duplicates_removed = initial_count - len(df)
+                if duplicates_removed > 0:
+                    logger.info(f"🧹 Removed {duplicates_removed} duplicate detections")
                 
-                # Remove duplicates (same location, date, time)
-                if not self.df.empty:
-                    initial_count = len(self.df)
-                    self.df = self.df.drop_duplicates(
-                        subset=['latitude', 'longitude', 'acq_date', 'acq_time'],
-                        keep='first'
-                    )
-                    duplicates_removed = initial_count - len(self.df)
-                    if duplicates_removed > 0:
-                        logger.info(f"🧹 Removed {duplicates_removed} duplicate detections")
+                # Fuse the same fire seen by several sensors (sources listed first win)
+                if len(sources) > 1 and self.fusion_distance_km:
+                    initial_count = len(df)
+                    df = fuse_detections(df, self.fusion_distance_km, self.fusion_window_minutes, priority=sources)
+                    logger.info(f"🔗 Fused {initial_count - len(df)} multi-sensor detections")
+                    self._fusion_sources = list(sources)
                 
+                self.df = df
+                self._dedup, self._dedup_store = index, self.store
                 self._last_fetch = datetime.now()
                 logger.info(f"✅ Historical data loaded from API: {len(self.df)} fire detections")
             else:
                 logger.error("❌ Failed to load historical data from API")
                 self.df = pd.DataFrame()
     
-    def _ensure_data_loaded(self):
-        """Lazy load data if not already loaded"""
-        if self.df is None or self.df.empty:
-            logger.info("📂 Lazy loading fire data from CSV...")
-            self.load_historical_data(
-                start_date="2004-07-22",
-                end_date="2004-12-04"
-            )
+    def _ensure_data_loaded(self) -> Optional[FireDetectionStore]:
+        """Lazy load data if not already loaded, returning the current store"""
+        store = self.store
+        if store is not None and len(store) > 0:
+            return store
+        
+        with self._write_lock:
+            if self.store is None or len(self.store) == 0:
+                logger.info("📂 Lazy loading fire data from CSV...")
+                self.load_historical_data(
+                    start_date="2004-07-22",
+                    end_date="2004-12-04"
+                )
+            return self.store
+    
+    def select_fire_points(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Select fire detections for mapping
+        
+        Args:
+            max_points: Maximum points to return (None/0 = no limit)
+            min_confidence: Minimum confidence (0-100)
+            start_date: Start date filter (YYYY-MM-DD)
+            end_date: End date filter (YYYY-MM-DD)
+            bbox: Bounding box (min_lat, min_lon, max_lat, max_lon)
+            
+        Returns:
+            (selected detections, number of matches before sampling)
+        """
+        store = self._ensure_data_loaded()
+        
+        if store is None or len(store) == 0:
+            return pd.DataFrame(), 0
+        
+        # Date window: contiguous slice of the date-sorted store (no copy)
+        rows = store.date_slice(
+            date_to_day(start_date) if start_date else None,
+            date_to_day(end_date) if end_date else None
+        )
+        
+        # Bounding box filter (grid spatial index, restricted to the date window)
+        if bbox:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            rows = store.query_bbox(min_lat, min_lon, max_lat, max_lon, rows=rows)
+        
+        filtered = store.df.iloc[rows]
+        
+        # Confidence filter
+        if 'confidence' in filtered.columns:
+            filtered = filtered[filtered['confidence'] >= min_confidence]
+        
+        # Sample if too many points
+        filtered_count = len(filtered)
+        if max_points and filtered_count > max_points:
+            filtered = filtered.sample(n=max_points, random_state=42)
+            logger.info(f"Sampled {max_points} from {filtered_count} points")
+        
+        return filtered, filtered_count
     
     def get_fire_points_geojson(
         self,
@@ -276,7 +425,7 @@ class FirmsAPIRepository:
         Returns:
             GeoJSON FeatureCollection
         """
-        self._ensure_data_loaded()
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
         
         if self.df is None or len(self.df) == 0:
             return {
@@ -285,57 +434,8 @@ class FirmsAPIRepository:
                 "properties": {"count": 0, "message": "No data available"}
             }
         
-        # Filter data
-        filtered = self.df.copy()
-        
-        # Confidence filter
-        if 'confidence' in filtered.columns:
-            filtered = filtered[filtered['confidence'] >= min_confidence]
-        
-        # Date filters
-        if start_date and 'acq_date' in filtered.columns:
-            filtered = filtered[filtered['acq_date'] >= start_date]
-        
-        if end_date and 'acq_date' in filtered.columns:
-            filtered = filtered[filtered['acq_date'] <= end_date]
-        
-        # Bounding box filter
-        if bbox:
-            min_lat, min_lon, max_lat, max_lon = bbox
-            filtered = filtered[
-                (filtered['latitude'] >= min_lat) &
-                (filtered['latitude'] <= max_lat) &
-                (filtered['longitude'] >= min_lon) &
-                (filtered['longitude'] <= max_lon)
-            ]
-        
-        # Sample if too many points
-        if max_points and len(filtered) > max_points:
-            filtered = filtered.sample(n=max_points, random_state=42)
-            logger.info(f"Sampled {max_points} from {len(filtered)} points")
-        
-        # Convert to GeoJSON
-        features = []
-        for _, row in filtered.iterrows():
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [float(row['longitude']), float(row['latitude'])]
-                },
-                "properties": {
-                    "brightness": float(row.get('brightness', 0)),
-                    "confidence": int(row.get('confidence', 0)),
-                    "frp": float(row.get('frp', 0)),
-                    "acq_date": str(row.get('acq_date', '')),
-                    "acq_time": str(row.get('acq_time', '')),
-                    "satellite": str(row.get('satellite', '')),
-                    "instrument": str(row.get('instrument', '')),
-                    "daynight": str(row.get('daynight', '')),
-                    "type": int(row.get('type', 0))
-                }
-            }
-            features.append(feature)
+        # Convert to GeoJSON (column-wise)
+        features = fire_point_features(points)
         
         return {
             "type": "FeatureCollection",
@@ -343,60 +443,182 @@ class FirmsAPIRepository:
             "properties": {
                 "count": len(features),
                 "total_available": len(self.df),
-                "filtered_count": len(filtered)
+                "filtered_count": filtered_count
             }
         }
     
+    def get_fire_points_geojson_bytes(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> bytes:
+        """
+        Get fire points as encoded GeoJSON (same content as get_fire_points_geojson)
+        
+        Returns:
+            UTF-8 JSON bytes of the FeatureCollection
+        """
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        
+        if self.df is None or len(self.df) == 0:
+            return json.dumps({
+                "type": "FeatureCollection",
+                "features": [],
+                "properties": {"count": 0, "message": "No data available"}
+            }, separators=(",", ":")).encode()
+        
+        buffer = io.BytesIO()
+        write_feature_collection(buffer, points, properties={
+            "count": len(points),
+            "total_available": len(self.df),
+            "filtered_count": filtered_count
+        })
+        return buffer.getvalue()
+    
+    def get_fire_points_binary(
+        self,
+        max_points: Optional[int] = 5000,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> bytes:
+        """
+        Get fire points in the packed binary layout (see fire_serializers)
+        
+        Returns:
+            Header + 15-byte lon/lat/frp/confidence/day records
+        """
+        points, _ = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        return fire_points_binary(points)
+    
+    def get_fire_tile(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> bytes:
+        """
+        Get the fire detections of one Web-Mercator tile
+        
+        Args:
+            z, x, y: Slippy-map tile coordinates
+            min_confidence: Minimum confidence (0-100)
+            start_date: Start date filter (YYYY-MM-DD)
+            end_date: End date filter (YYYY-MM-DD)
+            
+        Returns:
+            GeoJSON FeatureCollection bytes (aggregated at low zoom, see fire_tiles)
+        """
+        points, _ = self.select_fire_points(None, min_confidence, start_date, end_date, bbox=tile_bounds(z, x, y))
+        return fire_tile_geojson(points, z, x, y)
+    
+    def stream_fire_points(
+        self,
+        format: str = "geojson",
+        max_points: Optional[int] = None,
+        min_confidence: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        bbox: Optional[tuple] = None
+    ) -> Iterator[bytes]:
+        """
+        Encode fire points incrementally for large exports
+        
+        Detections are selected up front; features are then encoded and
+        yielded chunk by chunk, so the full feature list is never held in memory.
+        
+        Args:
+            format: 'geojson' (FeatureCollection) or 'ndjson' (one Feature per line)
+            max_points: Maximum points to return (None/0 = no limit)
+            
+        Returns:
+            Iterator of UTF-8 byte chunks
+        """
+        points, filtered_count = self.select_fire_points(max_points, min_confidence, start_date, end_date, bbox)
+        chunks = iter_fire_point_feature_json(points)
+        
+        if format == "ndjson":
+            return iter_ndjson(chunks)
+        
+        return iter_feature_collection(chunks, properties={
+            "count": len(points),
+            "total_available": len(self.df) if self.df is not None else 0,
+            "filtered_count": filtered_count
+        })
+    
     def get_statistics(self) -> Dict:
         """Get overall statistics from fire data"""
-        self._ensure_data_loaded()
+        store = self._ensure_data_loaded()
         
-        if self.df is None or len(self.df) == 0:
+        if store is None or len(store) == 0:
             return {"error": "No data available"}
         
+        df = store.df
         stats = {
-            "total_detections": len(self.df),
+            "total_detections": len(df),
             "date_range": {
-                "start": str(self.df['acq_date'].min()) if 'acq_date' in self.df.columns else None,
-                "end": str(self.df['acq_date'].max()) if 'acq_date' in self.df.columns else None
+                "start": day_to_date(df['acq_date'].min()) if 'acq_date' in df.columns else None,
+                "end": day_to_date(df['acq_date'].max()) if 'acq_date' in df.columns else None
             },
             "geographic_extent": {
-                "min_lat": float(self.df['latitude'].min()),
-                "max_lat": float(self.df['latitude'].max()),
-                "min_lon": float(self.df['longitude'].min()),
-                "max_lon": float(self.df['longitude'].max())
+                "min_lat": round(float(df['latitude'].min()), 4),
+                "max_lat": round(float(df['latitude'].max()), 4),
+                "min_lon": round(float(df['longitude'].min()), 4),
+                "max_lon": round(float(df['longitude'].max()), 4)
             },
             "brightness": {
-                "mean": float(self.df['brightness'].mean()) if 'brightness' in self.df.columns else None,
-                "max": float(self.df['brightness'].max()) if 'brightness' in self.df.columns else None
+                "mean": round(float(df['brightness'].mean()), 2) if 'brightness' in df.columns else None,
+                "max": round(float(df['brightness'].max()), 2) if 'brightness' in df.columns else None
             },
             "frp": {
-                "mean": float(self.df['frp'].mean()) if 'frp' in self.df.columns else None,
-                "max": float(self.df['frp'].max()) if 'frp' in self.df.columns else None,
-                "total": float(self.df['frp'].sum()) if 'frp' in self.df.columns else None
+                "mean": round(float(df['frp'].mean()), 2) if 'frp' in df.columns else None,
+                "max": round(float(df['frp'].max()), 2) if 'frp' in df.columns else None,
+                "total": round(float(df['frp'].sum()), 2) if 'frp' in df.columns else None
             },
             "confidence": {
-                "mean": float(self.df['confidence'].mean()) if 'confidence' in self.df.columns else None,
-                "high_confidence": int((self.df['confidence'] >= 80).sum()) if 'confidence' in self.df.columns else None,
-                "medium_confidence": int(((self.df['confidence'] >= 50) & (self.df['confidence'] < 80)).sum()) if 'confidence' in self.df.columns else None,
-                "low_confidence": int((self.df['confidence'] < 50).sum()) if 'confidence' in self.df.columns else None
+                "mean": float(df['confidence'].mean()) if 'confidence' in df.columns else None,
+                "high_confidence": int((df['confidence'] >= 80).sum()) if 'confidence' in df.columns else None,
+                "medium_confidence": int(((df['confidence'] >= 50) & (df['confidence'] < 80)).sum()) if 'confidence' in df.columns else None,
+                "low_confidence": int((df['confidence'] < 50).sum()) if 'confidence' in df.columns else None
             },
-            "satellites": self.df['satellite'].value_counts().to_dict() if 'satellite' in self.df.columns else {},
-            "day_night": self.df['daynight'].value_counts().to_dict() if 'daynight' in self.df.columns else {}
+            "satellites": self._value_counts(df, 'satellite'),
+            "day_night": self._value_counts(df, 'daynight')
         }
         
         return stats
     
+    def _value_counts(self, df: pd.DataFrame, column: str) -> Dict:
+        """Value counts of a categorical column, without unused categories"""
+        if column not in df.columns:
+            return {}
+        counts = df[column].value_counts()
+        return {str(k): int(v) for k, v in counts[counts > 0].items()}
+    
     def get_temporal_analysis(self) -> Dict:
         """Analyze fire detections over time"""
-        self._ensure_data_loaded()
+        store = self._ensure_data_loaded()
         
-        if self.df is None or len(self.df) == 0 or 'acq_date' not in self.df.columns:
+        if store is None or len(store) == 0 or 'acq_date' not in store.df.columns:
             return {"error": "No temporal data available"}
         
+        df = store.df
+        
         # Group by date
-        daily_counts = self.df.groupby('acq_date').size().reset_index(name='count')
-        daily_frp = self.df.groupby('acq_date')['frp'].sum().reset_index(name='total_frp') if 'frp' in self.df.columns else None
+        daily_counts = df.groupby('acq_date').size().reset_index(name='count')
+        daily_frp = df.groupby('acq_date')['frp'].sum().reset_index(name='total_frp') if 'frp' in df.columns else None
+        
+        # Day numbers back to YYYY-MM-DD
+        daily_counts['acq_date'] = days_to_dates(daily_counts['acq_date'])
+        if daily_frp is not None:
+            daily_frp['acq_date'] = days_to_dates(daily_frp['acq_date'])
+            daily_frp['total_frp'] = daily_frp['total_frp'].astype(float).round(2)
         
         # Find peak days
         peak_day = daily_counts.loc[daily_counts['count'].idxmax()]
@@ -422,109 +644,137 @@ class FirmsAPIRepository:
         Returns:
             List of hotspot clusters
         """
-        self._ensure_data_loaded()
+        store = self._ensure_data_loaded()
         
-        if self.df is None or len(self.df) == 0:
+        if store is None or len(store) == 0 or store.hotspots is None:
             return []
         
-        # Create grid cells
-        df_copy = self.df.copy()
-        df_copy['lat_cell'] = (df_copy['latitude'] / grid_size).round() * grid_size
-        df_copy['lon_cell'] = (df_copy['longitude'] / grid_size).round() * grid_size
-        
-        # Group by grid cell
-        clusters = df_copy.groupby(['lat_cell', 'lon_cell']).agg({
-            'latitude': 'mean',
-            'longitude': 'mean',
-            'frp': ['sum', 'mean', 'count'],
-            'confidence': 'mean'
-        }).reset_index()
-        
-        # Flatten column names
-        clusters.columns = ['lat_cell', 'lon_cell', 'lat', 'lon', 'total_frp', 'avg_frp', 'count', 'avg_confidence']
-        
-        # Sort by count
-        clusters = clusters.sort_values('count', ascending=False)
-        
-        # Convert to list of dicts
-        hotspots = []
-        for _, row in clusters.head(50).iterrows():  # Top 50 hotspots
-            hotspots.append({
-                "lat": float(row['lat']),
-                "lon": float(row['lon']),
-                "fire_count": int(row['count']),
-                "total_frp": float(row['total_frp']),
-                "avg_frp": float(row['avg_frp']),
-                "avg_confidence": float(row['avg_confidence']),
-                "intensity": "high" if row['count'] > 100 else "medium" if row['count'] > 50 else "low"
-            })
-        
-        return hotspots
+        # Precomputed pyramid level (aggregated on demand for other sizes)
+        top = store.hotspot_level(grid_size).top(50)
+        return hotspot_records(
+            top.lat, top.lon, top.count,
+            top.total_frp, top.avg_frp, top.avg_confidence
+        )
     
-    def get_fire_details(self, lat: float, lon: float, radius: float = 0.1) -> List[Dict]:
+    def get_fire_details(
+        self,
+        lat: float,
+        lon: float,
+        radius: Optional[float] = 0.1,
+        k: Optional[int] = 100,
+        radius_km: Optional[float] = None
+    ) -> List[Dict]:
         """
-        Get detailed fire information near a point
+        Get detailed fire information near a point, closest first
         
         Args:
             lat: Latitude
             lon: Longitude
-            radius: Search radius in degrees
+            radius: Search radius in great-circle degrees (ignored if radius_km is set)
+            k: Maximum number of detections (None = all within radius)
+            radius_km: Search radius in km (None and radius None = unbounded k-NN)
             
         Returns:
-            List of nearby fire detections
+            List of nearby fire detections with distance_km
         """
-        self._ensure_data_loaded()
+        store = self._ensure_data_loaded()
         
-        if self.df is None or len(self.df) == 0:
+        if store is None or len(store) == 0:
             return []
         
-        # Filter by distance
-        nearby = self.df[
-            (self.df['latitude'] >= lat - radius) &
-            (self.df['latitude'] <= lat + radius) &
-            (self.df['longitude'] >= lon - radius) &
-            (self.df['longitude'] <= lon + radius)
-        ]
+        if radius_km is None and radius is not None:
+            radius_km = radius * KM_PER_DEGREE
         
-        # Convert to list
-        fires = []
-        for _, row in nearby.head(100).iterrows():  # Limit to 100
-            fires.append({
-                "lat": float(row['latitude']),
-                "lon": float(row['longitude']),
-                "brightness": float(row.get('brightness', 0)),
-                "confidence": int(row.get('confidence', 0)),
-                "frp": float(row.get('frp', 0)),
-                "date": str(row.get('acq_date', '')),
-                "time": str(row.get('acq_time', '')),
-                "satellite": str(row.get('satellite', '')),
-                "instrument": str(row.get('instrument', '')),
-                "day_night": str(row.get('daynight', ''))
-            })
-        
-        return fires
+        # Great-circle search, ordered by distance
+        rows, distances = store.nearest(lat, lon, k=k, radius_km=radius_km)
+        nearby = store.df.iloc[rows]
+        
+        return fire_detail_records(nearby, distances)
+    
+    def _fusion_priority(self, store: Optional[FireDetectionStore]) -> Optional[List[str]]:
+        """Source priority of a fused store (None if the store is not fused)"""
+        if store is None or 'sources' not in store.df.columns:
+            return None
+        if self._fusion_sources:
+            return self._fusion_sources
+        return [str(source) for source in store.df['source'].cat.categories] if 'source' in store.df.columns else ["MODIS_SP"]
+    
+    def _fuse_new_rows(self, rows: pd.DataFrame, priority: List[str]) -> pd.DataFrame:
+        """
+        Fuse refreshed detections among themselves, as the fused load did
+        
+        Rows left alone keep their own source as provenance (fused_count 1).
+        """
+        rows = apply_detection_schema(rows)
+        if self.fusion_distance_km and 'source' in rows.columns:
+            initial_count = len(rows)
+            rows = fuse_detections(rows, self.fusion_distance_km, self.fusion_window_minutes, priority=priority)
+            logger.info(f"🔗 Fused {initial_count - len(rows)} multi-sensor detections")
+            return rows
+        
+        sources = rows['source'].astype(str) if 'source' in rows.columns else pd.Series("", index=rows.index)
+        return apply_detection_schema(rows.assign(sources=sources, fused_count=1))
     
-    def refresh_data(self, days: int = 1):
+    def refresh_data(self, days: int = 1) -> int:
         """
         Refresh data with recent detections
         
+        The merged dataset and its indexes are built aside and swapped in with
+        one assignment, so readers keep using the previous store until the new
+        one is complete. Refreshes (and the lazy initial load) are serialized.
+        
+        Fetched rows are checked against the persistent dedup index, so only
+        detections not seen before are hashed and appended; an already
+        stored detection keeps its existing row. A fused multi-source store
+        is refreshed from all of its sources, and the new detections are
+        fused among themselves (not against stored ones) before appending.
+        
+        The new rows are appended into the current store's day offsets,
+        spatial grid and hotspot aggregates instead of rebuilding them; only
+        the copy of the stored column arrays into the new DataFrame still
+        scales with the archive.
+        
         Args:
             days: Number of recent days to fetch (1-10)
+            
+        Returns:
+            Total detections after the refresh
         """
         logger.info(f"🔄 Refreshing data with last {days} days")
         
-        recent_df = self.fetch_recent_days(days=days)
-        
-        if not recent_df.empty:
-            if self.df is None or self.df.empty:
-                self.df = recent_df
-            else:
-                # Append and remove duplicates
-                self.df = pd.concat([self.df, recent_df], ignore_index=True)
-                self.df = self.df.drop_duplicates(
-                    subset=['latitude', 'longitude', 'acq_date', 'acq_time'],
-                    keep='last'
-                )
+        with self._write_lock:
+            current = self._ensure_data_loaded()
+            priority = self._fusion_priority(current)
+            
+            frames = [self.fetch_recent_days(days=days, source=source) for source in (priority or ["MODIS_SP"])]
+            frames = [frame for frame in frames if not frame.empty]
+            recent_df = apply_detection_schema(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame()
+            
+            if recent_df.empty:
+                return len(current) if current is not None else 0
             
+            # Keep only unseen detections; the index is marked stale until the
+            # new store is in place, so a failed build cannot desynchronize it
+            index = self._dedup_index(current)
+            self._dedup_store = None
+            new_rows = recent_df[index.add(recent_df)].reset_index(drop=True)
+            logger.info(f"🧹 {len(recent_df) - len(new_rows)} of {len(recent_df)} fetched detections already stored")
+            
+            if new_rows.empty:
+                self._dedup_store = current
+                return len(current) if current is not None else 0
+            
+            if priority is not None:
+                new_rows = self._fuse_new_rows(new_rows, priority)
+            
+            # Only the new rows are parsed and indexed (see FireDetectionStore.append)
+            if current is None or len(current) == 0:
+                new_store = FireDetectionStore(apply_detection_schema(new_rows))
+            else:
+                new_store = current.append(new_rows)
+            self.store = new_store
+            self._dedup_store = new_store
             self._last_fetch = datetime.now()
-            logger.info(f"✅ Data refreshed: {len(self.df)} total detections")
+        
+        logger.info(f"✅ Data refreshed: {len(new_store)} total detections")
+        return len(new_store)
@@ -0,0 +1,151 @@
+"""
+🗄️ FIRMS Chunk Cache
+Content-addressed on-disk cache of fetched FIRMS API chunks
+"""
+
+import pandas as pd
+import numpy as np
+from datetime import date, datetime, timedelta
+from typing import Optional
+import hashlib
+import json
+import logging
+import os
+
+from src.adapters.repositories.fire_snapshot import encode_columns, decode_columns
+from src.adapters.repositories.firms_fetcher import ChunkRequest
+
+logger = logging.getLogger(__name__)
+
+# Columns of every FIRMS detection CSV; an error body (quota exceeded,
+# invalid MAP_KEY) parses to a frame without them
+REQUIRED_COLUMNS = ("latitude", "longitude", "acq_date")
+
+
+def is_detection_frame(df: Optional[pd.DataFrame]) -> bool:
+    """Check that a parsed chunk is a FIRMS detection table (possibly with no rows)"""
+    return df is not None and all(column in df.columns for column in REQUIRED_COLUMNS)
+
+
+class FirmsChunkCache:
+    """
+    Compressed columnar cache of FIRMS chunk responses
+
+    Each chunk is addressed by the SHA-256 of its request (source, area,
+    days, start date) and stored as one compressed `.npz` holding the typed
+    columns (see fire_snapshot.encode_columns) plus a JSON manifest. Only
+    chunks that end more than `mutable_days` before today are cached, so
+    recent days that FIRMS may still update are always re-fetched, and
+    only frames with the detection columns, so an error body answered
+    with HTTP 200 is never taken for a day without fires.
+    """
+
+    VERSION = 1
+    MANIFEST = "__manifest__"
+
+    def __init__(self, cache_dir: str = "./data/cache", mutable_days: int = 7):
+        """
+        Initialize chunk cache
+
+        Args:
+            cache_dir: Cache root directory (default: ./data/cache)
+            mutable_days: Recent days considered still mutable (default: 7)
+        """
+        self.cache_dir = os.path.join(cache_dir, "firms")
+        self.mutable_days = mutable_days
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, request: ChunkRequest) -> str:
+        """Content address of a chunk request"""
+        payload = json.dumps({
+            "version": self.VERSION,
+            "source": request.source,
+            "area": request.area,
+            "days": request.days,
+            "start_date": request.start_date
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, request: ChunkRequest) -> str:
+        """File of a chunk request"""
+        key = self.key(request)
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npz")
+
+    def is_cacheable(self, request: ChunkRequest, today: Optional[date] = None) -> bool:
+        """Check that a chunk only covers settled (no longer mutable) days"""
+        if request.start_date is None:
+            return False
+        today = today or date.today()
+        last_day = datetime.strptime(request.start_date, "%Y-%m-%d").date() + timedelta(days=request.days - 1)
+        return last_day < today - timedelta(days=self.mutable_days)
+
+    def get(self, request: ChunkRequest) -> Optional[pd.DataFrame]:
+        """
+        Cached chunk contents
+
+        Returns:
+            Typed DataFrame (empty if FIRMS returned no rows), or None on a miss
+        """
+        if not self.is_cacheable(request):
+            return None
+
+        path = self.path(request)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                manifest = json.loads(str(archive[self.MANIFEST]))
+                df = decode_columns(lambda stem: archive[stem], manifest["columns"])
+            if not is_detection_frame(df):
+                logger.warning(f"⚠️ Ignoring cached chunk without detection columns: {path}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return df
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read cached chunk {path}: {str(e)}")
+            self.misses += 1
+            return None
+
+    def put(self, request: ChunkRequest, df: pd.DataFrame) -> bool:
+        """
+        Store chunk contents (no-op for still-mutable chunks)
+
+        The file is written under a temporary name and renamed into place,
+        so concurrent readers never see a partial chunk.
+
+        Returns:
+            True if the chunk was written
+        """
+        if not self.is_cacheable(request):
+            return False
+        if not is_detection_frame(df):
+            logger.warning(f"⚠️ Not caching chunk without detection columns: {request.path()}")
+            return False
+
+        path = self.path(request)
+        tmp_path = f"{path}.tmp-{os.getpid()}.npz"
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            arrays, columns = encode_columns(df)
+            manifest = {
+                "version": self.VERSION,
+                "source": request.source,
+                "area": request.area,
+                "days": request.days,
+                "start_date": request.start_date,
+                "rows": len(df),
+                "columns": columns
+            }
+            np.savez_compressed(tmp_path, **arrays, **{self.MANIFEST: np.array(json.dumps(manifest))})
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache chunk {request.path()}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
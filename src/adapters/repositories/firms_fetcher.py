@@ -0,0 +1,262 @@
+"""
+📡 FIRMS Fetch Engine
+Concurrent, rate-limited downloads of FIRMS area CSV chunks
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import httpx
+import pandas as pd
+
+from src.adapters.repositories.fire_csv_stream import DetectionCSVParser
+
+logger = logging.getLogger(__name__)
+
+FIRMS_BASE_URL = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
+
+# FIRMS allows 5000 transactions per MAP_KEY every 10 minutes
+FIRMS_TRANSACTIONS_PER_WINDOW = 5000
+FIRMS_QUOTA_WINDOW_SECONDS = 600
+
+# FIRMS area requests cover at most 10 days
+MAX_CHUNK_DAYS = 10
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class ChunkRequest:
+    """One FIRMS area request: `days` days from `start_date` (None = most recent days)"""
+    source: str
+    area: str
+    days: int
+    start_date: Optional[str] = None
+
+    def path(self) -> str:
+        path = f"{self.source}/{self.area}/{self.days}"
+        return f"{path}/{self.start_date}" if self.start_date else path
+
+
+def date_range_chunks(
+    start_date: str,
+    end_date: str,
+    source: str = "MODIS_SP",
+    area: str = "world",
+    max_days: int = MAX_CHUNK_DAYS,
+    aligned: bool = False
+) -> List[ChunkRequest]:
+    """
+    Split a date range into FIRMS-sized chunk requests
+
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD, inclusive)
+        source: Data source
+        area: Geographic area
+        max_days: Days per request (FIRMS limit: 10)
+        aligned: Use fixed max_days blocks counted from 1970-01-01, so
+            overlapping ranges share chunks (edge chunks may extend past
+            the range; callers filter the rows)
+
+    Returns:
+        Chunk requests in date order
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+
+    if aligned:
+        epoch = datetime(1970, 1, 1)
+        start = epoch + timedelta(days=(start - epoch).days // max_days * max_days)
+        end = epoch + timedelta(days=((end - epoch).days // max_days + 1) * max_days - 1)
+
+    chunks = []
+    current = start
+    while current <= end:
+        chunk_end = min(current + timedelta(days=max_days - 1), end)
+        chunks.append(ChunkRequest(source, area, (chunk_end - current).days + 1, current.strftime("%Y-%m-%d")))
+        current = chunk_end + timedelta(days=1)
+
+    return chunks
+
+
+class TokenBucket:
+    """
+    Async token bucket
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    `acquire` waits until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize bucket (starts full)
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take one token, waiting for the refill if necessary"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class FirmsFetcher:
+    """
+    Asyncio fetch engine for FIRMS area CSV requests
+
+    A batch of chunk requests shares one pooled HTTP client. At most
+    `max_concurrency` requests are in flight, and a token bucket keeps the
+    request rate within the FIRMS quota. Response bodies are streamed into
+    a DetectionCSVParser as they arrive, so a chunk is never held in memory
+    as one string. Failed chunks (network errors, 429 and 5xx) are retried
+    with full-jitter exponential backoff.
+    The base URL and HTTP transport can be overridden, e.g. to point at
+    a local stub server.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = FIRMS_BASE_URL,
+        max_concurrency: int = 4,
+        requests_per_second: float = FIRMS_TRANSACTIONS_PER_WINDOW / FIRMS_QUOTA_WINDOW_SECONDS,
+        burst: int = 10,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize fetcher
+
+        Args:
+            api_key: FIRMS MAP_KEY
+            base_url: Area CSV endpoint (default: FIRMS production API)
+            max_concurrency: Maximum requests in flight
+            requests_per_second: Sustained request rate (default: FIRMS quota)
+            burst: Token bucket capacity
+            max_retries: Retries per chunk after the first attempt
+            backoff_base: First retry delay ceiling in seconds
+            backoff_max: Maximum retry delay in seconds
+            timeout: Per-request timeout in seconds
+            transport: Optional httpx transport (e.g. httpx.MockTransport)
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.transport = transport
+
+    def url(self, request: ChunkRequest) -> str:
+        """Full URL of a chunk request"""
+        return f"{self.base_url}/{self.api_key}/{request.path()}"
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _fetch_chunk(
+        self,
+        client: httpx.AsyncClient,
+        bucket: TokenBucket,
+        semaphore: asyncio.Semaphore,
+        request: ChunkRequest
+    ) -> Optional[pd.DataFrame]:
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            async with semaphore:
+                await bucket.acquire()
+                try:
+                    async with client.stream("GET", self.url(request)) as response:
+                        if response.status_code not in RETRY_STATUS_CODES:
+                            response.raise_for_status()
+                            parser = DetectionCSVParser()
+                            async for data in response.aiter_bytes():
+                                parser.feed(data)
+                            df = parser.finish()
+                            logger.info(f"✅ Fetched {len(df)} detections: {request.source} {request.start_date or 'latest'} ({request.days} days)")
+                            return df
+                        retry_after = response.headers.get("Retry-After")
+                        error = f"HTTP {response.status_code}"
+                except httpx.HTTPStatusError as e:
+                    logger.error(f"❌ Error fetching {request.path()}: {str(e)}")
+                    return None
+                except httpx.HTTPError as e:
+                    error = str(e) or type(e).__name__
+
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt, retry_after)
+                logger.warning(f"⚠️ {request.path()} failed ({error}), retry {attempt + 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"❌ Giving up on {request.path()} after {attempt + 1} attempts: {error}")
+
+        return None
+
+    async def fetch_all_async(self, requests: List[ChunkRequest]) -> List[Tuple[ChunkRequest, Optional[pd.DataFrame]]]:
+        """
+        Fetch chunk requests concurrently
+
+        Returns:
+            (request, typed DataFrame or None on failure) in request order;
+            an empty DataFrame means FIRMS returned no rows
+        """
+        bucket = TokenBucket(self.requests_per_second, self.burst)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, transport=self.transport) as client:
+            frames = await asyncio.gather(*(
+                self._fetch_chunk(client, bucket, semaphore, request) for request in requests
+            ))
+
+        return list(zip(requests, frames))
+
+    def fetch_all(self, requests: List[ChunkRequest]) -> List[Tuple[ChunkRequest, Optional[pd.DataFrame]]]:
+        """
+        Blocking wrapper around fetch_all_async
+
+        Runs its own event loop; when called from inside a running loop
+        (e.g. a sync repository call made from an async endpoint) the loop
+        runs on a helper thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_all_async(requests))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.fetch_all_async(requests)).result()
@@ -0,0 +1,87 @@
+"""
+🧮 Grid Aggregation
+Integer cell-key grouping and reductions shared by hotspot and grid aggregation
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def cell_indices(values: np.ndarray, cell_size: float) -> np.ndarray:
+    """Integer index of the cell centred on round(value / cell_size) * cell_size"""
+    return np.rint(np.asarray(values, dtype=np.float64) / cell_size).astype(np.int64)
+
+
+def _half_width(cell_size: float) -> int:
+    return int(np.ceil(180 / cell_size)) + 1
+
+
+def pack_cells(lat_idx: np.ndarray, lon_idx: np.ndarray, cell_size: float) -> np.ndarray:
+    """Pack (lat, lon) cell indices into one int64 key (row-major, lat first)"""
+    half_width = _half_width(cell_size)
+    return (lat_idx + half_width) * (2 * half_width + 1) + (lon_idx + half_width)
+
+
+def unpack_cells(keys: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Inverse of pack_cells"""
+    half_width = _half_width(cell_size)
+    lat_idx, lon_idx = np.divmod(keys, 2 * half_width + 1)
+    return lat_idx - half_width, lon_idx - half_width
+
+
+class CellAggregation:
+    """
+    Rows grouped by integer cell key
+
+    Keys are sorted once with np.unique; every reduction afterwards is a
+    single bincount (sum/mean) or reduceat (max) over the group labels,
+    so no float keys or Python-level grouping are involved.
+    """
+
+    def __init__(self, keys: np.ndarray):
+        """
+        Group rows
+
+        Args:
+            keys: int64 cell key per row
+        """
+        self.keys, self.first, self.inverse, self.count = np.unique(
+            np.asarray(keys, dtype=np.int64), return_index=True, return_inverse=True, return_counts=True
+        )
+        self._sorted_rows = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        """Per-cell sum"""
+        return np.bincount(self.inverse, weights=np.asarray(values, dtype=np.float64), minlength=len(self.keys))
+
+    def mean(self, values: np.ndarray) -> np.ndarray:
+        """Per-cell mean"""
+        return self.sum(values) / self.count
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        """Per-cell maximum"""
+        values = np.asarray(values)
+        if len(self.keys) == 0:
+            return np.empty(0, dtype=values.dtype)
+        if self._sorted_rows is None:
+            self._sorted_rows = np.argsort(self.inverse, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(self.count)[:-1]))
+        return np.maximum.reduceat(values[self._sorted_rows], starts)
+
+
+def aggregate_cells(lat: np.ndarray, lon: np.ndarray, cell_size: float) -> CellAggregation:
+    """
+    Group coordinates into cells centred on multiples of cell_size
+
+    Args:
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+        cell_size: Grid cell size in degrees
+
+    Returns:
+        CellAggregation keyed by pack_cells
+    """
+    return CellAggregation(pack_cells(cell_indices(lat, cell_size), cell_indices(lon, cell_size), cell_size))
@@ -0,0 +1,215 @@
+"""
+🗂️ HDF File Catalog
+Scans the data directory once and keeps per-granule format and metadata
+"""
+
+from dataclasses import dataclass, field, asdict
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+HDF_EXTENSIONS = ('.hdf', '.h5', '.nc', '.HDF', '.H5', '.NC')
+
+# File signatures (HDF5 may be preceded by a user block of 512 * 2^n bytes)
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+HDF5_SIGNATURE_OFFSETS = (0, 512, 1024, 2048, 4096)
+HDF4_SIGNATURE = b'\x0e\x03\x13\x01'
+NETCDF_SIGNATURES = (b'CDF\x01', b'CDF\x02', b'CDF\x05')
+
+# MODIS granule names: PRODUCT.AYYYYDDD.hHHvVV.CCC.PRODUCTION.hdf (tiled)
+# or PRODUCT.AYYYYDDD.HHMM.CCC.PRODUCTION.hdf (swath, e.g. MOD14)
+MODIS_NAME = re.compile(
+    r'^(?P<product>[A-Za-z0-9_]+)\.A(?P<year>\d{4})(?P<doy>\d{3})'
+    r'(?:\.h(?P<h>\d{2})v(?P<v>\d{2})|\.(?P<time>\d{4}))?'
+    r'(?:\.(?P<collection>\d{3}))?\.'
+)
+
+
+def detect_format(filepath: str) -> str:
+    """
+    Detect the container format from the file signature
+
+    Reads at most a few KB and never opens the file through an HDF library.
+    NetCDF-4 files are HDF5 containers and are reported as 'hdf5'.
+
+    Returns:
+        'hdf5', 'hdf4', 'netcdf' or 'unknown'
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(max(HDF5_SIGNATURE_OFFSETS) + len(HDF5_SIGNATURE))
+    except OSError:
+        return 'unknown'
+
+    if any(head[offset:offset + len(HDF5_SIGNATURE)] == HDF5_SIGNATURE for offset in HDF5_SIGNATURE_OFFSETS):
+        return 'hdf5'
+    if head.startswith(HDF4_SIGNATURE):
+        return 'hdf4'
+    if head[:4] in NETCDF_SIGNATURES:
+        return 'netcdf'
+    return 'unknown'
+
+
+@dataclass
+class HDFFileInfo:
+    """Catalog entry of one data file"""
+    filename: str
+    path: str
+    format: str
+    size: int
+    mtime: float
+    product: Optional[str] = None
+    tile: Optional[Tuple[int, int]] = None  # MODIS sinusoidal (h, v)
+    date: Optional[str] = None  # acquisition date YYYY-MM-DD
+    time: Optional[str] = None  # acquisition time HHMM (swath products)
+    collection: Optional[str] = None
+    datasets: Optional[List[Dict]] = field(default=None, repr=False)
+
+    def matches(self, keywords: List[str]) -> bool:
+        """Check whether the file name contains any of the keywords (case-insensitive)"""
+        name = self.filename.lower()
+        return any(kw.lower() in name for kw in keywords)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["tile"] = f"h{self.tile[0]:02d}v{self.tile[1]:02d}" if self.tile else None
+        data["datasets"] = [d["name"] for d in self.datasets] if self.datasets is not None else None
+        return data
+
+
+def parse_granule_name(filename: str) -> Dict:
+    """
+    Product, tile, acquisition date/time and collection from a MODIS file name
+
+    Example: MCD64A1.A2019244.h12v09.061.2021309105247.hdf ->
+        product MCD64A1, tile (12, 9), date 2019-09-01, collection 061
+    """
+    match = MODIS_NAME.match(filename)
+    if not match:
+        return {}
+
+    acquired = date(int(match.group('year')), 1, 1) + timedelta(days=int(match.group('doy')) - 1)
+    return {
+        "product": match.group('product'),
+        "tile": (int(match.group('h')), int(match.group('v'))) if match.group('h') else None,
+        "date": acquired.isoformat(),
+        "time": match.group('time'),
+        "collection": match.group('collection')
+    }
+
+
+class HDFCatalog:
+    """
+    Catalog of the HDF / NetCDF files in a data directory
+
+    Built with one directory listing; each file's format comes from its
+    signature and its product, tile, date and collection from its name,
+    and its dataset list is read once through `list_datasets`. Lookups only
+    stat the directory: a changed directory mtime triggers a rescan, which
+    reuses the entries of files whose size and mtime are unchanged.
+    """
+
+    def __init__(self, data_dir: str, list_datasets: Optional[Callable[[str, str], Optional[List[Dict]]]] = None):
+        """
+        Initialize catalog (scanned on first use)
+
+        Args:
+            data_dir: Directory holding the data files
+            list_datasets: Reads (path, format) -> dataset descriptions, or
+                None when the format cannot be read
+        """
+        self.data_dir = data_dir
+        self.list_datasets = list_datasets
+        self._entries: Dict[str, HDFFileInfo] = {}
+        self._dir_mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _dir_stamp(self) -> Optional[int]:
+        try:
+            return os.stat(self.data_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _inspect(self, filename: str, stat: os.stat_result) -> HDFFileInfo:
+        path = os.path.join(self.data_dir, filename)
+        entry = HDFFileInfo(
+            filename=filename,
+            path=path,
+            format=detect_format(path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            **parse_granule_name(filename)
+        )
+
+        if self.list_datasets is not None and entry.format != 'unknown':
+            try:
+                entry.datasets = self.list_datasets(path, entry.format)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not list datasets of {filename}: {str(e)}")
+
+        return entry
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rescan the directory if it changed
+
+        Returns:
+            True if a scan ran
+        """
+        stamp = self._dir_stamp()
+        if not force and stamp == self._dir_mtime and stamp is not None:
+            return False
+
+        with self._lock:
+            if not force and stamp == self._dir_mtime and stamp is not None:
+                return False
+
+            entries = {}
+            if stamp is not None:
+                for filename in sorted(os.listdir(self.data_dir)):
+                    if not filename.endswith(HDF_EXTENSIONS):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(self.data_dir, filename))
+                    except OSError:
+                        continue
+                    previous = self._entries.get(filename)
+                    if previous is not None and previous.size == stat.st_size and previous.mtime == stat.st_mtime:
+                        entries[filename] = previous
+                    else:
+                        entries[filename] = self._inspect(filename, stat)
+
+            self._entries = entries
+            self._dir_mtime = stamp
+
+        logger.info(f"🗂️  Catalog: {len(entries)} HDF files in {self.data_dir}")
+        return True
+
+    def files(self) -> List[HDFFileInfo]:
+        """All entries, sorted by file name"""
+        self.refresh()
+        return list(self._entries.values())
+
+    def get(self, filename: Optional[str]) -> Optional[HDFFileInfo]:
+        """Entry of a file name (None if unknown)"""
+        if not filename:
+            return None
+        self.refresh()
+        return self._entries.get(filename)
+
+    def resolve(self, filename: Optional[str] = None) -> Optional[HDFFileInfo]:
+        """Entry of `filename`, or the first file if it is not given or unknown"""
+        entry = self.get(filename)
+        if entry is not None:
+            return entry
+        files = self.files()
+        return files[0] if files else None
+
+    def find(self, keywords: List[str]) -> List[HDFFileInfo]:
+        """Entries whose file name contains any of the keywords"""
+        return [entry for entry in self.files() if entry.matches(keywords)]
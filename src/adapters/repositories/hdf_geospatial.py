@@ -4,9 +4,13 @@ Converts HDF grid data to geographic coordinates (lat/lon) for mapping
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator
+import json
 import logging
 
+from src.adapters.repositories.fire_serializers import STREAM_CHUNK_ROWS, iter_feature_collection, iter_ndjson
+from src.adapters.repositories.grid_aggregation import aggregate_cells, unpack_cells
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,7 +64,29 @@ class HDFGeospatialConverter:
         
         return (lat, lon)
     
-    def extract_fire_points(
+    def grid_to_latlon_arrays(
+        self,
+        h: int,
+        v: int,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        resolution: int = 1000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized grid_to_latlon for arrays of pixel rows/cols
+        
+        Returns:
+            (latitudes, longitudes) in degrees
+        """
+        x = (h * self.TILE_SIZE + np.asarray(cols, dtype=np.float64)) * resolution
+        y = (v * self.TILE_SIZE + np.asarray(rows, dtype=np.float64)) * resolution
+        
+        lat = 90 - (y / self.EARTH_RADIUS) * (180 / np.pi)
+        lon = (x / (self.EARTH_RADIUS * np.cos(lat * np.pi / 180))) * (180 / np.pi) - 180
+        
+        return (lat, lon)
+    
+    def extract_fire_point_arrays(
         self,
         fire_mask: np.ndarray,
         h: int,
@@ -68,70 +94,141 @@ class HDFGeospatialConverter:
         confidence: Optional[np.ndarray] = None,
         frp: Optional[np.ndarray] = None,
         min_confidence: int = 50,
-        max_points: int = 10000
-    ) -> List[Dict]:
+        max_points: Optional[int] = 10000
+    ) -> Dict[str, np.ndarray]:
         """
-        Extract fire points with coordinates
+        Extract fire points as columns (same selection as extract_fire_points)
         
         Args:
-            fire_mask: 2D array with fire detection (7-9 = fire)
-            h: Horizontal tile number
-            v: Vertical tile number
-            confidence: Optional confidence array
-            frp: Optional Fire Radiative Power array
-            min_confidence: Minimum confidence to include (0-100)
-            max_points: Maximum points to return (for performance)
+            max_points: Maximum points to return (None/0 = no limit)
             
         Returns:
-            List of fire points with lat/lon
+            Dict with 'lat'/'lon' arrays and, when given, 'confidence'/'frp'
         """
         
         # Find fire pixels (values 7-9 in MODIS fire mask)
-        fire_pixels = np.where(fire_mask >= 7)
+        rows, cols = np.nonzero(fire_mask >= 7)
         
-        if len(fire_pixels[0]) == 0:
+        if len(rows) == 0:
             logger.info("No fire pixels found")
-            return []
-        
-        logger.info(f"Found {len(fire_pixels[0])} fire pixels")
+        else:
+            logger.info(f"Found {len(rows)} fire pixels")
         
         # Filter by confidence if provided
-        if confidence is not None:
-            conf_mask = confidence[fire_pixels] >= min_confidence
-            fire_pixels = (fire_pixels[0][conf_mask], fire_pixels[1][conf_mask])
-            logger.info(f"After confidence filter: {len(fire_pixels[0])} pixels")
+        if confidence is not None and len(rows) > 0:
+            conf_mask = confidence[rows, cols] >= min_confidence
+            rows, cols = rows[conf_mask], cols[conf_mask]
+            logger.info(f"After confidence filter: {len(rows)} pixels")
         
         # Limit number of points
-        if len(fire_pixels[0]) > max_points:
-            logger.warning(f"Too many points ({len(fire_pixels[0])}), sampling {max_points}")
-            indices = np.random.choice(len(fire_pixels[0]), max_points, replace=False)
-            fire_pixels = (fire_pixels[0][indices], fire_pixels[1][indices])
+        if max_points and len(rows) > max_points:
+            logger.warning(f"Too many points ({len(rows)}), sampling {max_points}")
+            indices = np.random.choice(len(rows), max_points, replace=False)
+            rows, cols = rows[indices], cols[indices]
         
-        # Convert to lat/lon
-        points = []
-        for i in range(len(fire_pixels[0])):
-            row = int(fire_pixels[0][i])
-            col = int(fire_pixels[1][i])
-            
-            lat, lon = self.grid_to_latlon(h, v, row, col)
-            
-            point = {
-                "lat": round(lat, 6),
-                "lon": round(lon, 6),
-                "type": "fire"
-            }
-            
-            # Add optional attributes
-            if confidence is not None:
-                point["confidence"] = int(confidence[row, col])
-            
-            if frp is not None:
-                point["frp"] = float(frp[row, col])
+        lat, lon = self.grid_to_latlon_arrays(h, v, rows, cols)
+        columns = {"lat": np.round(lat, 6), "lon": np.round(lon, 6)}
+        
+        if confidence is not None:
+            columns["confidence"] = confidence[rows, cols].astype(np.int64)
+        
+        if frp is not None:
+            columns["frp"] = frp[rows, cols].astype(np.float64)
+        
+        return columns
+    
+    def point_records(self, columns: Dict[str, np.ndarray], point_type: str) -> List[Dict]:
+        """
+        Convert point columns to the list-of-dicts point format
+        
+        Args:
+            columns: Dict with 'lat'/'lon' and optional attribute arrays
+            point_type: Value of each point's "type" field
             
+        Returns:
+            List of points with lat/lon, type and attributes
+        """
+        names = ["lat", "lon"] + [name for name in columns if name not in ("lat", "lon")]
+        values = [columns[name].tolist() for name in names]
+        
+        points = []
+        for row in zip(*values):
+            point = {"lat": row[0], "lon": row[1], "type": point_type}
+            point.update(zip(names[2:], row[2:]))
             points.append(point)
         
         return points
     
+    def iter_point_geojson(
+        self,
+        columns: Dict[str, np.ndarray],
+        point_type: str,
+        properties: Optional[Dict] = None,
+        ndjson: bool = False,
+        chunk_rows: int = STREAM_CHUNK_ROWS
+    ) -> Iterator[bytes]:
+        """
+        Stream point columns as GeoJSON (same features as create_geojson)
+        
+        Args:
+            columns: Dict with 'lat'/'lon' and optional attribute arrays
+            point_type: Value of each feature's "type" property
+            properties: Optional collection-level properties (ignored for NDJSON)
+            ndjson: Yield one Feature per line instead of a FeatureCollection
+            chunk_rows: Points encoded per chunk
+            
+        Yields:
+            UTF-8 byte chunks
+        """
+        def feature_chunks():
+            n = len(columns["lat"])
+            for start in range(0, n, chunk_rows):
+                chunk = {name: values[start:start + chunk_rows] for name, values in columns.items()}
+                yield [
+                    json.dumps(feature, separators=(",", ":"))
+                    for feature in self.create_geojson(self.point_records(chunk, point_type))["features"]
+                ]
+        
+        if ndjson:
+            return iter_ndjson(feature_chunks())
+        return iter_feature_collection(feature_chunks(), properties)
+    
+    def extract_fire_points(
+        self,
+        fire_mask: np.ndarray,
+        h: int,
+        v: int,
+        confidence: Optional[np.ndarray] = None,
+        frp: Optional[np.ndarray] = None,
+        min_confidence: int = 50,
+        max_points: Optional[int] = 10000
+    ) -> List[Dict]:
+        """
+        Extract fire points with coordinates
+        
+        Args:
+            fire_mask: 2D array with fire detection (7-9 = fire)
+            h: Horizontal tile number
+            v: Vertical tile number
+            confidence: Optional confidence array
+            frp: Optional Fire Radiative Power array
+            min_confidence: Minimum confidence to include (0-100)
+            max_points: Maximum points to return (None/0 = no limit)
+            
+        Returns:
+            List of fire points with lat/lon
+        """
+        
+        columns = self.extract_fire_point_arrays(
+            fire_mask, h, v,
+            confidence=confidence,
+            frp=frp,
+            min_confidence=min_confidence,
+            max_points=max_points
+        )
+        
+        return self.point_records(columns, "fire")
+    
     def extract_burned_area_points(
         self,
         burn_date: np.ndarray,
@@ -235,42 +332,63 @@ class HDFGeospatialConverter:
             List of aggregated grid cells
         """
         
-        # Group points by grid cell
-        grid = {}
+        if not points:
+            return []
         
-        for point in points:
-            lat_cell = round(point["lat"] / grid_size) * grid_size
-            lon_cell = round(point["lon"] / grid_size) * grid_size
-            key = (lat_cell, lon_cell)
-            
-            if key not in grid:
-                grid[key] = {
-                    "lat": lat_cell,
-                    "lon": lon_cell,
-                    "count": 0,
-                    "total_frp": 0.0,
-                    "max_confidence": 0
-                }
-            
-            grid[key]["count"] += 1
-            
-            if "frp" in point:
-                grid[key]["total_frp"] += point["frp"]
-            
-            if "confidence" in point:
-                grid[key]["max_confidence"] = max(
-                    grid[key]["max_confidence"],
-                    point["confidence"]
-                )
+        columns = {
+            "lat": np.array([point["lat"] for point in points], dtype=np.float64),
+            "lon": np.array([point["lon"] for point in points], dtype=np.float64),
+            "frp": np.array([point.get("frp", 0.0) for point in points], dtype=np.float64),
+            "confidence": np.array([point.get("confidence", 0) for point in points], dtype=np.int64)
+        }
         
-        # Convert to list
-        aggregated = []
-        for cell in grid.values():
-            if cell["count"] > 0:
-                cell["avg_frp"] = cell["total_frp"] / cell["count"] if cell["total_frp"] > 0 else 0
-                aggregated.append(cell)
+        return self.aggregate_columns_to_grid(columns, grid_size)
+    
+    def aggregate_columns_to_grid(
+        self,
+        columns: Dict[str, np.ndarray],
+        grid_size: float = 0.1
+    ) -> List[Dict]:
+        """
+        Aggregate point columns to grid cells (see aggregate_to_grid)
         
-        logger.info(f"Aggregated {len(points)} points to {len(aggregated)} grid cells")
+        Args:
+            columns: Dict with 'lat'/'lon' and optional 'frp'/'confidence' arrays
+            grid_size: Grid cell size in degrees (0.1 = ~10km)
+            
+        Returns:
+            List of aggregated grid cells, in order of first appearance
+        """
+        
+        cells = aggregate_cells(columns["lat"], columns["lon"], grid_size)
+        n = len(cells)
+        
+        lat_idx, lon_idx = unpack_cells(cells.keys, grid_size)
+        total_frp = cells.sum(np.nan_to_num(columns["frp"])) if "frp" in columns else np.zeros(n)
+        max_confidence = np.maximum(cells.max(columns["confidence"]), 0) if "confidence" in columns else np.zeros(n, dtype=np.int64)
+        avg_frp = np.where(total_frp > 0, total_frp / np.maximum(cells.count, 1), 0.0)
+        
+        order = np.argsort(cells.first, kind='stable')
+        aggregated = [
+            {
+                "lat": lat,
+                "lon": lon,
+                "count": count,
+                "total_frp": total,
+                "max_confidence": confidence,
+                "avg_frp": avg
+            }
+            for lat, lon, count, total, confidence, avg in zip(
+                (lat_idx[order] * grid_size).tolist(),
+                (lon_idx[order] * grid_size).tolist(),
+                cells.count[order].tolist(),
+                total_frp[order].tolist(),
+                max_confidence[order].tolist(),
+                avg_frp[order].tolist()
+            )
+        ]
+        
+        logger.info(f"Aggregated {len(columns['lat'])} points to {len(aggregated)} grid cells")
         
         return aggregated
     
@@ -290,3 +408,20 @@ class HDFGeospatialConverter:
             return (h, v)
         
         return (None, None)
+    
+    def extract_date_from_filename(self, filename: str) -> Optional[str]:
+        """
+        Extract acquisition date from MODIS filename
+        
+        Example: MOD14A1.A2019274.h11v09.061.hdf -> '2019-10-01'
+        """
+        
+        import re
+        match = re.search(r'\.A(\d{4})(\d{3})\.', filename)
+        
+        if match:
+            year = int(match.group(1))
+            doy = int(match.group(2))
+            return str(np.datetime64(f"{year}-01-01") + np.timedelta64(doy - 1, "D"))
+        
+        return None
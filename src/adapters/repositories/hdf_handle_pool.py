@@ -0,0 +1,142 @@
+"""
+🏊 HDF Handle Pool
+Keeps recently used HDF4 / HDF5 / NetCDF file handles open (LRU)
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Formats whose library is not thread-safe: all their handles share one lock
+LIBRARY_LOCKED_FORMATS = ('hdf4', 'netcdf')
+
+
+@dataclass
+class _PooledHandle:
+    handle: Any
+    format: str
+    lock: threading.Lock
+    users: int = 0
+
+
+class HDFHandlePool:
+    """
+    LRU pool of open data file handles
+
+    `checkout` yields an open handle for (path, format), opening it only
+    if it is not pooled yet; the file stays open afterwards so later reads
+    of other datasets skip the open/close cycle. At most `max_open`
+    handles are kept; the least recently used idle handle is closed first.
+    A handle is used by one thread at a time, and formats whose library
+    is not thread-safe (HDF4, NetCDF) share one lock across all files.
+    Handles are keyed by path and mtime, so a replaced file is reopened.
+    """
+
+    def __init__(
+        self,
+        openers: Dict[str, Callable[[str], Any]],
+        closers: Dict[str, Callable[[Any], None]],
+        max_open: int = 16
+    ):
+        """
+        Initialize pool
+
+        Args:
+            openers: format -> function opening a path read-only
+            closers: format -> function closing a handle
+            max_open: Maximum handles kept open
+        """
+        self.openers = openers
+        self.closers = closers
+        self.max_open = max_open
+        self.opens = 0
+        self.reuses = 0
+        self._handles: "OrderedDict[Tuple[str, float], _PooledHandle]" = OrderedDict()
+        self._library_locks = {fmt: threading.Lock() for fmt in LIBRARY_LOCKED_FORMATS}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def _close(self, pooled: _PooledHandle):
+        try:
+            self.closers[pooled.format](pooled.handle)
+        except Exception as e:
+            logger.warning(f"⚠️  Error closing HDF handle: {str(e)}")
+
+    def _evict(self):
+        # Close idle handles, least recently used first, down to max_open
+        for key in list(self._handles):
+            if len(self._handles) <= self.max_open:
+                break
+            pooled = self._handles[key]
+            if pooled.users == 0:
+                del self._handles[key]
+                self._close(pooled)
+
+    @contextmanager
+    def checkout(self, path: str, file_format: str) -> Iterator[Any]:
+        """
+        Borrow an open handle
+
+        Args:
+            path: File path
+            file_format: 'hdf4', 'hdf5' or 'netcdf'
+
+        Yields:
+            Open handle (SD, h5py.File or netCDF4.Dataset); do not close it
+        """
+        if file_format not in self.openers:
+            raise ValueError(f"Unsupported file type: {file_format}")
+
+        key = (path, os.path.getmtime(path))
+        library_lock = self._library_locks.get(file_format)
+
+        with self._lock:
+            pooled = self._handles.get(key)
+            if pooled is not None:
+                self._handles.move_to_end(key)
+                self.reuses += 1
+            else:
+                pooled = _PooledHandle(handle=None, format=file_format, lock=library_lock or threading.Lock())
+                self._handles[key] = pooled
+            pooled.users += 1
+
+        try:
+            with pooled.lock:
+                if pooled.handle is None:
+                    pooled.handle = self.openers[file_format](path)
+                    self.opens += 1
+                yield pooled.handle
+        except Exception:
+            # Drop a handle that failed to open
+            with self._lock:
+                if pooled.handle is None and self._handles.get(key) is pooled:
+                    del self._handles[key]
+            raise
+        finally:
+            with self._lock:
+                pooled.users -= 1
+                self._evict()
+
+    def close_all(self):
+        """Close every idle handle"""
+        with self._lock:
+            idle = [key for key, pooled in self._handles.items() if pooled.users == 0]
+            for key in idle:
+                self._close(self._handles.pop(key))
+
+    def stats(self) -> Dict:
+        """Open handle count and open / reuse counters"""
+        return {
+            "open_handles": len(self._handles),
+            "max_open": self.max_open,
+            "opens": self.opens,
+            "reuses": self.reuses
+        }
@@ -3,7 +3,8 @@
 Reads actual NASA HDF files from disk
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 from datetime import datetime
 import os
 import logging
@@ -14,6 +15,11 @@ from src.domain.models import (
     Severity, VegetationHealth, AirQualityStatus
 )
 from src.domain.ports import HDFDataRepository
+from src.adapters.cache.array_cache import ArrayCache
+from src.adapters.repositories.hdf_catalog import HDFCatalog, HDFFileInfo, detect_format
+from src.adapters.repositories.hdf_handle_pool import HDFHandlePool
+from src.adapters.repositories.modis_grid import TileWindow, tile_window, pixel_window, tiles_for_bounds
+from src.adapters.repositories.raster_summary import RasterSummary, summarize_blocks
 
 # HDF libraries
 try:
@@ -36,12 +42,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEGRADED_NDVI = 0.4  # NDVI below this counts as degraded vegetation
+
 
 class RealHDFRepository(HDFDataRepository):
     """Repository that reads real HDF files"""
     
-    def __init__(self, data_dir: str = "./data/raw"):
+    def __init__(
+        self,
+        data_dir: str = "./data/raw",
+        max_open_files: int = 16,
+        array_cache_bytes: int = 256 * 1024 * 1024,
+        tile_workers: int = 4
+    ):
         self.data_dir = data_dir
+        self._tile_pool = ThreadPoolExecutor(max_workers=tile_workers, thread_name_prefix="hdf-tiles")
+        self.handles = self._create_handle_pool(max_open_files)
+        self.arrays = ArrayCache(array_cache_bytes)
+        self.catalog = HDFCatalog(data_dir, list_datasets=self._list_datasets)
         self._check_dependencies()
         self._scan_available_files()
     
@@ -50,14 +68,24 @@ class RealHDFRepository(HDFDataRepository):
         if not (HAS_PYHDF or HAS_H5PY):
             logger.warning("⚠️  No HDF libraries available. Install: pip install pyhdf h5py netCDF4")
     
+    def _create_handle_pool(self, max_open_files: int) -> HDFHandlePool:
+        """Handle pool for the formats whose library is installed"""
+        openers, closers = {}, {}
+        if HAS_PYHDF:
+            openers['hdf4'], closers['hdf4'] = (lambda path: SD(path, SDC.READ)), (lambda hdf: hdf.end())
+        if HAS_H5PY:
+            openers['hdf5'], closers['hdf5'] = (lambda path: h5py.File(path, 'r')), (lambda f: f.close())
+        if HAS_NETCDF:
+            openers['netcdf'], closers['netcdf'] = (lambda path: Dataset(path, 'r')), (lambda nc: nc.close())
+        return HDFHandlePool(openers, closers, max_open=max_open_files)
+    
     def _scan_available_files(self):
         """Scan data directory for available HDF files"""
         if not os.path.exists(self.data_dir):
             logger.warning(f"⚠️  Data directory not found: {self.data_dir}")
             return
         
-        hdf_files = [f for f in os.listdir(self.data_dir) 
-                     if f.endswith(('.hdf', '.h5', '.nc', '.HDF', '.H5', '.NC'))]
+        hdf_files = self.catalog.files()
         
         if hdf_files:
             logger.info(f"📂 Found {len(hdf_files)} HDF files in {self.data_dir}")
@@ -77,27 +105,26 @@ class RealHDFRepository(HDFDataRepository):
         if not os.path.exists(self.data_dir):
             return {"error": "Data directory not found"}
         
-        # Get HDF files
-        hdf_files = [f for f in os.listdir(self.data_dir) 
-                     if f.endswith(('.hdf', '.h5', '.nc', '.HDF', '.H5', '.NC'))]
-        
-        if not hdf_files:
+        # Use specified file or first available
+        entry = self.catalog.resolve(filename)
+        if entry is None:
             return {"error": "No HDF files found"}
         
-        # Use specified file or first available
-        target_file = filename if filename and filename in hdf_files else hdf_files[0]
-        filepath = os.path.join(self.data_dir, target_file)
+        target_file, filepath, file_type = entry.filename, entry.path, entry.format
         
         logger.info(f"📋 Listing datasets in: {target_file}")
         
-        file_type = self._detect_file_type(filepath)
-        
         result = {
             "filename": target_file,
             "file_type": file_type,
             "datasets": []
         }
         
+        # Listed once when the file was catalogued
+        if entry.datasets is not None:
+            result["datasets"] = entry.datasets
+            return result
+        
         try:
             if file_type == 'hdf4' and HAS_PYHDF:
                 result["datasets"] = self._list_datasets_hdf4(filepath)
@@ -114,6 +141,25 @@ class RealHDFRepository(HDFDataRepository):
         
         return result
     
+    def get_file_info(self, filename: Optional[str] = None) -> dict:
+        """
+        Catalog metadata of a file, without opening it
+        
+        Args:
+            filename: Specific file (optional, uses first file if None)
+            
+        Returns:
+            Dictionary with filename, format, product, tile, date, ... or error
+        """
+        if not os.path.exists(self.data_dir):
+            return {"error": "Data directory not found"}
+        
+        entry = self.catalog.resolve(filename)
+        if entry is None:
+            return {"error": "No HDF files found"}
+        
+        return entry.to_dict()
+    
     async def read_raw_dataset(self, dataset_name: str, filename: Optional[str] = None, return_array: bool = False) -> dict:
         """
         Read raw data from a specific dataset
@@ -121,7 +167,8 @@ class RealHDFRepository(HDFDataRepository):
         Args:
             dataset_name: Name of the dataset to read
             filename: Specific file (optional)
-            return_array: If True, returns numpy array directly (for internal use)
+            return_array: If True, returns numpy array directly (for internal use;
+                cached arrays are read-only)
             
         Returns:
             Dictionary with dataset data or numpy array if return_array=True
@@ -129,27 +176,31 @@ class RealHDFRepository(HDFDataRepository):
         if not os.path.exists(self.data_dir):
             return {"error": "Data directory not found"}
         
-        hdf_files = [f for f in os.listdir(self.data_dir) 
-                     if f.endswith(('.hdf', '.h5', '.nc', '.HDF', '.H5', '.NC'))]
-        
-        if not hdf_files:
+        entry = self.catalog.resolve(filename)
+        if entry is None:
             return {"error": "No HDF files found"}
         
-        target_file = filename if filename and filename in hdf_files else hdf_files[0]
-        filepath = os.path.join(self.data_dir, target_file)
+        target_file, filepath, file_type = entry.filename, entry.path, entry.format
         
         logger.info(f"📖 Reading dataset '{dataset_name}' from: {target_file}")
         
-        file_type = self._detect_file_type(filepath)
-        
         try:
             if file_type == 'hdf4' and HAS_PYHDF:
-                data = self._read_dataset_hdf4(filepath, dataset_name)
+                reader = self._read_dataset_hdf4
             elif file_type == 'hdf5' and HAS_H5PY:
-                data = self._read_dataset_hdf5(filepath, dataset_name)
+                reader = self._read_dataset_hdf5
             else:
                 return {"error": f"Unsupported file type: {file_type}"}
             
+            # Decoded layers are shared (read-only) until the file changes; the
+            # mtime is taken now, since a file overwritten in place does not
+            # change the directory mtime that triggers a catalog rescan
+            stat = os.stat(filepath)
+            data = self.arrays.get_or_load(
+                (filepath, dataset_name, stat.st_mtime_ns, stat.st_size),
+                lambda: reader(filepath, dataset_name)
+            )
+            
             # If return_array is True, return numpy array directly (for internal processing)
             if return_array:
                 return data
@@ -180,10 +231,20 @@ class RealHDFRepository(HDFDataRepository):
             logger.error(f"❌ Error reading dataset: {str(e)}")
             return {"error": str(e)}
     
+    def _list_datasets(self, filepath: str, file_type: str) -> Optional[list]:
+        """List datasets with the library of the file's format (None if unavailable)"""
+        if file_type == 'hdf4' and HAS_PYHDF:
+            return self._list_datasets_hdf4(filepath)
+        if file_type == 'hdf5' and HAS_H5PY:
+            return self._list_datasets_hdf5(filepath)
+        if file_type == 'netcdf' and HAS_NETCDF:
+            return self._list_datasets_netcdf(filepath)
+        return None
+    
     def _list_datasets_hdf4(self, filepath: str) -> list:
         """List all datasets in HDF4 file"""
-        hdf = SD(filepath, SDC.READ)
-        datasets_dict = hdf.datasets()
+        with self.handles.checkout(filepath, 'hdf4') as hdf:
+            datasets_dict = hdf.datasets()
         
         datasets = []
         for name, info in datasets_dict.items():
@@ -194,14 +255,13 @@ class RealHDFRepository(HDFDataRepository):
                 "attributes": info[2]
             })
         
-        hdf.end()
         return datasets
     
     def _list_datasets_hdf5(self, filepath: str) -> list:
         """List all datasets in HDF5 file"""
         datasets = []
         
-        with h5py.File(filepath, 'r') as f:
+        with self.handles.checkout(filepath, 'hdf5') as f:
             def collect_datasets(name, obj):
                 if isinstance(obj, h5py.Dataset):
                     datasets.append({
@@ -216,58 +276,147 @@ class RealHDFRepository(HDFDataRepository):
     
     def _list_datasets_netcdf(self, filepath: str) -> list:
         """List all datasets in NetCDF file"""
-        nc = Dataset(filepath, 'r')
-        
-        datasets = []
-        for name, var in nc.variables.items():
-            datasets.append({
-                "name": name,
-                "shape": var.shape,
-                "dtype": str(var.dtype)
-            })
+        with self.handles.checkout(filepath, 'netcdf') as nc:
+            datasets = []
+            for name, var in nc.variables.items():
+                datasets.append({
+                    "name": name,
+                    "shape": var.shape,
+                    "dtype": str(var.dtype)
+                })
         
-        nc.close()
         return datasets
     
-    def _read_dataset_hdf4(self, filepath: str, dataset_name: str) -> np.ndarray:
-        """Read specific dataset from HDF4"""
-        hdf = SD(filepath, SDC.READ)
-        data = hdf.select(dataset_name).get()
-        hdf.end()
-        return data
-    
-    def _read_dataset_hdf5(self, filepath: str, dataset_name: str) -> np.ndarray:
-        """Read specific dataset from HDF5"""
-        with h5py.File(filepath, 'r') as f:
-            data = f[dataset_name][:]
-        return data
+    def _select_hdf4(self, hdf, dataset_name: str, window: Optional[TileWindow] = None) -> np.ndarray:
+        """
+        Read a dataset of an open SD handle, releasing the SDS afterwards
+        
+        With a window only that hyperslab (first two dimensions) is read.
+        """
+        sds = hdf.select(dataset_name)
+        try:
+            if window is None:
+                return sds.get()
+            dims = list(np.atleast_1d(sds.info()[2]))
+            r0, r1, c0, c1 = pixel_window(window, dims[0], dims[1])
+            return sds.get(start=[r0, c0] + [0] * (len(dims) - 2), count=[r1 - r0, c1 - c0] + dims[2:])
+        finally:
+            sds.endaccess()
+    
+    def _read_dataset_hdf4(self, filepath: str, dataset_name: str, window: Optional[TileWindow] = None) -> np.ndarray:
+        """Read specific dataset from HDF4 (optionally a tile window)"""
+        with self.handles.checkout(filepath, 'hdf4') as hdf:
+            return self._select_hdf4(hdf, dataset_name, window)
+    
+    def _read_dataset_hdf5(self, filepath: str, dataset_name: str, window: Optional[TileWindow] = None) -> np.ndarray:
+        """Read specific dataset from HDF5 (optionally a tile window)"""
+        with self.handles.checkout(filepath, 'hdf5') as f:
+            dataset = f[dataset_name]
+            if window is None:
+                return dataset[:]
+            r0, r1, c0, c1 = pixel_window(window, dataset.shape[0], dataset.shape[1])
+            return dataset[r0:r1, c0:c1]
+    
+    def _resolve_granules(
+        self,
+        keywords: list,
+        region: Optional[Region],
+        date: Optional[datetime] = None
+    ) -> List[Tuple[HDFFileInfo, Optional[TileWindow]]]:
+        """
+        Granules to read for a region, each with the window it covers
+        
+        Tiled products resolve to one granule per sinusoidal tile that
+        intersects the region (acquisition date closest to `date`, else the
+        latest). Swath products, or calls without a region, use the first
+        matching file read whole.
+        
+        Returns:
+            (entry, window) pairs, empty if no granule covers the region
+        """
+        entries = self.catalog.find(keywords)
+        tiled = [entry for entry in entries if entry.tile is not None and entry.date is not None]
+        if region is None or not tiled:
+            return [(entries[0], None)] if entries else []
+        
+        day = datetime(date.year, date.month, date.day) if date else None
+        
+        def rank(entry: HDFFileInfo):
+            acquired = datetime.strptime(entry.date, "%Y-%m-%d")
+            return (abs((acquired - day).days) if day else 0, -acquired.toordinal())
+        
+        wanted = tiles_for_bounds(region.bounds)
+        by_tile = {}
+        for entry in tiled:
+            if entry.tile in wanted:
+                by_tile.setdefault(entry.tile, []).append(entry)
+        
+        granules = [
+            (min(by_tile[tile], key=rank), tile_window(tile[0], tile[1], region.bounds))
+            for tile in wanted if tile in by_tile
+        ]
+        logger.info(f"🧩 {region.code}: {len(granules)} of {len(wanted)} tiles available")
+        return granules
+    
+    def _summarize_hdf4_tiles(self, granules: List[Tuple[HDFFileInfo, Optional[TileWindow]]], summarize: Callable) -> list:
+        """
+        Run summarize(filepath, window) on each HDF4 granule in parallel
+        
+        Granules that fail to read are skipped with a warning; raises
+        ValueError if none could be read.
+        """
+        granules = [(entry, window) for entry, window in granules if entry.format == 'hdf4']
+        if not granules:
+            raise ValueError("No HDF4 granules to read")
+        
+        futures = []
+        for entry, window in granules:
+            if window is not None:
+                logger.info(f"🔲 Reading {(window[1] - window[0]) * (window[3] - window[2]) * 100:.1f}% of {entry.filename}")
+            futures.append((entry, self._tile_pool.submit(summarize, entry.path, window)))
+        
+        results = []
+        for entry, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"⚠️  Skipping {entry.filename}: {str(e)}")
+        
+        if not results:
+            raise ValueError("No granule could be read")
+        return results
     
     async def get_fire_data(
         self, 
         region: Region, 
         date: Optional[datetime] = None
     ) -> FireDetection:
-        """Read fire detection data from HDF files"""
+        """Read fire detection data from HDF files (all tiles covering the region)"""
         
         # Find MOD14/MYD14 files
-        fire_files = self._find_files_by_product(['MOD14', 'MYD14', 'fire'])
+        fire_files = self._resolve_granules(['MOD14', 'MYD14', 'fire'], region, date)
         
         if not fire_files:
             logger.warning("⚠️  No fire detection files found, using fallback")
             return self._fallback_fire_data(region, date)
         
         try:
-            filepath = os.path.join(self.data_dir, fire_files[0])
-            logger.info(f"🔥 Reading fire data from: {fire_files[0]}")
+            logger.info(f"🔥 Reading fire data from {len(fire_files)} file(s): {fire_files[0][0].filename}")
             
-            # Detect file type
-            file_type = self._detect_file_type(filepath)
+            file_type = fire_files[0][0].format
             
             # Read datasets
             if file_type == 'hdf4' and HAS_PYHDF:
-                return await self._read_fire_hdf4(filepath)
+                parts = self._summarize_hdf4_tiles(fire_files, self._summarize_fire_hdf4)
+                fire_count = sum(count for count, _ in parts)
+                total_frp = sum(frp for _, frp in parts)
+                return FireDetection(
+                    fire_count=fire_count,
+                    total_frp=total_frp,
+                    severity=self._classify_fire_severity(fire_count, total_frp)
+                )
             elif file_type == 'hdf5' and HAS_H5PY:
-                return await self._read_fire_hdf5(filepath)
+                return await self._read_fire_hdf5(fire_files[0][0].path)
             else:
                 logger.warning(f"⚠️  Unsupported file type: {file_type}")
                 return self._fallback_fire_data(region, date)
@@ -281,24 +430,36 @@ class RealHDFRepository(HDFDataRepository):
         region: Region, 
         date: Optional[datetime] = None
     ) -> VegetationIndex:
-        """Read NDVI data from HDF files"""
+        """Read NDVI data from HDF files (all tiles covering the region)"""
         
-        ndvi_files = self._find_files_by_product(['MOD13', 'MYD13', 'ndvi'])
+        ndvi_files = self._resolve_granules(['MOD13', 'MYD13', 'ndvi'], region, date)
         
         if not ndvi_files:
             logger.warning("⚠️  No NDVI files found, using fallback")
             return self._fallback_vegetation_data(region, date)
         
         try:
-            filepath = os.path.join(self.data_dir, ndvi_files[0])
-            logger.info(f"🌱 Reading NDVI from: {ndvi_files[0]}")
+            logger.info(f"🌱 Reading NDVI from {len(ndvi_files)} file(s): {ndvi_files[0][0].filename}")
             
-            file_type = self._detect_file_type(filepath)
+            file_type = ndvi_files[0][0].format
             
             if file_type == 'hdf4' and HAS_PYHDF:
-                return await self._read_ndvi_hdf4(filepath)
+                ndvi = RasterSummary()
+                for part in self._summarize_hdf4_tiles(ndvi_files, self._summarize_ndvi_hdf4):
+                    ndvi.merge(part)
+                
+                if ndvi.count == 0:
+                    raise ValueError("No valid NDVI values")
+                
+                return VegetationIndex(
+                    mean_ndvi=ndvi.mean,
+                    min_ndvi=ndvi.minimum,
+                    max_ndvi=ndvi.maximum,
+                    degraded_percentage=ndvi.percent_below(DEGRADED_NDVI),
+                    health_status=self._classify_vegetation_health(ndvi.mean)
+                )
             elif file_type == 'hdf5' and HAS_H5PY:
-                return await self._read_ndvi_hdf5(filepath)
+                return await self._read_ndvi_hdf5(ndvi_files[0][0].path)
             else:
                 return self._fallback_vegetation_data(region, date)
                 
@@ -311,24 +472,36 @@ class RealHDFRepository(HDFDataRepository):
         region: Region, 
         date: Optional[datetime] = None
     ) -> AirQuality:
-        """Read aerosol data from HDF files"""
+        """Read aerosol data from HDF files (all tiles covering the region)"""
         
-        aerosol_files = self._find_files_by_product(['MOD04', 'MYD04', 'aerosol'])
+        aerosol_files = self._resolve_granules(['MOD04', 'MYD04', 'aerosol'], region, date)
         
         if not aerosol_files:
             logger.warning("⚠️  No aerosol files found, using fallback")
             return self._fallback_air_quality_data(region, date)
         
         try:
-            filepath = os.path.join(self.data_dir, aerosol_files[0])
-            logger.info(f"💨 Reading aerosol from: {aerosol_files[0]}")
+            logger.info(f"💨 Reading aerosol from {len(aerosol_files)} file(s): {aerosol_files[0][0].filename}")
             
-            file_type = self._detect_file_type(filepath)
+            file_type = aerosol_files[0][0].format
             
             if file_type == 'hdf4' and HAS_PYHDF:
-                return await self._read_aerosol_hdf4(filepath)
+                aod = RasterSummary()
+                for part in self._summarize_hdf4_tiles(aerosol_files, self._summarize_aerosol_hdf4):
+                    aod.merge(part)
+                
+                if aod.count == 0:
+                    raise ValueError("No valid AOD values")
+                
+                mean_aqi = (aod.mean / 2) * 100  # Simplified AQI
+                
+                return AirQuality(
+                    mean_aqi=min(mean_aqi, 500),
+                    mean_aod=aod.mean,
+                    air_quality_status=self._classify_air_quality(mean_aqi)
+                )
             elif file_type == 'hdf5' and HAS_H5PY:
-                return await self._read_aerosol_hdf5(filepath)
+                return await self._read_aerosol_hdf5(aerosol_files[0][0].path)
             else:
                 return self._fallback_air_quality_data(region, date)
                 
@@ -341,24 +514,38 @@ class RealHDFRepository(HDFDataRepository):
         region: Region, 
         date: Optional[datetime] = None
     ) -> Temperature:
-        """Read temperature data from HDF files"""
+        """Read temperature data from HDF files (all tiles covering the region)"""
         
-        temp_files = self._find_files_by_product(['MOD11', 'MYD11', 'lst', 'temperature'])
+        temp_files = self._resolve_granules(['MOD11', 'MYD11', 'lst', 'temperature'], region, date)
         
         if not temp_files:
             logger.warning("⚠️  No temperature files found, using fallback")
             return self._fallback_temperature_data(region, date)
         
         try:
-            filepath = os.path.join(self.data_dir, temp_files[0])
-            logger.info(f"🌡️  Reading temperature from: {temp_files[0]}")
+            logger.info(f"🌡️  Reading temperature from {len(temp_files)} file(s): {temp_files[0][0].filename}")
             
-            file_type = self._detect_file_type(filepath)
+            file_type = temp_files[0][0].format
             
             if file_type == 'hdf4' and HAS_PYHDF:
-                return await self._read_temperature_hdf4(filepath)
+                lst = RasterSummary()
+                for part in self._summarize_hdf4_tiles(temp_files, self._summarize_temperature_hdf4):
+                    lst.merge(part)
+                
+                if lst.count == 0:
+                    raise ValueError("No valid temperature values")
+                
+                baseline = 25.0  # Default baseline
+                
+                return Temperature(
+                    mean_temp=lst.mean,
+                    min_temp=lst.minimum,
+                    max_temp=lst.maximum,
+                    mean_anomaly=lst.mean - baseline,
+                    baseline_temp=baseline
+                )
             elif file_type == 'hdf5' and HAS_H5PY:
-                return await self._read_temperature_hdf5(filepath)
+                return await self._read_temperature_hdf5(temp_files[0][0].path)
             else:
                 return self._fallback_temperature_data(region, date)
                 
@@ -367,149 +554,111 @@ class RealHDFRepository(HDFDataRepository):
             return self._fallback_temperature_data(region, date)
     
     # ========================================================================
-    # HDF4 Readers
+    # HDF4 Readers (one granule or tile window each; run on the tile pool)
     # ========================================================================
     
-    async def _read_fire_hdf4(self, filepath: str) -> FireDetection:
-        """Read MODIS fire data from HDF4"""
-        hdf = SD(filepath, SDC.READ)
-        
-        # Try common dataset names
-        fire_mask = None
-        for name in ['FireMask', 'fire mask', 'Fire_Mask']:
+    def _summarize_fire_hdf4(self, filepath: str, window: Optional[TileWindow] = None) -> Tuple[int, float]:
+        """Fire pixel count and total FRP of a MODIS fire granule (optionally a tile window)"""
+        with self.handles.checkout(filepath, 'hdf4') as hdf:
+            # Try common dataset names
+            fire_mask = None
+            for name in ['FireMask', 'fire mask', 'Fire_Mask']:
+                try:
+                    fire_mask = self._select_hdf4(hdf, name, window)
+                    break
+                except:
+                    continue
+            
+            if fire_mask is None:
+                raise ValueError("FireMask dataset not found")
+            
+            # Try to get FRP
+            frp = None
             try:
-                fire_mask = hdf.select(name).get()
-                break
+                frp = self._select_hdf4(hdf, 'MaxFRP', window)
             except:
-                continue
-        
-        if fire_mask is None:
-            raise ValueError("FireMask dataset not found")
+                pass
         
         # Fire pixels (values 7-9 indicate fire)
         fire_pixels = fire_mask >= 7
         fire_count = int(np.sum(fire_pixels))
         
-        # Try to get FRP
         total_frp = 0.0
-        try:
-            frp = hdf.select('MaxFRP').get()
+        if frp is not None:
             valid_frp = frp[fire_pixels & (frp < 10000)]
             total_frp = float(np.sum(valid_frp))
-        except:
-            pass
         
-        hdf.end()
-        
-        severity = self._classify_fire_severity(fire_count, total_frp)
-        
-        return FireDetection(
-            fire_count=fire_count,
-            total_frp=total_frp,
-            severity=severity
-        )
+        return fire_count, total_frp
     
-    async def _read_ndvi_hdf4(self, filepath: str) -> VegetationIndex:
-        """Read MODIS NDVI from HDF4"""
-        hdf = SD(filepath, SDC.READ)
-        
-        # Read NDVI (scaled -2000 to 10000)
-        ndvi_raw = hdf.select('NDVI').get()
-        hdf.end()
-        
-        # Convert to real scale (-1 to 1)
-        ndvi = ndvi_raw.astype(float) * 0.0001
-        
-        # Filter valid values
-        valid_mask = (ndvi >= -1) & (ndvi <= 1)
-        ndvi_valid = ndvi[valid_mask]
+    def _summarize_hdf4_dataset(
+        self,
+        filepath: str,
+        dataset_name: str,
+        window: Optional[TileWindow] = None,
+        **options
+    ) -> RasterSummary:
+        """
+        Blockwise summary of an HDF4 dataset (optionally a tile window)
         
-        if len(ndvi_valid) == 0:
-            raise ValueError("No valid NDVI values")
+        Reads BLOCK_ROWS rows at a time; options are passed to
+        summarize_blocks (scale, offset, valid_range, thresholds, bin_edges).
+        """
+        with self.handles.checkout(filepath, 'hdf4') as hdf:
+            sds = hdf.select(dataset_name)
+            try:
+                dims = list(np.atleast_1d(sds.info()[2]))
+            finally:
+                sds.endaccess()
         
-        mean_ndvi = float(np.mean(ndvi_valid))
-        degraded_percentage = float(np.sum(ndvi_valid < 0.4) / len(ndvi_valid) * 100)
+        r0, r1, c0, c1 = pixel_window(window, dims[0], dims[1]) if window is not None else (0, dims[0], 0, dims[1])
         
-        return VegetationIndex(
-            mean_ndvi=mean_ndvi,
-            min_ndvi=float(np.min(ndvi_valid)),
-            max_ndvi=float(np.max(ndvi_valid)),
-            degraded_percentage=degraded_percentage,
-            health_status=self._classify_vegetation_health(mean_ndvi)
+        def read_rows(start: int, stop: int) -> np.ndarray:
+            # Checked out per block, so blocks of other tiles interleave
+            with self.handles.checkout(filepath, 'hdf4') as hdf:
+                sds = hdf.select(dataset_name)
+                try:
+                    return sds.get(
+                        start=[r0 + start, c0] + [0] * (len(dims) - 2),
+                        count=[stop - start, c1 - c0] + dims[2:]
+                    )
+                finally:
+                    sds.endaccess()
+        
+        return summarize_blocks(read_rows, r1 - r0, **options)
+    
+    def _find_hdf4_dataset(self, filepath: str, keywords: list) -> Optional[str]:
+        """First dataset whose name contains any of the keywords"""
+        with self.handles.checkout(filepath, 'hdf4') as hdf:
+            datasets = list(hdf.datasets().keys())
+        return next((name for name in datasets if any(kw in name for kw in keywords)), None)
+    
+    def _summarize_ndvi_hdf4(self, filepath: str, window: Optional[TileWindow] = None) -> RasterSummary:
+        """Summary of MODIS NDVI from HDF4 (optionally a tile window)"""
+        # NDVI is stored scaled (-2000 to 10000): valid values are -1 to 1
+        return self._summarize_hdf4_dataset(
+            filepath, 'NDVI', window,
+            scale=0.0001, valid_range=(-1, 1), thresholds=(DEGRADED_NDVI,)
         )
     
-    async def _read_aerosol_hdf4(self, filepath: str) -> AirQuality:
-        """Read MODIS aerosol from HDF4"""
-        hdf = SD(filepath, SDC.READ)
-        
-        # Find AOD dataset
-        datasets = list(hdf.datasets().keys())
-        aod = None
-        
-        for name in datasets:
-            if 'AOD' in name or 'Optical_Depth' in name:
-                aod = hdf.select(name).get()
-                break
-        
-        hdf.end()
-        
-        if aod is None:
+    def _summarize_aerosol_hdf4(self, filepath: str, window: Optional[TileWindow] = None) -> RasterSummary:
+        """Summary of MODIS aerosol optical depth from HDF4 (optionally a tile window)"""
+        name = self._find_hdf4_dataset(filepath, ['AOD', 'Optical_Depth'])
+        if name is None:
             raise ValueError("AOD dataset not found")
         
-        # Filter valid values (0 to 5)
-        valid_mask = (aod >= 0) & (aod <= 5)
-        aod_valid = aod[valid_mask]
-        
-        if len(aod_valid) == 0:
-            raise ValueError("No valid AOD values")
-        
-        mean_aod = float(np.mean(aod_valid))
-        mean_aqi = (mean_aod / 2) * 100  # Simplified AQI
-        
-        return AirQuality(
-            mean_aqi=min(mean_aqi, 500),
-            mean_aod=mean_aod,
-            air_quality_status=self._classify_air_quality(mean_aqi)
-        )
+        # Valid values: 0 to 5
+        return self._summarize_hdf4_dataset(filepath, name, window, valid_range=(0, 5))
     
-    async def _read_temperature_hdf4(self, filepath: str) -> Temperature:
-        """Read MODIS LST from HDF4"""
-        hdf = SD(filepath, SDC.READ)
-        
-        # Find LST dataset
-        datasets = list(hdf.datasets().keys())
-        lst = None
-        
-        for name in datasets:
-            if 'LST' in name or 'Temperature' in name:
-                lst = hdf.select(name).get()
-                break
-        
-        hdf.end()
-        
-        if lst is None:
+    def _summarize_temperature_hdf4(self, filepath: str, window: Optional[TileWindow] = None) -> RasterSummary:
+        """Summary of MODIS LST in Celsius from HDF4 (optionally a tile window)"""
+        name = self._find_hdf4_dataset(filepath, ['LST', 'Temperature'])
+        if name is None:
             raise ValueError("LST dataset not found")
         
-        # Convert from Kelvin to Celsius (scale 0.02)
-        lst_kelvin = lst.astype(float) * 0.02
-        lst_celsius = lst_kelvin - 273.15
-        
-        # Filter valid values
-        valid_mask = (lst_celsius >= -40) & (lst_celsius <= 60)
-        lst_valid = lst_celsius[valid_mask]
-        
-        if len(lst_valid) == 0:
-            raise ValueError("No valid temperature values")
-        
-        mean_temp = float(np.mean(lst_valid))
-        baseline = 25.0  # Default baseline
-        
-        return Temperature(
-            mean_temp=mean_temp,
-            min_temp=float(np.min(lst_valid)),
-            max_temp=float(np.max(lst_valid)),
-            mean_anomaly=mean_temp - baseline,
-            baseline_temp=baseline
+        # Kelvin with scale 0.02, converted to Celsius; valid values -40 to 60
+        return self._summarize_hdf4_dataset(
+            filepath, name, window,
+            scale=0.02, offset=-273.15, valid_range=(-40, 60)
         )
     
     # ========================================================================
@@ -539,48 +688,15 @@ class RealHDFRepository(HDFDataRepository):
     # ========================================================================
     
     def _find_files_by_product(self, keywords: list) -> list:
-        """Find files matching product keywords"""
-        if not os.path.exists(self.data_dir):
-            return []
-        
-        files = os.listdir(self.data_dir)
-        matching = []
-        
-        for f in files:
-            if any(kw.lower() in f.lower() for kw in keywords):
-                matching.append(f)
-        
-        return matching
+        """Find HDF files matching product keywords"""
+        return [entry.filename for entry in self.catalog.find(keywords)]
     
     def _detect_file_type(self, filepath: str) -> str:
-        """Detect HDF file type"""
-        try:
-            if HAS_H5PY:
-                try:
-                    with h5py.File(filepath, 'r'):
-                        return 'hdf5'
-                except:
-                    pass
-            
-            if HAS_PYHDF:
-                try:
-                    hdf = SD(filepath, SDC.READ)
-                    hdf.end()
-                    return 'hdf4'
-                except:
-                    pass
-            
-            if HAS_NETCDF:
-                try:
-                    nc = Dataset(filepath, 'r')
-                    nc.close()
-                    return 'netcdf'
-                except:
-                    pass
-        except:
-            pass
-        
-        return 'unknown'
+        """Detect HDF file type (catalogued format, else from the file signature)"""
+        entry = self.catalog.get(os.path.basename(filepath))
+        if entry is not None and entry.path == filepath:
+            return entry.format
+        return detect_format(filepath)
     
     # ========================================================================
     # Fallback Methods (when files not available)
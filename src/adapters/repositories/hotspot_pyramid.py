@@ -0,0 +1,239 @@
+"""
+🔥 Hotspot Pyramid
+Per-cell fire aggregates precomputed at a ladder of grid sizes
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import logging
+
+from src.adapters.repositories.grid_aggregation import aggregate_cells
+
+logger = logging.getLogger(__name__)
+
+# Grid sizes (degrees) precomputed at load time, coarse to fine
+HOTSPOT_CELL_SIZES = (2.0, 1.0, 0.5, 0.25, 0.1, 0.05, 0.025, 0.01)
+
+
+@dataclass
+class HotspotLevel:
+    """Aggregates of one grid size, ordered by detection count (descending)"""
+    cell_size: float
+    lat: np.ndarray  # mean latitude of each cell's detections
+    lon: np.ndarray  # mean longitude of each cell's detections
+    count: np.ndarray
+    total_frp: np.ndarray
+    avg_frp: np.ndarray
+    avg_confidence: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    def top(self, n: int) -> "HotspotLevel":
+        """The n busiest cells"""
+        return HotspotLevel(
+            self.cell_size, self.lat[:n], self.lon[:n], self.count[:n],
+            self.total_frp[:n], self.avg_frp[:n], self.avg_confidence[:n]
+        )
+
+
+@dataclass
+class CellSums:
+    """Per-cell sums of one grid size, sorted by cell key (see grid_aggregation)"""
+    cell_size: float
+    keys: np.ndarray
+    count: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    frp: np.ndarray
+    confidence: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def of(
+        cls,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        frp: np.ndarray,
+        confidence: np.ndarray,
+        cell_size: float
+    ) -> "CellSums":
+        """Sum detections into cells centred on multiples of cell_size"""
+        cells = aggregate_cells(lat, lon, cell_size)
+        return cls(
+            cell_size, cells.keys, cells.count,
+            cells.sum(lat), cells.sum(lon), cells.sum(frp), cells.sum(confidence)
+        )
+
+    def merged(self, other: "CellSums") -> "CellSums":
+        """
+        Sums of both sets of detections
+
+        Cells new to this grid are inserted at their key position, so the
+        cost is a lookup per cell of `other` plus array copies, not a regroup.
+        """
+        pos = np.searchsorted(self.keys, other.keys)
+        known = pos < len(self.keys)
+        known[known] = self.keys[pos[known]] == other.keys[known]
+
+        fresh = pos[~known]
+        keys = np.insert(self.keys, fresh, other.keys[~known])
+        at = np.searchsorted(keys, other.keys)
+
+        def add(mine: np.ndarray, theirs: np.ndarray) -> np.ndarray:
+            combined = np.insert(mine, fresh, 0)
+            combined[at] += theirs
+            return combined
+
+        return CellSums(
+            self.cell_size, keys, add(self.count, other.count),
+            add(self.lat, other.lat), add(self.lon, other.lon),
+            add(self.frp, other.frp), add(self.confidence, other.confidence)
+        )
+
+    def level(self) -> HotspotLevel:
+        """Aggregates ordered by detection count"""
+        # Busiest first; ties keep cell (lat, lon) order
+        order = np.argsort(-self.count, kind='stable')
+        count = self.count[order]
+        total_frp = self.frp[order]
+
+        return HotspotLevel(
+            cell_size=self.cell_size,
+            lat=self.lat[order] / count,
+            lon=self.lon[order] / count,
+            count=count,
+            total_frp=total_frp,
+            avg_frp=total_frp / count,
+            avg_confidence=self.confidence[order] / count
+        )
+
+
+def aggregate_level(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    frp: np.ndarray,
+    confidence: np.ndarray,
+    cell_size: float
+) -> HotspotLevel:
+    """Aggregate detections to cells centred on multiples of cell_size"""
+    return CellSums.of(lat, lon, frp, confidence, cell_size).level()
+
+
+def _hotspot_columns(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    frp: Optional[np.ndarray],
+    confidence: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Missing FRP / confidence count as 0 (temporaries, never kept)
+    n = len(lat)
+    return (
+        lat,
+        lon,
+        np.nan_to_num(frp) if frp is not None else np.zeros(n, dtype=np.float32),
+        confidence if confidence is not None else np.zeros(n, dtype=np.uint8)
+    )
+
+
+class HotspotPyramid:
+    """
+    Hotspot aggregates for a fixed ladder of grid sizes
+
+    Per-cell sums of every level of HOTSPOT_CELL_SIZES are computed once
+    when the detections load; a refresh merges the sums of its new
+    detections into them (see appended). Only those sums are kept (memory
+    grows with cells, not detections). Each level is ordered by count on
+    its first request, so hotspot requests for those sizes are lookups.
+    Other sizes are aggregated on demand from the caller's columns.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        frp: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None,
+        cell_sizes: Tuple[float, ...] = HOTSPOT_CELL_SIZES
+    ):
+        """
+        Build pyramid
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            frp: Fire Radiative Power per detection (0 when missing)
+            confidence: Confidence per detection (0 when missing)
+            cell_sizes: Grid sizes to precompute
+        """
+        columns = _hotspot_columns(lat, lon, frp, confidence)
+        self.sums: Dict[float, CellSums] = {size: CellSums.of(*columns, size) for size in cell_sizes}
+        self._levels: Dict[float, HotspotLevel] = {}
+        logger.info(f"Hotspot pyramid: {', '.join(f'{s}°={len(c)}' for s, c in self.sums.items())} cells")
+
+    @classmethod
+    def from_sums(cls, sums: Dict[float, CellSums]) -> "HotspotPyramid":
+        """Pyramid over already aggregated per-cell sums"""
+        pyramid = cls.__new__(cls)
+        pyramid.sums = sums
+        pyramid._levels = {}
+        return pyramid
+
+    def appended(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        frp: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None
+    ) -> "HotspotPyramid":
+        """
+        Pyramid with more detections, aggregating only those
+
+        Returns:
+            New pyramid (this one is left untouched)
+        """
+        columns = _hotspot_columns(lat, lon, frp, confidence)
+        sums = {
+            size: cells.merged(CellSums.of(*columns, size))
+            for size, cells in self.sums.items()
+        }
+        return HotspotPyramid.from_sums(sums)
+
+    def _find_size(self, cell_size: float) -> Optional[float]:
+        for size in self.sums:
+            if np.isclose(size, cell_size, rtol=0, atol=1e-9):
+                return size
+        return None
+
+    def level(
+        self,
+        cell_size: float,
+        lat: Optional[np.ndarray] = None,
+        lon: Optional[np.ndarray] = None,
+        frp: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None
+    ) -> HotspotLevel:
+        """
+        Aggregates for a grid size (precomputed level when available)
+
+        Args:
+            cell_size: Grid cell size in degrees
+            lat, lon, frp, confidence: Detection columns, needed only for
+                sizes outside the precomputed ladder
+
+        Returns:
+            HotspotLevel ordered by detection count
+        """
+        size = self._find_size(cell_size)
+        if size is None:
+            if lat is None or lon is None:
+                raise ValueError(f"Grid size {cell_size} is not precomputed; detection columns are required")
+            return aggregate_level(*_hotspot_columns(lat, lon, frp, confidence), cell_size)
+
+        level = self._levels.get(size)
+        if level is None:
+            level = self._levels[size] = self.sums[size].level()
+        return level
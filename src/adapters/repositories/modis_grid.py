@@ -0,0 +1,102 @@
+"""
+🧭 MODIS Sinusoidal Grid
+Tile geometry of the MODIS land grid (36 x 18 tiles of 10° at the equator)
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+
+EARTH_RADIUS = 6371007.181  # meters (MODIS sphere)
+TILE_WIDTH = 1111950.5197665  # meters per tile side
+GRID_X_MIN = -20015109.354  # west edge of tile h=0
+GRID_Y_MAX = 10007554.677  # north edge of tile v=0
+H_TILES = 36
+V_TILES = 18
+
+# Points sampled along each edge of a lat/lon box (its edges are curved in sinusoidal space)
+EDGE_SAMPLES = 33
+
+# (row_start, row_stop, col_start, col_stop) as fractions of a tile side
+TileWindow = Tuple[float, float, float, float]
+
+
+def sinusoidal(lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+    """Project degrees to sinusoidal x/y meters"""
+    lat_rad = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(lon, dtype=np.float64))
+    return EARTH_RADIUS * lon_rad * np.cos(lat_rad), EARTH_RADIUS * lat_rad
+
+
+def _box_outline(bounds: tuple) -> Tuple[np.ndarray, np.ndarray]:
+    lat_min, lon_min, lat_max, lon_max = bounds
+    lats = np.linspace(lat_min, lat_max, EDGE_SAMPLES)
+    lons = np.linspace(lon_min, lon_max, EDGE_SAMPLES)
+    lat = np.concatenate([lats, lats, np.full(EDGE_SAMPLES, lat_min), np.full(EDGE_SAMPLES, lat_max)])
+    lon = np.concatenate([np.full(EDGE_SAMPLES, lon_min), np.full(EDGE_SAMPLES, lon_max), lons, lons])
+    # x is most extreme where |lat| is smallest: include the equator if spanned
+    if lat_min < 0 < lat_max:
+        lat = np.append(lat, [0.0, 0.0])
+        lon = np.append(lon, [lon_min, lon_max])
+    return lat, lon
+
+
+def bounds_extent(bounds: tuple) -> Tuple[float, float, float, float]:
+    """Sinusoidal (x_min, x_max, y_min, y_max) enclosing a (lat_min, lon_min, lat_max, lon_max) box"""
+    x, y = sinusoidal(*_box_outline(bounds))
+    return float(x.min()), float(x.max()), float(y.min()), float(y.max())
+
+
+def tile_window(h: int, v: int, bounds: tuple) -> Optional[TileWindow]:
+    """
+    Part of tile h/v covered by a lat/lon box
+
+    Args:
+        h, v: Tile indices
+        bounds: (lat_min, lon_min, lat_max, lon_max) in degrees
+
+    Returns:
+        (row_start, row_stop, col_start, col_stop) as fractions of the tile
+        side (rows run north to south), or None if the box misses the tile
+    """
+    x_min, x_max, y_min, y_max = bounds_extent(bounds)
+    tile_x = GRID_X_MIN + h * TILE_WIDTH
+    tile_y = GRID_Y_MAX - v * TILE_WIDTH
+
+    col_start = max((x_min - tile_x) / TILE_WIDTH, 0.0)
+    col_stop = min((x_max - tile_x) / TILE_WIDTH, 1.0)
+    row_start = max((tile_y - y_max) / TILE_WIDTH, 0.0)
+    row_stop = min((tile_y - y_min) / TILE_WIDTH, 1.0)
+
+    if col_start >= col_stop or row_start >= row_stop:
+        return None
+    return row_start, row_stop, col_start, col_stop
+
+
+def pixel_window(window: TileWindow, rows: int, cols: int) -> Tuple[int, int, int, int]:
+    """
+    Pixel (row_start, row_stop, col_start, col_stop) of a fractional window
+
+    Partially covered edge pixels are included.
+    """
+    row_start, row_stop, col_start, col_stop = window
+    r0 = min(int(np.floor(row_start * rows)), rows - 1)
+    c0 = min(int(np.floor(col_start * cols)), cols - 1)
+    r1 = max(int(np.ceil(row_stop * rows)), r0 + 1)
+    c1 = max(int(np.ceil(col_stop * cols)), c0 + 1)
+    return r0, min(r1, rows), c0, min(c1, cols)
+
+
+def tiles_for_bounds(bounds: tuple) -> List[Tuple[int, int]]:
+    """
+    Tiles intersecting a lat/lon box
+
+    Args:
+        bounds: (lat_min, lon_min, lat_max, lon_max) in degrees
+
+    Returns:
+        (h, v) pairs, row-major from the north-west
+    """
+    x_min, x_max, y_min, y_max = bounds_extent(bounds)
+    h_range = range(max(int((x_min - GRID_X_MIN) // TILE_WIDTH), 0), min(int((x_max - GRID_X_MIN) // TILE_WIDTH), H_TILES - 1) + 1)
+    v_range = range(max(int((GRID_Y_MAX - y_max) // TILE_WIDTH), 0), min(int((GRID_Y_MAX - y_min) // TILE_WIDTH), V_TILES - 1) + 1)
+    return [(h, v) for v in v_range for h in h_range if tile_window(h, v, bounds) is not None]
@@ -0,0 +1,148 @@
+"""
+📍 Nearest Neighbour Index
+Great-circle radius and k-nearest-neighbour search over fire detections
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+import logging
+
+from src.adapters.repositories.spatial_index import GridSpatialIndex
+
+# KD-tree backend
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180  # great-circle km per degree
+MAX_DISTANCE_KM = np.pi * EARTH_RADIUS_KM  # antipodal distance
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized great-circle distance in km"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _unit_vectors(lat, lon) -> np.ndarray:
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+class NearestNeighbourIndex:
+    """
+    Great-circle neighbour search
+
+    Points are mapped to unit-sphere xyz and stored in a KD-tree; chord
+    length is monotonic in great-circle distance, so Euclidean neighbours
+    on the sphere are the geodesic neighbours. Without scipy the search
+    falls back to the grid spatial index plus exact haversine checks.
+    """
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, grid: Optional[GridSpatialIndex] = None):
+        """
+        Build index
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            grid: Grid index over the same rows (used when scipy is unavailable)
+        """
+        self.lat = np.asarray(lat)
+        self.lon = np.asarray(lon)
+        self.grid = grid if grid is not None else GridSpatialIndex(self.lat, self.lon)
+        self.tree = cKDTree(_unit_vectors(self.lat, self.lon)) if HAS_SCIPY and len(self.lat) > 0 else None
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def query(
+        self,
+        lat: float,
+        lon: float,
+        k: Optional[int] = 100,
+        radius_km: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Neighbours of a point ordered by distance
+
+        Args:
+            lat: Latitude of the query point
+            lon: Longitude of the query point
+            k: Maximum number of neighbours (None = all within radius_km)
+            radius_km: Great-circle search radius (None = unbounded k-NN)
+
+        Returns:
+            (row offsets, distances in km), closest first
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        if len(self.lat) == 0 or (k is None and radius_km is None) or (k is not None and k <= 0):
+            return empty
+
+        if self.tree is not None:
+            rows = self._query_tree(lat, lon, k, radius_km)
+        else:
+            rows = self._query_grid(lat, lon, k, radius_km)
+
+        distances = haversine_km(lat, lon, self.lat[rows], self.lon[rows])
+        if radius_km is not None:
+            keep = distances <= radius_km
+            rows, distances = rows[keep], distances[keep]
+
+        order = np.argsort(distances, kind='stable')
+        if k is not None:
+            order = order[:k]
+
+        return rows[order], distances[order]
+
+    def _query_tree(self, lat: float, lon: float, k: Optional[int], radius_km: Optional[float]) -> np.ndarray:
+        point = _unit_vectors([lat], [lon])[0]
+        # Slightly inflated chord so float rounding never drops a boundary point
+        chord = 2 * np.sin(min(radius_km, MAX_DISTANCE_KM) / (2 * EARTH_RADIUS_KM)) * (1 + 1e-9) if radius_km is not None else np.inf
+
+        if k is None:
+            return np.asarray(self.tree.query_ball_point(point, chord), dtype=np.int64)
+
+        k = min(k, len(self.lat))
+        _, rows = self.tree.query(point, k=k, distance_upper_bound=chord)
+        rows = np.atleast_1d(rows)
+        return rows[rows < len(self.lat)].astype(np.int64)
+
+    def _query_grid(self, lat: float, lon: float, k: Optional[int], radius_km: Optional[float]) -> np.ndarray:
+        if radius_km is not None:
+            return self._grid_candidates(lat, lon, radius_km)
+
+        # Unbounded k-NN: widen the search until it holds k points; any point
+        # closer than the k-th candidate is then guaranteed to be inside it
+        search_km = self.grid.cell_size * KM_PER_DEGREE
+        while True:
+            rows = self._grid_candidates(lat, lon, search_km)
+            distances = haversine_km(lat, lon, self.lat[rows], self.lon[rows])
+            inside = np.count_nonzero(distances <= search_km)
+            if inside >= min(k, len(self.lat)) or search_km >= MAX_DISTANCE_KM:
+                return rows[distances <= search_km]
+            search_km = min(search_km * 2, MAX_DISTANCE_KM)
+
+    def _grid_candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        lat_span = radius_km / KM_PER_DEGREE
+        min_lat, max_lat = lat - lat_span, lat + lat_span
+
+        if min_lat <= -90 or max_lat >= 90:
+            lon_span = 180.0
+        else:
+            lon_span = lat_span / np.cos(np.radians(max(abs(min_lat), abs(max_lat))))
+
+        if lon_span >= 180:
+            return self.grid.query_bbox(max(min_lat, -90), -180.0, min(max_lat, 90), 180.0).astype(np.int64)
+
+        min_lon = (lon - lon_span + 180) % 360 - 180
+        max_lon = (lon + lon_span + 180) % 360 - 180
+        return self.grid.query_bbox(min_lat, min_lon, max_lat, max_lon).astype(np.int64)
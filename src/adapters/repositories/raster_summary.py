@@ -0,0 +1,141 @@
+"""
+📊 Raster Summary
+Mergeable statistics of a raster layer (count, sum, min, max, threshold counts)
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+
+# Rows per block read by summarize_blocks (256 rows of a 4800-pixel 250 m tile ~ 5 MB of float32)
+BLOCK_ROWS = 256
+
+
+@dataclass
+class RasterSummary:
+    """
+    Statistics of the valid values of a layer
+
+    Summaries of disjoint parts (tiles, row blocks) merge into the summary
+    of the whole, so a region spanning several granules is reduced without
+    mosaicking the arrays.
+    """
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    below: Dict[float, int] = field(default_factory=dict)  # threshold -> values below it
+    bin_edges: Optional[Tuple[float, ...]] = None
+    histogram: Optional[np.ndarray] = None  # counts per bin of bin_edges
+
+    @classmethod
+    def of(
+        cls,
+        values: np.ndarray,
+        thresholds: Iterable[float] = (),
+        bin_edges: Optional[Sequence[float]] = None
+    ) -> "RasterSummary":
+        """Summary of an array of valid values"""
+        summary = cls(below={t: int(np.count_nonzero(values < t)) for t in thresholds})
+        if bin_edges is not None:
+            summary.bin_edges = tuple(bin_edges)
+            summary.histogram = np.histogram(values, bins=summary.bin_edges)[0]
+        if values.size:
+            summary.count = int(values.size)
+            summary.total = float(np.sum(values, dtype=np.float64))
+            summary.minimum = float(np.min(values))
+            summary.maximum = float(np.max(values))
+        return summary
+
+    def merge(self, other: "RasterSummary") -> "RasterSummary":
+        """Add another part's statistics (in place)"""
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for threshold, n in other.below.items():
+            self.below[threshold] = self.below.get(threshold, 0) + n
+        if other.histogram is not None:
+            if self.histogram is None:
+                self.bin_edges, self.histogram = other.bin_edges, other.histogram.copy()
+            else:
+                self.histogram += other.histogram
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def percent_below(self, threshold: float) -> float:
+        """Share of values below a tracked threshold (0-100)"""
+        return self.below[threshold] / self.count * 100 if self.count else 0.0
+
+
+def summarize_blocks(
+    read_rows: Callable[[int, int], np.ndarray],
+    rows: int,
+    scale: float = 1.0,
+    offset: float = 0.0,
+    valid_range: Tuple[float, float] = (-math.inf, math.inf),
+    thresholds: Iterable[float] = (),
+    bin_edges: Optional[Sequence[float]] = None,
+    block_rows: int = BLOCK_ROWS
+) -> RasterSummary:
+    """
+    Summarize a scaled layer one block of rows at a time
+
+    Each block is converted into reused float32 scratch buffers
+    (raw * scale + offset) and masked to `valid_range` in place, so peak
+    memory is a few blocks rather than several copies of the whole layer.
+
+    Args:
+        read_rows: Reads rows [start, stop) of the layer in its stored dtype
+        rows: Number of rows of the layer
+        scale, offset: Conversion of stored values to physical units
+        valid_range: Inclusive (min, max) of valid converted values
+        thresholds: Values to count converted values below
+        bin_edges: Histogram bin edges (no histogram if None)
+        block_rows: Rows per block
+
+    Returns:
+        Summary of the valid converted values
+    """
+    thresholds = tuple(thresholds)
+    summary = RasterSummary(below={t: 0 for t in thresholds})
+    scratch = valid = inside = None
+
+    # Dividing by an integral reciprocal (e.g. 10000 for 0.0001) rounds
+    # correctly, so stored values on a threshold stay on it in float32
+    divisor = 1 / scale if scale else 0
+    exact = divisor == round(divisor) != 0
+
+    for start in range(0, rows, block_rows):
+        raw = read_rows(start, min(start + block_rows, rows))
+        if scratch is None or scratch.shape[1:] != raw.shape[1:]:
+            scratch = np.empty((block_rows,) + raw.shape[1:], dtype=np.float32)
+            valid = np.empty(scratch.shape, dtype=bool)
+            inside = np.empty(scratch.shape, dtype=bool)
+
+        n = len(raw)
+        values, ok = scratch[:n], valid[:n]
+        if exact:
+            np.divide(raw, np.float32(divisor), out=values, dtype=np.float32)
+        else:
+            np.multiply(raw, np.float32(scale), out=values, dtype=np.float32)
+        if offset:
+            np.add(values, np.float32(offset), out=values)
+        np.greater_equal(values, valid_range[0], out=ok)
+        np.less_equal(values, valid_range[1], out=inside[:n])
+        np.logical_and(ok, inside[:n], out=ok)
+
+        part = RasterSummary.of(values[ok], thresholds, bin_edges)
+        if part.count and scale > 0:
+            # Extremes from the stored values, converted in float64
+            kept = raw[ok]
+            part.minimum = float(kept.min()) * scale + offset
+            part.maximum = float(kept.max()) * scale + offset
+        summary.merge(part)
+
+    return summary
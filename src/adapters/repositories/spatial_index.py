@@ -0,0 +1,136 @@
+"""
+🧭 Grid Spatial Index
+Uniform lat/lon bucket index for bounding-box lookups
+"""
+
+import copy
+import numpy as np
+from typing import Optional
+
+
+class GridSpatialIndex:
+    """
+    Fixed-degree grid of row offsets
+
+    Cells are numbered row-major (`lat_cell * n_lon + lon_cell`) and
+    `order` lists row offsets grouped by cell, so a run of neighbouring
+    longitude cells is one contiguous range of `order`. A bounding box
+    query touches one range per latitude band of cells and then checks
+    only those candidates exactly.
+    """
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, cell_size: float = 0.25):
+        """
+        Build index
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            cell_size: Grid cell size in degrees (default: 0.25)
+        """
+        self.cell_size = cell_size
+        self.n_lat = int(np.ceil(180 / cell_size))
+        self.n_lon = int(np.ceil(360 / cell_size))
+        self.lat = np.asarray(lat)
+        self.lon = np.asarray(lon)
+
+        cells = self._cell_ids(self.lat, self.lon)
+        self.order = np.argsort(cells, kind='stable').astype(np.int32)
+
+        counts = np.bincount(cells, minlength=self.n_lat * self.n_lon)
+        self.cell_starts = np.zeros(len(counts) + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.cell_starts[1:])
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def inserted(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        new_rows: np.ndarray,
+        old_rows: Optional[np.ndarray] = None
+    ) -> "GridSpatialIndex":
+        """
+        Index after rows were added, bucketing only the added rows
+
+        Args:
+            lat: Latitudes of all rows after the insertion
+            lon: Longitudes of all rows after the insertion
+            new_rows: Offsets of the added rows
+            old_rows: New offset of each previously indexed row (None = unchanged)
+
+        Returns:
+            New index (this one is left untouched)
+        """
+        index = copy.copy(self)
+        index.lat = np.asarray(lat)
+        index.lon = np.asarray(lon)
+
+        new_rows = np.asarray(new_rows, dtype=np.int32)
+        cells = self._cell_ids(index.lat[new_rows], index.lon[new_rows])
+        by_cell = np.argsort(cells, kind='stable')
+
+        # Each added row goes to the end of its cell's run of `order`
+        order = self.order if old_rows is None else np.asarray(old_rows, dtype=np.int32)[self.order]
+        index.order = np.insert(order, self.cell_starts[cells[by_cell] + 1], new_rows[by_cell])
+
+        counts = np.bincount(cells, minlength=len(self.cell_starts) - 1)
+        index.cell_starts = self.cell_starts.copy()
+        index.cell_starts[1:] += np.cumsum(counts).astype(np.int32)
+        return index
+
+    def _lat_cell(self, lat):
+        return np.clip(np.floor((np.asarray(lat, dtype=np.float64) + 90) / self.cell_size), 0, self.n_lat - 1).astype(np.int64)
+
+    def _lon_cell(self, lon):
+        return np.clip(np.floor((np.asarray(lon, dtype=np.float64) + 180) / self.cell_size), 0, self.n_lon - 1).astype(np.int64)
+
+    def _cell_ids(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        return self._lat_cell(lat) * self.n_lon + self._lon_cell(lon)
+
+    def query_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        rows: Optional[slice] = None
+    ) -> np.ndarray:
+        """
+        Rows inside a bounding box (inclusive)
+
+        Args:
+            min_lat, min_lon, max_lat, max_lon: Bounding box in degrees
+                (min_lon > max_lon wraps across the antimeridian)
+            rows: Optional row range to restrict the result to
+
+        Returns:
+            Sorted array of row offsets
+        """
+        if min_lon > max_lon:
+            return np.union1d(
+                self.query_bbox(min_lat, min_lon, max_lat, 180.0, rows),
+                self.query_bbox(min_lat, -180.0, max_lat, max_lon, rows)
+            )
+
+        if min_lat > max_lat or len(self.order) == 0:
+            return np.empty(0, dtype=np.int32)
+
+        lat0, lat1 = int(self._lat_cell(min_lat)), int(self._lat_cell(max_lat))
+        lon0, lon1 = int(self._lon_cell(min_lon)), int(self._lon_cell(max_lon))
+
+        bands = np.arange(lat0, lat1 + 1) * self.n_lon
+        starts = self.cell_starts[bands + lon0]
+        ends = self.cell_starts[bands + lon1 + 1]
+
+        candidates = np.concatenate([self.order[s:e] for s, e in zip(starts, ends) if e > s] or [np.empty(0, dtype=np.int32)])
+
+        if rows is not None:
+            candidates = candidates[(candidates >= rows.start) & (candidates < rows.stop)]
+
+        lat = self.lat[candidates]
+        lon = self.lon[candidates]
+        inside = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+
+        return np.sort(candidates[inside])